@@ -7,12 +7,14 @@ class AgentV1:
     def __init__(self, size=(4,4)):
         self.size = size
 
-    def new_epsiode(self):
+    def new_episode(self):
         self.pos = (0,0)
         self.orientation = Orientation.NORTH
         self.has_gold = False
 
-    def get_action(self, percept):
+    new_epsiode = new_episode
+
+    def get_action(self, percept, reward=None):
         if percept[Percepts.GLITTER]:
             self.has_gold = True
             return Actions.GRAB
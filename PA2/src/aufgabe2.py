@@ -125,42 +125,48 @@ class Agent:
 '''
 
 
-import heapq
-
+from belief import DX, DY, BeliefState, plan_path, turn_actions
 from wumpus import Actions, Orientation, Percepts
 
 
 class Agent:
-
-    def __init__(self, size=(4, 4)):
+    """
+    Logic agent on top of a `belief.BeliefState`: explores cells proven to
+    be safe, shoots the wumpus once its cell is known, takes a calculated
+    risk when nothing safe is left and climbs out with the gold.
+    """
+    __slots__ = ("size", "max_risk", "belief", "pos", "orientation", "has_gold", "arrow_used", "plan", "last_action")
+
+    def __init__(self, size=(4, 4), p_pit=0.2, max_risk=0.2):
+        """
+        max_risk ... largest death probability of a cell the agent still
+            enters when no safe cell is left to explore
+        """
         self.size = size
-        self.knowledge_base = {}
-        self.possible_pit_locations = set()
-        self.possible_wumpus_locations = set()
-        self.arrow_used = False
-        self.visited = set()
-        self.run = False
-        self.has_gold = False
-        self.orientation = Orientation.NORTH
-        self.pos = (0, 0)
+        self.max_risk = max_risk
+        self.belief = BeliefState(size, p_pit)
+        self.new_episode()
 
     def new_episode(self):
         self.pos = (0, 0)
         self.orientation = Orientation.NORTH
         self.has_gold = False
-        self.run = False
         self.arrow_used = False
-        self.visited = set()
-        self.knowledge_base = {
-            (0, 0): "safe",
-        }
-        self.visited.add(self.pos)
+        self.plan = []
+        self.last_action = None
+        self.belief.reset()
+
+    @property
+    def visited(self):
+        return {self.belief.pos(c) for c in range(self.belief.n_cells) if self.belief.visited >> c & 1}
 
     def turn_left(self):
         self.orientation = (self.orientation - 1) % 4
+        return Actions.LEFT
 
     def turn_right(self):
         self.orientation = (self.orientation + 1) % 4
+        return Actions.RIGHT
 
     def move_forward(self):
         dx = 1 * (self.orientation == Orientation.EAST) + (-1) * (self.orientation == Orientation.WEST)
@@ -169,154 +175,124 @@ class Agent:
 
         if 0 <= new_pos[0] < self.size[0] and 0 <= new_pos[1] < self.size[1]:
             self.pos = new_pos
-            self.visited.add(self.pos)
         return Actions.FORWARD
 
-    def update_knowledge_base(self, percept):
-        if percept[Percepts.BREEZE]:
-            self.knowledge_base[self.pos] = "breezy"
-            self.add_possible_pit_locations()
-        elif percept[Percepts.STENCH]:
-            self.knowledge_base[self.pos] = "stenchy"
-            self.add_possible_wumpus_locations()
-        elif percept[Percepts.GLITTER]:
-            self.knowledge_base[self.pos] = "glitter"
-        else:
-            self.knowledge_base[self.pos] = "safe"
-
-    def add_possible_pit_locations(self):
-        neighbors = self.get_neighbors(self.pos)
-        for neighbor in neighbors:
-            if neighbor not in self.visited and neighbor not in self.knowledge_base:
-                self.possible_pit_locations.add(neighbor)
+    def use_arrow(self):
+        self.arrow_used = True
+        return Actions.SHOOT
+
+    def act(self, action):
+        """
+        Update the own position for `action` and return it
+        """
+        if action == Actions.LEFT:
+            self.turn_left()
+        elif action == Actions.RIGHT:
+            self.turn_right()
+        elif action == Actions.FORWARD:
+            self.move_forward()
+        elif action == Actions.SHOOT:
+            self.use_arrow()
+        self.last_action = action
+        return action
 
-    def add_possible_wumpus_locations(self):
-        neighbors = self.get_neighbors(self.pos)
-        for neighbor in neighbors:
-            if neighbor not in self.visited and neighbor not in self.knowledge_base:
-                self.possible_wumpus_locations.add(neighbor)
+    def update_knowledge_base(self, percept):
+        self.belief.observe(self.pos, percept)
+        if self.last_action == Actions.SHOOT and not percept[Percepts.SCREAM]:
+            self.belief.observe_miss(self.pos, self.orientation)
 
     def infer_safe_squares(self):
-        keys = list(self.knowledge_base.keys())
-        for (x, y) in keys:
-            status = self.knowledge_base[(x, y)]
-            if status == "breezy":
-                neighbors = self.get_neighbors((x, y))
-                for nx, ny in neighbors:
-                    if (nx, ny) not in self.knowledge_base:
-                        self.knowledge_base[(nx, ny)] = "unknown"
-            elif status == "safe":
-                neighbors = self.get_neighbors((x, y))
-                for nx, ny in neighbors:
-                    if (nx, ny) not in self.knowledge_base:
-                        self.knowledge_base[(nx, ny)] = "safe"
+        """
+        Set of cells proven to have neither a pit nor a living wumpus
+        """
+        safe = self.belief.safe()
+        return {self.belief.pos(c) for c in range(self.belief.n_cells) if safe >> c & 1}
 
     def get_neighbors(self, pos):
         x, y = pos
-        return [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-
-    def use_arrow_logically(self):
-        if not self.arrow_used and self.possible_wumpus_locations:
-            self.arrow_used = True
-            # Shoot in the direction of a suspected Wumpus location
-            return Actions.SHOOT
-        return None
+        candidates = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+        return [(nx, ny) for nx, ny in candidates if 0 <= nx < self.size[0] and 0 <= ny < self.size[1]]
 
     def find_safe_path(self, target):
-        # Implement a pathfinding algorithm like A*
-        pass
-
-    def get_action(self, percept, reward):
+        """
+        Shortest list of actions leading to `target` (a cell or a bitset of
+        cells) through safe cells, None if there is no such path
+        """
+        goals = target if isinstance(target, int) else 1 << self.belief.cell(target)
+        result = plan_path(self.size, self.pos, self.orientation, goals, self.belief.safe() | goals)
+        return None if result is None else result[0]
+
+    def _shooting_plan(self):
+        """
+        Walk to a safe cell in line with the located wumpus, face it, shoot
+        """
+        belief = self.belief
+        if self.arrow_used or belief.wumpus_candidates.bit_count() != 1:
+            return None
+        wx, wy = belief.pos(belief.wumpus_candidates.bit_length() - 1)
+        goals = 0
+        for x, y in [(x, wy) for x in range(self.size[0])] + [(wx, y) for y in range(self.size[1])]:
+            goals |= 1 << belief.cell((x, y))
+        goals &= belief.safe()
+        result = plan_path(self.size, self.pos, self.orientation, goals, belief.safe())
+        if result is None:
+            return None
+        actions, orientation = result
+
+        (x, y), o = self.pos, self.orientation
+        for action in actions:
+            if action == Actions.FORWARD:
+                x, y = x + DX[o], y + DY[o]
+            else:
+                o = (o + (action == Actions.RIGHT) - (action == Actions.LEFT)) % 4
+        if wx == x:
+            direction = Orientation.NORTH if wy > y else Orientation.SOUTH
+        else:
+            direction = Orientation.EAST if wx > x else Orientation.WEST
+        return actions + turn_actions(orientation, direction) + [Actions.SHOOT]
+
+    def _risky_plan(self):
+        """
+        Step into the least dangerous unvisited cell next to a safe one
+        """
+        belief = self.belief
+        safe = belief.safe()
+        frontier = 0
+        for c in range(belief.n_cells):
+            if safe >> c & 1:
+                frontier |= belief.neighbors[c]
+        frontier &= ~safe
+        if not frontier:
+            return None
+
+        risk = belief.death_probabilities()
+        cell = min((c for c in range(belief.n_cells) if frontier >> c & 1), key=lambda c: risk[c])
+        if risk[cell] > self.max_risk:
+            return None
+        return self.find_safe_path(1 << cell)
+
+    def _go_home(self):
+        if self.pos == (0, 0):
+            return [Actions.CLIMB]
+        return self.find_safe_path((0, 0))
+
+    def get_action(self, percept, reward=None):
         self.update_knowledge_base(percept)
-        self.infer_safe_squares()
 
-        if percept[Percepts.GLITTER]:
+        if percept[Percepts.GLITTER] and not self.has_gold:
             self.has_gold = True
-            return Actions.GRAB
+            self.plan = []
+            return self.act(Actions.GRAB)
 
-        if (not self.run) and (percept[Percepts.BREEZE] or percept[Percepts.STENCH] or percept[Percepts.BUMP]):
-            self.run = True
-            self.turn_left()
-            return Actions.LEFT
-
-        if self.run:
-            if self.orientation != Orientation.SOUTH:
-                self.turn_left()
-                return Actions.LEFT
-            if self.pos == (0, 0):
-                return Actions.CLIMB
-        else:
+        if not self.plan:
             if self.has_gold:
-                if self.pos == (0, 0):
-                    return Actions.CLIMB
-                if self.orientation != Orientation.SOUTH:
-                    self.turn_left()
-                    return Actions.LEFT
-
-            for (x, y), status in self.knowledge_base.items():
-                if status == "safe" and (x, y) not in self.visited:
-                    return self.move_forward()
-
-            if self.possible_wumpus_locations and not self.arrow_used:
-                return self.use_arrow_logically()
-
-        return self.move_forward()
-
-
-
-
-
-
-
-
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-           
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-           
-
-
-
-
-
+                self.plan = self._go_home()
+            else:
+                unexplored = self.belief.safe() & ~self.belief.visited
+                self.plan = (
+                    (unexplored and self.find_safe_path(unexplored))
+                    or self._shooting_plan()
+                    or self._risky_plan()
+                    or self._go_home()
+                )
+        return self.act(self.plan.pop(0))
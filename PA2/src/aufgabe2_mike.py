@@ -1,12 +1,38 @@
+import functools
+import json
+import time
+
 import numpy as np
 from wumpus import Actions, Orientation, Percepts, Wumpus
 
 NUM_PERCEPTIONS = 5
 
 AGENT_WEIGHTS: str = "" # example: "0.1111, -1.4, 0.53, ..."
+AGENT_CHECKPOINT: str | None = None # path of a `NeuralNetwork.save` file, preferred over AGENT_WEIGHTS
 AGENT_WEIGHTS = "[(58, 128), (128, 128), (128, 6)];float16;PigJNPKxhrRSPcOtCbP7K9Q4fjjUsvIwNioMsNIokLRTtEguAyUyrhOwvq4nIYYqZLfLrOszBzBPLtY0uzLkMHo0MzIetCiwkq4TJ1gylaPMtI+1ILUMtCEzkjFINeOwqylMMKiuZ69Ir3etejUgq/Kx6qWwtOGoebByHYc3ZrF6r4mwnjITtmstWzZ/MBwxM69YOqG08zPrMrKqiLZ2sEizrayeNGS3NbEwNQk6frHvrr+wiaobJg+2Z6F3rWS3yLXENc2qQrGlr0w04LCWKXW4I7HUsg4dPKBIsGCvtSXyLCI0MypeNm6xLBQxMGs4qpaKJcosTzxttl8tRzIitKulNTHlLIknvSz3NvA4aq9esJexvao6LIavZS6GJuctY7Kjrw6mjzHWMMMv7ap3OcIiCirDpdkv7rNis2+rYrKOueq16bYXsjsuGzJsqEQzNDNvIpG4tCuSs323F7ZeICY8IDHSMQo0BSoXumozebNPNscrOzNusuQsCSvAL4QZtbmMNbCoUCmdstWpp7BpuFGhPioVM0cx7S1Ktvw1zrb0Mz80NS+OFZG0XTHaudg2ua+0KUstCqoDu4gyOamWMBIkQ70FKgMvFDTjMpQwDi+PMp0vTCUtJJSwhjh8Oai5dK4IMGEnCzVOM8c0ZChNqWqp4iJIq544iitCqsy1MqE2LhIt7yIsNaG7jDuTLlKpDrhDuO43VLcsLAY1HC1iNW48zbJ3sgAxPS73MSywBK0RNnEpVakvsg4r9rxFspCvorQxsMQ5bq4+MpIrqrDZKiM0SSnBOXQwILTGsES1cLBEswa9/bPJIB2i4DI9tJKuLqelL104fTGsqfyoFLzBMqI0FaKBs942764hrPmtkzU+MAG0MDQsLbCy4TGbMI80QbQItDaz2y32Mfy0gLRYMoAomywYLWCowi4sr/8wnTJ0L+0pxq6vKHqcIa/5rTiwGC3zMhmsNyjarY6tObO6pA4s0ijAs9O8uTHeseGw0rVPLDKoJjCBt3woFiugsDIwXDKYLuwxSTViLoq8sbcxM5Owc7Bgrcq0kiStLPi22a8JsZCz3SRbLTItRCh8KdC9ZjAvtJK0EC9FsWE8Diyqsfw6iTEtLX2xXTJRIjGvmK7BoEk0KjHPJTgxSTklNDMsKrjyreyyny5xuCI5n7UKOGaxRLLmuxw33DAIswkpwCHDNXMtkiWLNeOyWq1srmc2ciwCvFa0DC94rR0wBbhXM/GuLbRBMEY9XThGtL41qrjdN9QyeSBoJE48madtrtk0Sq8BOPgizi2bs9Kpi65EqGqmEDdNsjCpfCXNsyW2KzosM5UtnrJZKZS5PrMZqjC1oa+YGM40d7r1LQ8pYDTGMIguaTBFsBIyrqdztVW096lStAW2C7ArO/srNKygtKivc6zKMBU7FLUVL4i1WzGBLfepG61gMkY2SiTMsPCrazJCNSylgjRLLlq4fLF6LWYy6rSpNKou3Cz0pYUtN7Q6M6WzvTNxLyEwEzj4LIS4KKcLKrU2gzA8MpkZGSrLsu4yMiyDL1c0pbNRMAIz4jTKsZM6hK08tCguHakUOvo7LLG7NW4xt7Q1pxY0aC1LpaCsfbSIMjSkdTLGMzwv+KwOsdKypS57siujrzMbMDy07yxfLc0uZ6xStFAxTbGgMrEsPzVXqKOwKZ+ON6axoysvtPeyzbFcvAqxgDEfr0M5xbB0sCCtNrQxOo2qsCacp7s8Pbh5L584jzLsQJMwvCuIPG61Qq0jNhK1tjzfO+EsvqAxM8e5ArQALy2xvqWuQHQ10axkvra1ezE4M5Y7+7CKnhM2LTSNsM0vhDYqsrQ0z7lYsZM1Tb5qvRIzvLF2tWAuU7ZnsZU0szaWtn25yS4tql4x4SX3Mj4zkTHSMhCx8TH7o3cxSzx8rkmkqypRsMKyCb8+uM2yx7IpNnkyBCsfM82wtiyWNgu4UCXmQFQy+zXtrSqmD7ipPQC9C6nstCOwGzMzQH3AVzNFtRm0569jHe028ioNv1U0lCkNquTA3BoerhEoFTCtscuu4zWlpHs3oCyNqT0ylrQysDK0gS+BOP2vPygfMImwOTWzpqY4bTPDJfQy9y9vtZu5mzBern8o5TBHMtUpeK/+M/8tZyy9p96vzak1MPgkay6nMWWuz6xGNRw0TjBft+kuiKbPKdg0Eq3SNHyz8birNuIo3bTfLVM3+7B/Jfu2gJVjMvAlDZsKMMm2PbStMpsg/jFvL5G0N6c2MzOwdKqeJyCf6TQ+M9e12DaXNmG1rbf1pISkcq1cOGmqbrQhqUI0mCwrNO8xhClmJeWvLbUeJ9uzXTQdMEGwJC3vI+exqjQZNeuwnrbvtSUxRzZYl+w4oDSbs4WyjpVes8WyTzIuKvYqTiwdsRuxl6zPPBI95zivs3GzvzwnOTGQqby0KUg1D7moJ2k6hbc/rhi0i7y4Mmk75zRcqgoysj+9PdI03bVWszU79yzvNsm80bq/NMy7IbWLvDG8Zjipoko0vThavPO72bkIK0U8FrR+v1689DbvvIW1lrlMtmA5STtyNCgu6LZ3MgA8azm2MBY9/LfhMH23yDxzvc4yNK5UPOywhDo9NDAvgTgSPOA6VLYhLMy+A7mLqS67H7qeNiWWwjpQLDo+0jqfu0y1qyZNsrI0LLsos4KyprAqsM862Tg4Oa60bLL9I440BrxttQE9MDbFsVQ6d8FpOV062qf8sG0inTJZOdGvVzejIji6hjCsmRAxvCyorMcuHi1rqr2tzCsMrZ8gkKq1JagroDCfrAQpmK0cpUmaFKykrnYoDijULH6mKaxQJW06fyQWMPIuOTvBqqK1IjO7nbcZLq0DsNAw86oBJzWw/qEwLS2sTKp4JKQhRav6oLIkSBtMsMgnNKv3sd8p4i29LAgtXyivnvGmnztRrwco6qs3FUgrfKZiulyuWi16INItHjRmHPqwTyYxrhCydC6HJh+v3ipTJQcgz6HIKAAnEao1OXYv86wspD+kkLcsLAkxhR8/LcA09aYHqoCZxannmjKwQbl6kD6eiaLjKWYu8oKFKBmRCyq+MhMyfC3bLYmjtK4OsVs2aDisKImwHDXkNhuxhLGBrccwCDkHMvembDRHMkAfFTN5tca4ODVgs9UxgzSLNEowJzcAsIcsmTFks9m3u69kLn8tIK4RNOO0jLTLpO0uwy8jL4ssmS8iMmwzBCHPMQayh7cKr463Qan1KJgxLLvbLxK1D7V+NmWsoabcp164MDIeOCUt8ia+MxutFbnRMlMv87AKOiy2eLVtLwqx2qluuIm4Y7M+tfiqq7U1rfKwcLgROKaxuqoJNYK22DRmt+A2SrC5svG3ALBWMYSwCTlPuA+y4jZeq02nx61VupC0kyVRs2AwXCv1ufWxdrhuuGI4VDGrODkpKzY3Lt0v0qbULGE0PLO2KausbDKcNFcuVrEVMG2yFZNVLkG1C6x7rBmzoq2OrzKsqbSvpusxyLFsNPqvqjkLNE8rGCYMr2+x5K0zKnIq0S6TLXEpdrIDvSu0ejZ8p5KuC7EIvRonwrAYN18uJbsssX83DakTtTEt0pwXNDezJa3WrGQkcq/IttazIC4fKBOuDDLXLKK0hjBQMhCnhzTnL5O0Gq1psz6vHavstCWxILEiFaGzRbQhL1WtnjRRLO4t5a74tgypNSOKrgm5eqeRKiy4WjMvptArPLH5PfcvxbSsr4MffC6LsfG1azDBssmoYCkAswiiwrHJLs4umCh4tq+y9Ln5NKe3VTxPOwe2xzAKOBI83Ks4uIQ2j7C6Lzk4+S4FOYy5l7tgtqW1HzlVPc+0trS7OF42Lbp1NIGzhKvMumEwLq+wuCuzvDYfOAc0C7rhNGM1MDrdsok57ruQK2e6mjjBsjEwTTR+OXM4njMJGhm1zLkmMVk2ELaDqYcpM7j7OP0t8qFyOe05ri8XMA42JjUCOC64pTVTuKY3RrUBs4I0z7ZKM1431jhiOPK7qKQtpP+sDTslsgo56zA9O1Y4PzbdNGimHTUgOEouWa1mtie3lydyPEC8EC6MI1miujW/Ndc2vrrPq840ITCsuJS7orgHte4rwjsCsBo2UTb5N3U67i6PKLqu1rNsqs00sbFMMFigZyAJmMgyTrIEtB44Gbbmqhewz6+RsH+yGCiBpa2fFIx8ttesfjcGuKAwuBh/pkwvl7EgsFklpq81NTIqHzKSr7S7Oa4hL3esIrPEKi28r64RJGG98y+et/esAjfdFT8xNSgEn98qdbKhrOymMigIMACxELF9sqonGS7QIJ2oRq02KgMuOSUerZEwPLXeKESpZ7ECMcAgU7ZBqGekrrBLMGsuYSiyrEyuO6ygt1myzbANrW2uOLc6NW2wqy2GLzUx1rBusJM70LGUNB0shyyirX8vMjmwsoKvli6ErVaojahyM7IrQS3wKDqzGbWsL26027CDqNs0XbGUKGu0CDUxOBIu6r1yMt49sTVnsFs4Z7StLicfKbNdMyc4/raotN6xeLcPrOwx1SPHtUE+4Lg+K2y1TiyOMA0wKjgevDYuYSN3NYqxHTHaMTYsZS2XNcywdDeivtyzrzVHLzW0ujPotHYz1zG2qIAwHr1vtDC1m7PSthg15LL6MMKrDjbPKxQyRTWUMtqwATO4sLY1rbyDsmQwpTVhtS0wk7Lbsqew4LZerG02/rhSoWc6Nbg8KnmqtjVCuH00pLW9N7q7ejD4uwc5eLmctfyrLrOhsg0xSTUwtUk9pTeiNC+zHjmHLSamkjAYtj6rUbEULx41YiyJJfkkITNzNEQuJTIErCWxCTPHMwApVSwFsxgrRriNN+expLEkLOwqBrEksl2z7y9uKyM4oan0OEu6eyTosJ6zsLCFM00weawutEC1EDWIrFYpFrlTK3yx5CiuKpUvJrmEMVSyirjup1y4Ui4GowUePiqQNJSqpLUhs8wgaLB9MZ+xGTYXrZM4IK9uLWC0Wym2rGyoKrYBJn0snC+Sr/ot1TTlMsSrHSWZMakltCfvo/YwvLMhsNgsCCl9tS446jRtKw2rCixlNd2zHSlUKzm1wak3NESfKDioISW0+zLZtHChEak7snyXLbc7NNeuEbISr5IxFTJwKrujFj+ppQA4MK6Jqt0tv7IsrGcx2LEZOCMu5K/vuagyUzj0J2C0CzRLrX0svK4ctFq1d61XN7GxnbOjOrEyOzu9nEUx4zhDs1YtfTLTpTwsV6u5tJq227F9tZozLKeRKFcsITXDMH00BbUmMCkxnq99N12sVTNoNTqzI64ks7OuyCQ0L1Clo62TMUu0TjSys5UsRTOvudmrk6iPMGW0lKplMA6qhzBGsNqzPLYCMfqrqDFONDaw1Z6dspoyWzCUOI+oMDafOP2wGi0XpD49FyxotWOtf7HQLyK3oDWENL61Gj2hMEK0vjbCLRMq/jBZNPAyfLd+uiw0ALFuMH6yJp2RLD453i0SLO4zNKCysAqiJTB5r7mvWCqJLEOoFrR0JYmsMLAStoW4HjBVMhisYiibKBivzSzlrpwwZLG6q406qKZnsDEoxTDtqbYtWaeOqsEokjB9Kuup4rYXJNss4Sq9rw+pdbMHLsks8bGPKL80KaFqsc43Hatjt2qwbjJTMSUxY7BFLKekzC6KsgK4FbV1rAYn5jJRL9SmLzKpJJIgbp9cKBA1SjH8qBi3iK9Np88gRq1YLfeqwrFhLvm4lh7Rqbq0v7MKtn+qFbKus2W3YC8MJmex3TessqyxK7BBpEE4JLJSrmgwqLDErFCuUDFwuZauzKScNGmvvbmyroCqMaq6ONSxpLonLIepDq9wp4csui+3sIIwvy3osm2xlzE3N9YjciT8swMuNTEUJ56wJaBsHTcyg6+itK4kljO5MvMhaC0QNOe2tDFNKGelFhZeq1UvLzb8KO2tTyVPsBSpvJa0NFCvKymZpy2ypqzrrCCuEijGpLIxSC2irN6v+jCerA8wmCwtLx8u1isltpqxtqIbLEg2pijoMwOwDqxDqYqlcy4msUYsZazrsi6q6K/SqGMekijGsvypWiV6vCS23zO7rBiu2a4HrAwerrZTstyrNK5UKIc357IItjUgjbCcPBghaLClp1Y0xBNWMQguLaQ9s8yy/KwTrJi83CncpTSrlhJbqI65RkCBnlqvqCVzKG+sP7J9tC6qqDBZq6erV6tLJmazBrBDpCqwny4BMIadJ6o2sI2kYin2s6yz8iyNsUAslbD0LIQtYTOkLRwq8amRqUqsAi8PKO+w6R/YrDEvrzM+pzCz666ssFYwrCYosZsuGpQpNt2v+CBjrfotrUAXsgqv3CjwMdOsuabcLr4r6p6arHMz6iQSKO6yQqGZkOcyyarELwuyFrCaLd4rYjJKsCKfbbGqMQ2rsS0Zsf4oXrIUs54tnqr5K+uoS6dhqoeqYrFtK16ycS60L/4tfq7NLF2whSNbMNQsOaTAKfmwfSkpMtCtGbBJLeipDirjrdoosi7mLDBBkJ5Ur+yqCS0CsY+xYLRFppIxL6lbqx2tMqx6soerRaoCrQgxHi4WrjexO7AMpO8tL7ThtMUoyaIeMTCylywrLWs0DCwbIvKtRKomskQvtClErRAqjLCpMWI04yVCsHOxp6x5McyqxK5xMW6qPjWUqsaZQ7BqLQ9B1bGXrcOjCTMisciryy4vJ1Ss9K2ZMcMjUywJtJ6c6JnDMqOkEjHpsHiuJiqiKNMxWrDpI0OztTRQq28uobEKLqS0cLGMLjSqIzD5q2erj6QFq5SxDyz4sg8s0jHrKAGvpyzAsO0npy2jLKwkXCipricyBjQxsGeyAi95rsQsPqzhLewvrirYrhEihK6gstawNrKZLuorr6PHKI8tJCHArImuHCw/phgw9iwWqWovo69UrQA1CSatLp0kWDW5r2E6jjIxpXQppyyIqZsrQ6EKMw8xGa5bKnWihq33JAyzn7MGJ9SvNqw8Jl83ZbakLO80aqZyrMozvDGTLXauTy6oN1w0MjQdLOAu8isBJBqxqZ3vMea0lLCCHI6WqKwPJEG04anYLCgrNi2qtF0oaSKesNEwfChaJqOtbTBcKBexCTQ5LiYtYKiYIa6t9q0uskgs360yNGIxByz1qg0oO7RPrdI5FCzCsQUs/idQNMUxGTIGs54qDaxwNCilpCBLLEkthjDoq/+zFJwEpzUykKhwsEOqU64SJDcb0KObs2sfRy1lMYyt0jYks6gyvazEKUEsjzEosKmrhC9OLx2tmTORME4oTDPxLEYk8COxnqwiMhhoKb68pKy7qAEvVjQVLkCkR6y9s8Ql6ispGIeh560YLkseJ6oyMgSx0a2sIF0lWTaYqR+15yyALmSpgagMKvcmUKvyspooRK9QrswsLKXaMLGdYa37LZIofa9LNCYwAzEerCciVqeFL/Uk4ynIsKGliKycNBglTSzwqZWmES9atEgpDSjuNNamIjYNrXutz6z8OR+p5SGqqeyqtTFsME8IwLGhrOeoa6wXLcQu3yhCojkrCa9qMnS1wyhBqQO0/rGDLf0xJjQmq2omfjDeJ4qw0zGTLlawhiHTqmQsyzFfNBusySxDG18p3iGUqwKtGS1ZLxSomy7rrBisFy4zjF80pZuhJ6wpyS0RqrsuUaAdtf6wjzHpogwfmzUgLvw0uzE8L7utMjFvMcExk7HFq70uF6CjKiUuiqxrNHeyxDF/KKcsGLC1scejrqt6KH4oPrDgtGYsyKXNLaAs+6pCKI6tP6lupg4xYy9iLI00DCbDq0gwNKsANJKtxzHgsZsxPTGDrMCv6qRqKkqwlh4DIRezEj0wNJ0khzEvJ/cpYC0VLxskMTHrKZw0DTAeLc+v9itjsZCsZqg/p4IkkzSbKcqnPZmeK2YswS0Mr62wXR23M8akxS5HN+2wyK0jLheq3yyOMEKx2ixWtNM16CqkqBcrcqObNWwooKY2mO2onSj6rl6o+C1esgwv6yl9LKkwnTXsLkIsXypVseIsYizltjkdtZgxsEEutKc+smurziiRKrOZm69TsLArLySXsngwBywWqMAww6sjsC6sTDDSHTI1TK6jHWCo66gWLKUvPrIdqwUpIKl+rsetSCWKMPQtOCr8MdA2wzPXpycwVbD2M5C40SgNqkG1xyeksRYw+yTArH07gbAiIoiwrKbZMiEhjDAjrT+zc55HrSQpIDKzqZUl060RM/s1Lq4oJySwF61HqI+uRi5ZpPKk/i8RK36tlyvmMSqy/CvRq1Yl/aYwLYUwNjArLMGjThzGLMQZUiuZrwEwtSDgKawsnquvpp6fuDQRsPI3wi1jNDyluKvbpC6yNrARKRAvpyX5NJCkETGuIXkwPK5EL1w10yujsGuyMClVLaQqJioMqcwyUSU4MxcmDymZrbaotrJbqHUsxSZZJ7CzNTM1r0GnFTFMpVwh/yolIkqkdDA3rJurYDWDtLuoCDAoKm40zK/TMYCxLTOlMY0ngrMUI1InKC9vM/CwGrIvO2wxB7KGMDMqyKhGKWssEKkDNCkfBDbQMKS0F65FrJ6sbyzjKZksn6OgrocwfrDasEe2yDIisRyqr7B0IMsuw6xxrsuwobLZpQ+wW7easWwwwCwJqmCzFjTXMuQyCCulp68zFrXyMb0tS6kHKXK2Wyr6NGuuV7HZIRkrm6wiMA4uJi0DMR6ss68Er2Oxt64fG6Kq+QwoKyYtpR9amfCrLysWsUQp55Xtn6854LAtK98pxjdsMEKuCy9+sdeiPircMK+0F6Q7rN4v7C4HtVgutCWGq0uewKrFrUo0rbClsmMw1DDHs9UvGaNvtHqx9abPrmgyZDEeJxmZHTRap4M40TMLsjMtZLJzoWUsTCLULDOqVrSfKdK21rbKrDwljjJxLrk03LRxOp8p1TPLNLMc1DEbL461C6QKqw8uh6opswohIjE2tKYi9yrYKtWssy4zMhwt9KlcJoGvwKqUIzgvgbIrs/YnCKypsom1Uqa5MbIsBzM0LVGiILQttJsuGbOGsMWzcLN/LaC0VqbNNLa0ZqKwLoe6QJL9KEwzmi8WOB+wlrUUrMe0jy9cKGWpdiVoodyxH6h0MXulqTBMKeWqYhN8sHivjiivs62lCDLfrLUtFS9JMoenEDLcLams66e1n5GxBbIzIWOuCiWKsPg0RaKbMvQovyxtrkgel7FmnWmsqi99peGvlaA6tPq1la6TLecj163qpzCq3Kv3MqMqeLBUpQuujzz5qasztjSup8isXDB3s6WgU7DAKBKv3yibKaY0K6mvK+Qubi9AsJud6jE0JYEm5SqvKKqwPi18MGKvNKwKJnKn+bPxsJcqJjEdKbms/6DSM4ateqkPMF6rRKe5sjqsYJyasA2sWRpNsSsgQqxuupcw/63GL6MlhTqUsAyz2SzrsRMsO6RAMCcrd7A8sCSvxKmSsKUwQKr4LcKyU6kEKZ8doazZstcupK3BsWitZKFrMoMs1pnxqGctNa5GInMpDylPKDkrfZw9MoWvxa5INCqoDiwCr7KuLyh7Ka8pKa2AsWmm7y+BtLSnszTFrzytt62sKOWdKyxzMmgziKRHKRSfG6C5q2KsPSvTMpcq3DEYFnmrrqSYrHGtTahML1mtIykLsJyuZaxdsx+MYKiaIVusdihRKVsqejCRqwQZEKlZrH4xlCBtIDCtMqNHLDQnerJXKV+nS6wxryIr0jDDLTIsv6gpqzYqGym4LOaxCSoKKiooDKauMfsjl6ncJE+kZa0cIi4pQyqCJcyWH7AdMA6k3ZgXsduZ0607LVupYKtUHjmzzLAuntysiaJHK12eLqDKJgStArMoss+wxa2uKdmkRRoALEixhCjyqsexXbFQqxuxISnBqecigrPtpyMomiwop0iZqKxAJaAlgCECo6ymqKzSJ3sl4qybKNUd068FK4yq+i4iLhgtbizAJJAyiyqLLoGvcqyzMe6kszE8MlSulTGNr2avU7EeNP2n+Cp1MrUzfhxEMUwlhq6cMHSjn6t7overoSdhrkgu2LCnrRCvWjCcLnAsaSZ8HeQwFSzHKAAhKqfhsHwsXK3xrXqTtbE9sUcuRDBZKQSvY64arzKlg7JiJ2AjwiC4raaoSSm5sWEqci/QqXYxmKs1pqakK6/3svivM61qpLApzCg/JcOwWK32sCykO6ysp+gyQqw7KAsg4zDRpt+wPSzyrkGqr6gmMDeplK20Km2uZa4XK0+wk66PJrOpuiyZq8+0ny7Spk6vdCW3JRWuZSSdLHctUq9qKK6r86ntGwQuUjEJmlCsS5cEMLyyRLMTk3qoVa1BMDSsISgqJ2OqO6maKBEr2Z3ZmdkvE7AgLSIuFKm/rdGy2DF2KQipPyvurMozP6cfpPWpU60sr3aYyKgxJaQlyy1KqJAtECxkq5EsFq7GpwUnTzNKrvwuvSxBLQ2dhilAJNwvoqxZqnGpSCjWsLMrVK6KqESy/ieBqB2msywPIqUgC6pQLYymYKPrKlcZ0Cy5KSamNrBls1as86qcIzGi2CZynfUr/KY2lSEq3i8cqc0scLGwJP8kRa4KrcUoQbFOL0otpq6WJ/4gAi4hMGkmx63HKhEYuiw/r22szon0nHQnWapjrQYvGCQ3rYqqjytWrJus1JubqDYwFqz4Lr6t3Cq0r4unYrU0stgwdyXgpy4YpzRBntYuwSwwL+gxPK0/pEswXS7mJ+2sWxgULTyt9qhkMM2r7q1SMRov6TFaMiiwei5ELCSwby0KJUsuz6EwrOwqKbDnn5UsRK3Dp9mkmDGtsq+rBLCUJFmqoTC1KvGsnKQrsEiqnyhRqHwvnSsUr/UgfSijrFuuaa1IMZ+w8yn+CRi4WDR3IQWoTzRGsMArGBmmoXaePbG2rAcoPTA2pfSmVrQeqio3oqjnrJ0ja6kAqRoqpCzqKW+r7bKKMImzRbTkLW+n9yqzJwA0ZK1eJX6cxKkur1MnzRZtH+gseq5OLj+sL6XTsNQhlKpXqu6rByTkKN0wLiWasfquOKgUrNWsvKytqLWuQyj9HcEq1qXiLKmo5aK1mGOxsKmYLsCtPKpuKd0pMytMJymr66QXrpctK62QLDWs+iqkrnIl3pGVrweo0C4ZLMOvZyh+nEIs96nbKC+oQalrnq+koCnMLkCqH63YlzasBTFUqsEu7aj0qacrlyuApjWsfiaGJVgpJhzXqO2mA6xTooyvGCWPqMswFTa+rKUjnCxtqt2rPaznrAcjwSTuss0xkawmKI4uNCctKAgmpaugq9cxrCrWp4KgRas/LuexEZaDHRulEijNqvIoCi2uIWywdzClM6+uBSzIqXAvlTMMLf+mRa7Gqq4vnywDMhyt165hL5Sy1rFgMFYpty8tsHww/C04sy6wqyj2p6YrVa5isc8nGSlnrOKncpsILd8ubi8Vqc8wRKwnLySv+Ce+qSAqF68oq5ko7as4H0iulyHaKWGl5i3hKyyu9Dfwq8MokK8CNIqsqyuEKjiwEqtKJcMwNrUlqqEs3R0erymubqABLiCrKix5qPgoFLswJlSz3CwlrhawHDDHrwY9/qvRr/EkPC2MK8cv5CUEuNWoIbFvMQCs9jGUsDalHCY9q6uu7aCxs2OccLONtaUxUzHNNBwpQjLUsPE1vqNutPit0y1esKCvbakxLoAvfS8OK5sobbXxNNmoeTC/rSAvja80sa+tVS9AKFKoM627Kb6yADl0q+qzw5XlMRcwNzI9G8yw2asBrP+rkrGVsICdYK7AKEExqS0FsGKw/zJttNmrMTGSLsIoDKwELR8ofSQSsPqrKCxJNsuumTBZspirL7PBo+wwhzBTJnkllCVKryqkRa8bMXAuhy35q842zSwRpVyvZyXpMjawGbBxrEunzCwENJmsPa33sPgi0S7OIc606TKwLM8iLpw3qqAp0R2BNJIYBS4YsqKp4y4hKNwwITBGMR2xfC7AK4onfah/rj2rpK3AMTIxga34NCuoqS8gNA6muKhmNeesYitYr84xcC49MDAxn7EQlrEwrK1HLcOq2yvjMjQ0/irFL1KxvidAMqaoyLBYtPaqj7PFtl6oLan5MF009CQgMFAzCCm7qS8vgrTNtIG0fCjnMpmmo6spMQ0uWLIvMsW16jIeqks1OLVfrm4z6K9bMQCxwyPRIEg016x0Hu4yH7SEJSufFjWqpfIsp7OrrY2yDDJKOI616yuEsLMuH7aMNKOtti/GrZMzvzNCMr6xeB3+L822ISlsmTM0DLKbq7ujUjGbMi6tYyl/JCasZzSEsO2x+qzeq5izliyFMqyx47MNMZqvyjI2sJE0rjBJsg6rJKf0HUipPK6MKiAlD67HLK6bTq9CJ0qoOyxsLPesgq35LZAoWrHfKIOiFifMremtMaEWKpMxu6RBLgyvJqAqq0gtxC3YLJac+KajIZksNq2rIlSobCzaqPMnBqWXqQCgHyk3s2+uJ6IcpMgwPSJUMHCXmiKaI4ip5qxgMKgwPaBoqcsrSiUCJr0lQCnOKwExTC6yqx2tLCBkpyAuIa3tpnmnNCThMB8rqDC0G/IwU6DWrCatian1L18scS25qa6iFCstLLeneqwtrAMpEygZLbCoRyB5rmegRiFbrlCn1qDuKjknga4SnLskabHcqYqeDC5ErCSoQq67qgcpG6aIr2MrmKO7MhWv4iGgrr0wX56XJAevUCMILWYx0Sz8LfQwYLBWLgApvLHtKd0u2LG8MmUvgTOVKXsqFy+krl2oLxQ6qAi1ZihfJ2gsOTAPrJCtNjQnLE8szS2LIQS1MrJqK1UzSh8CsBivXC55MuWserEzKkAlVDLuspAs5CyPL44WmrJpKF4ogy/UJo0rBTJDtHEvDa1NMpyk5So+rsYpKLESLy82jioApAemLCbdsvwxMRtOG5arozXGLF40VzLCLe4wSDHUo0gtFCW8JuwuPbCTNCwxs7HpKkksDChJNP2w27KJqDMopyyKMlgyQbOCrSQuTqq5JpeuOS7mLhOu3ZTqK9cg4K6KrV+mXBf9qwGqEKgYJHQoRq1hsEgqLKscrpkxPB7PqZ0wcDG0sVKuzag4JOGwqK2VsIssTC4zpWMwfCiDJAAxWKq/K22tZbGvLw0qqqi3LVikNKv7qpel0qwILsqw2Sc8LoGt8KSArt2m2SqmJAquLCyNMJiqwKAloBuv+jLmrKkpGanbqfevQSkwKdap16XsJPmxJyjGKIcr9SoGMDwrwDBMLHedIyBXLrAvpq6JMJES7KxBnOysZSiQp+cs4SSUKS4p5Swnp+GisqiQLLsuSCZErMotLjC+rtYwXClIrm+tWSqQLaYuL6TUHz8wOqiophGyuq8fr98jhqlYq7UxEy9vrK2vSa9DMIcscSgrrv8x9y3eqWusubAkMd+tcKiHtAqmFajSJEGzSrGWLrktOTAoqIMukiw4L4ItVrDjMRmMmKNLrN2uo6wwLbouX7BOsDCsI6jfp2kuzzDarDKuiZ8OJ+W0AjJwIVkxc6Rjp0eyfiXiMe8tErA8socuJCpXqP2naDI6MlC02SYfMP8ohaolMKqndClLrrMvhzVWLxuZTKxvMX4ocSrUKyIoL7TkOPisHjTHLWyw2C3otJot5KzFJVGwIi4IrByv4TA7tH+oeDRjJIcyoauKs1KsZrB9KtUwITLMs0OswKq5r7EoHDB/MzQaDi4wsFmpYycroRewO6x+KQ2l+ijmoMSMAC1frWmx4qjXo1cmTykJpR2pyy/4KsKy4h3iLG6tXaywI8CwmyTBHXAmWDBIIHolS6bbqEcvaKxKoIEjqqjaqUAtkCrwriqksCKdn2itZqcPrdUo66QTqIipFyrkKgkoP6vgLZkhPaRwrjKqECc/KYKerSRrqEapBRmVp7IvC6lGn0QoJbBaLYcv+iySJRQsFyBwK4CoQqmALCIldyl8J1kw9yzCK8wtdqw0LD6sHi9aKFapEyr6k+Ks0qvvI5CnMTDfK5+rkTLrpYiurjESHwGqca/oLAaqxzA1m/glayD5rBgFULGdpK2s+as3GYoawjHMMJ6v2C3br8sveahpsb2tsTCKsCoZN6qvmRGyACicHmwsd60LsCsy5CmKsA4wWi2DMEyt6Z+SLkSs4SpyrdmpjCRUr3auhx3LsHOqViVZspeloaUGL44rBzKMlrmqDa6GrMgksbToLdSnJSoYpTKoX6u2KpspLLExqzGr2ayONgyghyr8LMMvYq44Kssx+anKHSIxpy6hrDKu667wL5wi5a0trY8pNzDysDahgifjtgg6rxk2NAYm8SqFJIq0eDlXr+IpYLGyqqUxyq/bMHy3w6LBNrkwOqbpKGUqyaZ8rxKnyy62KeEuJ63yrTqzDzBQLiIyb6n2KEGun61rtA6eBK/NHr+sbK0ZpeUklCwPIrswHqhNsKwstikLpV4y7ycVrzatLq8bJWCIeqnPKlEjC64+Jrams6vEMmMoSS4SLTM0o7ArsJ6pTaz8q+Qw7SyjKPkpWJa0KbUuVawXLvUv363PMAqoX6uQLH0lvKO1JmawEqTKLbQpNSCeL3SuCqaqqlIzt64rLLmt+aOwKpKWbrTPqMor9jGcKrUxvy4jsQutL6yno/yrsqo8rBquaq0CJZIr2a3rKO2mrDETKRgpRBU1Ja2xQy+IKKwwvbHgM64lijBxLAKobxxKrqCzky5XKNAtsiTzHsgojCihoTmxbyTbLQ6sNSl3HNqqvqV4OSI0yDKLNDuxRzFxKAWzC6mYn7al+DaAsBI6HK2ntEWtIrVjs/+t3TgmtEjAbL4COA+49bzIsPyym6Yts7YskjCkJjKkgC7htDa6sbY+ris1yi1ruWM2lbdJKGa0J6Y7sc4tEqdLMB+wgzFhMOCtdayKKDI20TUvNVOtMDPJNDaslzJCKFWjHzJgqhyy37Z+tCOmgDiqMTW0fTBXN+WyC7JWLBkwGC1uLSq0Uy+nqVA6wrw7Nf2xar+nMHqstTJKuJsktbDNtiqwBLoHqys1S6uDpUe5lbyArRsjWyVmLIW0gq3oKkm3f6sGtki3kDx7NSK1Ljp1OwwoQzsDuUcrMZG1rBE17zJELuizpLX5tEIzlLFtpPys1zyHtaAodK/UMs0upTVxNi84razIvLMvH7o+NZa2zLJcJHiogCyTrpAlwSswNmW877CHs2EwaChPsUE287fgKHK40qgTqwc0x5RSNP2xkTQcsZuoKTGKIbgyyTLutBG8ritLspQySDCYroqX/TCcuJK9Mi6MMRe4yDiEKUWj+Kk4srGzabPUKW41Ojm8tyg1wjO9r200IyWbOLwxujQbLNyqtzDhrRM47zgUODw4J7NjsvW3FDQltfE1Qy/MODW4fy6Jru80BDL2M4yq+KyfsaWd/LNHKcc6yzMwsfw1X6nks7gxobmGLqA2jqvKrVkwpbSWNH60fLQHrPaybS0drDy4MiT0rJC2k6tmtMC0zymvNUq3+LrjsEEzWS9BqM4wuTGPsHk3QDgHqBSlmawytqk2j7iwNhIvDyuHtTA5zDCCvdIzq7aUuI0xfrlsqnY5qLBsM8w0kTBGtIYkrroGOCira6McMBEzoLqaMmEtdzCeL5M3nDFjLGe6ti10Mk00fbPPua23ZKU+NgCwFjnNNfExErV6N24wOrUDs5g24a/LuCA1UyPVN5u2E6h+u6uz+Kw6qTEw3rBkpP2xji2Ntiy1tzFvrJg1EKpSMSKuVDD7o8CvrS7qqSYwnrTCOTkuerieMIc6o6B5qt0uz7mgLGIyobL2sh41PCuOs3C0GrXBsTMz+Cs8ND6fmzk1NE0njTJxOM4tbLk5pXI0UTP4rV8oSqzAt4isCDXlKm+5HDNbtD2xKzjXsF87bZnuNHiwijP4swMuiyjkNKyzkrPKsZ0xcji8s6Ui7TXPMjQ4PLBKtmm1JDYetZu1rTLzG5u5zrMiLxWoJTK0LFSnSDSZLi4x97DZLMitbrWetkUuSTQIt1ws6BvFvOs1MrStsyC49qifNCssxalVtkMwE7b1oZArmzraN1I4/yl2M3+4GjAvL9ixc7SSLPsxHLCoLsM5wDW5qhqxrzj7tRet1CwhMhKqwzZaKMUnHyp4r1iySzETuWM1ryIOqQYrWKZQrke6MzD0KfypmTPcuSczrjFksOI0Arpgsfs0ITTyLVEy4bWBOMewGzgSMcurpK10sea1TTKqtFuyciYCMyI0eitoM4UwEi8RIR0s+7RSsFSxTzUsKk44mq7atmY2PzMdstW2fa+IuquywjPRqui8irBPtZy8hC7GNHCqDynFJwOyNTRks+q1ji34tjqvlTNZMEk45DFhKgUmvbnRMWG7z64kOQY0XDLfqh40TLXQpwu4li6tMSqwxzEqtUU2jLB1tB8rYTE0txey8Sz7pQ+zB64Otv2mkTW2rEk2rLHeoXYg4rQ3tN6qGbDXJn0zhzHmsgGyKLKBObwyzjnTkrGysLIivM2kWK6CrfE6Brk3NcA1q60JNce5xjOOMKyyqrJavG+0C65Ssd4w17TMMOmm9TN5nyE7jbHlqZwdIDSgsfwlfTQ8LOO0erYENFkxFayINacyizZwq362/LcZN8IxtrcVuVUxzLqxLKqy8DJavKCuarSFM2G3mCx0kYgtEiaor440wzbDsc2kgLUWMnYmXTMOOTiykyKRMioy9yupuDI2/zFTMqO1IDDpMU60GrigMlI2MDP0MpA1N70LONomSKg7NpO1Ejy2tRwyC62oKVetZbbcqbStWiG/skC4dZ+XMdCxJy0hsUG1pC/ytyoxeK7etC+w/qn7POYzaiamtaqtWLqGtlu0XrCKsZ+8hipJtW2y/DEutf0qTi2Wq50x4rgvpJCsnrGmNBA1OrI4sAQz3K8bJy24uS2+Mgq1v6yWKCQ3tDTzMCm4+DUTNNWreCsAMsI8PjTvrOk2C7Z2LvK0zbCeq9O3hjMNuic1MbdWsG+y7yUeLycp/6pvtXIvS7UqteMyA6k+tTMzPSn5LcY2KjJhs/+0wTHOKTQv2LqeMQklODBMsuklTDXItQatIK0gsre1STtGrM+2Wzr2smMui7E/svY1IzJ7MIkvjzHrqOWtlp6Ps0irx7ULvGuxizTOsR44ULZzsY0vq7WosNG1La94ItQabzRxNB4yUqt5Mfmx3SgIsYM0hj1uLcArJKzltKywGTgwqyeyPTFNox0v7DDRIn8xkLG2KgY4aqJ/uMGqryjyuY20wyiHNfwtADRkszo3Pi6yMUWs8q0+rz+xUrHCq1Qo56odNOqwki0fpD0zVTJ1tPao1bZ3tAU03itNtB+6TSx9tyA3qiLiLnMsxy7yIrGqdqwLuvGwKbjUsIouULJ8Kci1SbphM8O03rW+tsiv1LRmscsxirYTqC2x7Da8MY892jcbLA21J7j2tJCuMbBHtFYuxC+wsA6zHaweMPYvezdgsIwyBLn0nti0MTUSsL4u0zhSLxy1ITBoMos1iyhMLzS2uCW1NEKykbAJvCkoXLZvNyenRTAtMza1tbJ6HkcgY7EpsSa4qSW0KH+0q7CRI2wxjzRxNtmxarMHtsI0R7ClsqIrLzGosi+tSzF1Nf6wRa/HtDqlozBnsm0tKbWBsQk1tyu3Les5+KujsounDLgEHko0o7mSNAO0HbjrtwQ50rTMszwkKy9ZsgM0QixMtuYrh7geqqE1HaknOBAu4bfwLVeyJjQNtFO0mLhJte8xQbSBMre2GLfbMTw0vrd5MFA3nzG2KfYuQbhfsgkpGDDnMjEz+LAksVm1yDMyMBAnrq4fOCSprLZoLvytQKCRtA03JTGpNHQ1ji3QM784d7SsuAe5QzblrWszXSXWs2ux9jUWsD4yACGBthA+9TAFI2c0Xx8eMu4vza0FoPm38CKstXM37DibsFWiPLdVMFa0kyD+tMyvQy7bqLIlrzCntBOui7G2LMgwKLUlMEEzrbMhrGI31CyntyS00jhEpluyZiwmsHGzGiujrtWoVbJZOCscZ7F9tu8wtzwdLFIyBrhMNOKpByxTNG0xqzVHNSCxXLVsuRezEDZ1LI6yM7DUriYxVLTANJ01R7RAMREtHjisNDM3Ybcer9WmH60WODWzcK4qMA+17S0FuXMxB6nqrukzLC0KOOAr4zK+LIg0ZTCHuUAxfClGMoSwfSRDPBKgQLgQK5owmK1NspwyQ7kMuDirBrIXIQo9Q7R9PPk1LLX4KiC0DiwFIpkx5aZNLI6nsLSTMV81FK4UpdGwIbXOuOUwJibAMaK3rLCxo5ArTykMsKQvmC6EMqmtRBvpPcMzIrkIMy+wlq4XuEMxHaYIuBc5I7rvJx8y8523LYSwLDouLDMw+aLuMCs4+DKgqT+0ErmGsQoxciYMuQMxtzSstD625a+/qUs1UzRdqTu6YbSqrm+5hjITuP2neLIJrTw7hDPHrdu15ihyu8o4AbhINX4w4S5DuGo1jbi3tpQp76rMNTK0EqNHqW8lQyOuNgK0TLXqKFotBZy9rW0pkjUKHdKoQjETOFKjRjV5p/izQzaVO+A7ZqjeNT0xEbT/H7g3Hy6RuEAyHDQMsiwxf7cwJyK3aqlFLN2j+ywrpUAwRLIYNfSyuCYYNRa0nrSGNH8tfDZPszmnnDapKUW2aDCnsa41RaAaMNyqWru8LwC0QrH+tCIwIreaMhknK7pPnbSxxreoNGQydyikL/2wgrRgtS41ual/s7KwXrHAOFa0pC1stF62gDY+tBKt66yNuiAtCa08tbWzwS2hM7wyFrRZO1w4CSJnroop5rKYrkM0T7mEIqOdHrOVuG4hejWbrrqkCjNHoC0236tTqNIwIrggNO80EzEKL3+5jq+EsoU09bXENuMyViyBtj6vJ7TutRWwwycONumyIzUiMR23szBPMKKo0y4+LjawPzVBKBgwNiy0qUuxAbevsBkvJziqNeqyFbHdsUWn+THWrXSz9zTLoPIwMq/CsGg0KrKDPBmuvLDgljkyzrBsMvgs37R2saC287dyMSW0QzDMrlO5oSWiri01lbYuJVgxlbLQr5mpqbhWNRkyq7J2NPwxYjf8tLo2sjQFsuQoiTFJsdsx5623I3avbDsQuJQp8Jx6Ns6inysAN5owTDBkrH+z/6lgLG6wQC3lLJ8yDS00rvYwOzLtLuu1dS8bpMevoyJOr5mlHrg1uLswgatAMqO0ii6HrmSvQTFcuGqxXTUiMMM3WbG7sM00DjRMtqEeSS8qshoyE7CbtMote6wYsyCyybDfNAuzVibqs2AxS64qud4yrC3vruqwl7PtsSy4gDUTKegrJbahLyS5HjKTGgG4ZqWKGXEk5zTKLggyF7Q3tmw0HKsgtKW1TK1zOR+wcq3js9euUrH2rAqxDzFVMD41LrUGtuO3srOlNEsw3y+8JVg5frJKJr6xZLG7sXQxBpr0LPomq7B2oZqxBDfWKKQv+pwuN6c0RTQdMBm117WQMWW4FjkNLw6qhDPEtCquPyrsNVSyi7TltQCnvzYzqJMzi7JvOAuso6lkLQU1+LaYtigwKTmbMTs5VLEjqBKvMrpsMVW2yTmrsMssjLjPOausNbm1OHg0YbPXNG04jqR7NtYznDYPrpKxOrDtuTivajcBOAEe5bQdthy6DixAtNW4ErCbLeYydDEcHke49TC9tdsrojjmtJswDDTfMFIlqDRiLTi6J7nhsT61k63Ls+iwoBkxNJq2EzY1ssEyiS3hMGW2TbG7tp4tODMjtfosH7jkNrUvPS1ZrBc1Kh3DNAA0QjhnMFY7iqanqRKpeLXhND6kxTjTNJU13bQZKVwuNCP1Mh40y7YVLkEwo600NeOwRTVtOWs3XrUvtU8pUzDWLdE1eTJQup8tazQOHgQvzZ6/LGwtGSXlpJSsD6K7sB4oTTCsrLapCyVesu+nFS82LS4vG6VhCHopz6pRowsuPqa2JrMrxLJjqEmuEq0ztKMwKzCeKU0s/CvksO2so6j5qVgWtKm1rlUsF671r98tz7AKKF8rkKx9pbwjtaZmMBIkyq20qTWgnq90LgomqipSs7cuK6y5LfkjsKqSFm40zyjKq/axnKq1sb+uIzELLS8spyP8K7IqPCwaLmotAqWSq9kt66jtJqyxE6kYqUSVNaWtMUOviKissL0x4LOupYqwcawCKG+cSi6gM5OuV6jQrbKk857IqIyooSE5MW+k260OLDWpd5xDtqiurTfZNsyxOTIFrbE25SONn+W05q4BqnSt9LK1pp20/BpDtsq0P7TjMngqZrHfOGs1IDdBq/UvlTdrs6+0GjGMLri7FTSMNFQ2ibi7KomwkjApNQak4DBrK2osmioltlyoiyxXMd6uw7K1rFsxRTP9qxq1Y7UkqmSg7TXDMKKwo7lFL1gywrawsocnoTKLKw41nbHaNuwsSDJjOSQx77WTt48uUyg4NYetjC6hKqoeMxzntKgzgDGtMPiwazRsOfMmRq4sKHcphLNkKzMkSii+NWStJDNvrIOwWDQlOXY0qLEfLBmkaLPmNb8wejWFMl42/7BMuJmvb7OYNpE0mZ8PLPGpmzKjvggfqzZiMX+yJKsAt5osfy5Fqhe0FqBJqDqt+CRpEeIpAqroql6tBC0hsH039zJYO2Euh61zqQC0LDS0rGguKiwQMt2ul7GXMCInNzEzNFWqeSp4sVu1BCuIrBmpYikLs96xbjHcsUA0JbN/qKql6DTrJCEtmzSesLssmrFuqJuydSxqMLooSDGXoYm8WahkLRg49asDJ0YnMrG2M2gyZaZcsw49+atEvAUtQyIlsNWaBJa3rC6rYaH4sdS2qrFTPXYpVj0yN5MtdjCyqjsqdbqtLy0uCDHIH8UiEDN6MACnYTGcKxcv0zDsmoQ0vK0xLpugLTHNIHw1bLTHo2aviin+sLKwgy8INIYwly0tNWSysq9MsB6zvi69qkyvDTY7rQQyfSsHshwnHzAtMCa14CkWs5Sso7DdNQ6jlrbtL6A02LIarngyR7B1tCa187JWsvau0qxDsKusFhtIsiClZS1TsEQq3jX+r00sESSBMAywMS+JIsyvIjGNs8ay7q6HqIklnK4CM3GsaLZQr/QwJbMZs04wILJeLyAZ3qp2sKoupDRyrhwvujBAKk81kjE1rkQoNygDOaetaDT4K7YpyDS8INaiqK5os5+yCa/boAEoRTdkpuIxyKkXksavlLUkr4gwMDOmLaUuyzCQtmwx5bUgrf2sFy1pLpI2LDOisWsknzPoDtIsnjBtLfQvxabYLsQc5bMNJmUsJx6FswgwjKvKLq0uaiu7Mnisii+0sMkvti3ssVCsgilis3i00bLWNhUxka5nJ8Yz/LU+LdmyrDIysc4pfCsgtN6wj6MnF1u0sjDurmSr9q+3rlKwK7bYrvWf16jYsW0zMrEANKYriSgDMLCgEi0ZsfKxQh+wMKGtbLDeLgQuBrRMMm21BClBsnM1WalXqDmqbJpfrlU0YDh8M5qU+7WdtD0x+a36IKIyOyQvrAw1SqjDsSaypDETsNythSHsImM0H6k6LGOqxK59Lzg48KwRroQ367Gxsumz+rgUsrcy0ixrsGG1iTU4s+wycjf4MeUwl64eJdaoPTZoMCqyHK0aJ/ixri1yspQobawVuKG0NahPJMk1Y6tptD81HjT3rxwsRqu5mnMmKzCINIQXAiljNHU3ZrRWsWaztSnGou8ovDGtMGizWpj6L2ayxrBis2wwFbWgJyGx+rCirSAv0q6UtGg0bSBpLM4wTS+jMP2uIDH9MeYsjC38FW8oNiotLywi77GrkK2vdiKqtUK1GbIxrqoxAa5kskKtYaoeMMws5ieKKnYuHKPztX01M6yMrsgxWKzHtMAq2DaSLw2O1rJwrQg0PqvmKB4wlTMhqG0nijMYsc2q6DUGL9s0462uIfMw/zQ2MemsrisMsIis8bTANFKwxR4ds26z369+NK0oCax2j8QxaKU5MnMsATWINn+yK62hpMQz17HkKSuy9TXrsnirYDSgMb2x+qq2LAAwMSkrrGw2Ty/HMIysfDZasHMpiC2hrACvxKdCro2uvjACsEsqazBDMWyz9i86r9aoGi24q5IzXqkvsjuoJrNqruyyryk5M8wxeLAltXKpkbIDrPooQq5rtq8u/a4CNG4rAyUqtUiq3S81KpytgrGUMFMqzTFsLfk0v7Awqpow8KDTsFe1uzSnsYmwU6C+tMyxfq5YsZo0I6p2JlSubjSesz+uPTOuL100YLTsIW4xHiwGNP80m7MXNL2tCCzEsP+v6yy6sVU1PCnkJNm0PSo8JO0oyalgNFsySa/eLuUwOBgJKv60CKvJrNSyziz0rl0tGa0oJA60mTIWuGG0mJh+MYao16toKAcoLjIYs+EwGqLmqUg0EivSsE80aarQrpgrb6sJL6SoljQfEUU41jImsAKqkKwJLlI007XjNTu0RKhpM0GVzrAhtYa3/C0yL56zFTGJrAgws7bVqCKu7DMzqCOwF61xHdAlKrTktx+0/jFKsEGrkbIOsSYo9610MGmw/SaJtd+xvjF/nPKxEjZpOG2weLNfMHuyfKx0sPg1CrIUpkk2+DZbKA6w4y/3NXooUi4ksZW05LapKLcnUC9ArhAuwap7MAIvBbCknCSxYCqVrc2rrqowrQKrFKtoNagyP7X3sWAwMZFyraEtCiUsrSw1oqjyNlMkTyEiq1s0XTWQsrGw47FBsuWqLC8SqgwrdSgktfKxyTJNMvkuMC1JK7ekt6raMFOsIKuiMD20Vx7oMqyvKjTdtnYxz69grpAlRqn5LJotV7N5rPS03rD5sbA2ATGWrXYwwbFcNueZT7SrMnckiSkQM4i0iTRbLGspFrU3KRY1ZbBSLSawVKocokmwxq2uMzKwP67AMxYsErExtBAyAK4XrYoe9SO2rTe1DbNPtLap9JxwM/+stLftL5Ss9LI5sCIwR7KBNH8zOR3Mrky1CCt0skI13ig1ojkzbrE9qrOwQp63MeQyILGrtQEpjaVyrHGwTa0tNbMwo6gjrlatYJ8wonExma/xMMwkUqfNqMewPzD9te6v5bAGslIjGDOMLEIp7zIfs48zHq7DMpGwc7KGr1Kv6rMMKqy0H7I8pfirJTCrLoAsPyi/slkvaTXDrbisLLCuqlomlS4HNdmyGa9gtPOybi0utGuhgSaQtSeoNLHZNQuvvalmNJUorCY3KU6kAquxtOCj4yacLE4zzLEXrBEpjTOhsZO12KdANNwuV7G4tHgzIbRkNB0vmLdmr4sw/y23J5SjB7aqr/cv0K+fLmSxOzRZNNIWt65HLkIwWLXIMI+hb62EMWOwJ7IAsJ6qlS6ZqZm2wLQoqt2q2aBiLdYvazVHJyOqj6QBNqypoLDqGLgp/S8GJSMtZB34LqCsS6oYrPajGDHULHeuPyzblEw17rVIMBWkljQgMrGqz6xiNG6rJDStLcC04TBMroyWJauHLQGqy7Rzq5s1Ea5aMYSsPjRjMY4pFzAmtDEzCajoMJm0ebPXsXSa9bPJIyCx5x1sMfwstCpTnZGvbaRULX+wyaAyJrSq/CzDNPuxTTAkMTCrZ6zwp+GypaT/JekwziZTNDu1WjGtMB61FC/ztSYygLHzk1O34KjwN+iofyXNLjSwXrXoqd2wCLMdLJcww67kspuk/jJXsLAp9TASNCizgy4hrmMsE6bAMva1BjSVKVq0WLE/Ia8pAzTLsKkxs6nltb2UMSPYpCkw0DRsqW84cjQeMDWp36rtLJisULFSNCAwtq8JMDSpMC6rMBIvBDTtNuK02jNVoTmqerOuMjstSLDGKJmuUyv7sDSykalEIZ4vAC+7tVGvyS6EJoanTq01sZgqcy+Nsbcoz69aqy2wvbWbraO08xp0sPwmDLOAKAGtfiZtNZsw9jBkrjQtQrBBtzItmzGVG/a0qC9kpWSjBbKMqGOzR61zNO433rSJr3KphyDeMyWxo61lrhIuGjCdMjMwspwBLO0vnLbYrTqdUSr8Lgq0XzfnJECxhw+mrXEtqKj7tJ6sh7Q7MB2tdCuSKwYtq662sQ+0iZrorS2sYyUFL7ev9iVbrFevDC1Wri6twCEgtX+fIjTasdiz1rj/NNEyla+grqavgCwktKSttbUFta8wLqthNB0qyjDOqbcr6DelsAkygDG8MDmwWK7hIIIzoTi8KBmt4LLhMmSjHKUSsRSuzyoFsJKWMC2CrkqkLif4sECn+K8eNR6sFa1dNb+wy6veK561y7HaMHgtny3rLaO2GynyMnkpiDNXsmsffLD3tDSsrbJFsLgySi8kLIUtD61FMWK08LENoUatvTfFMy6ycTRuL5odvjYOMSaxHK+cI3kwDzH4J0KkL7WtNL8wTLSNsTO00yJ/JT+wSDUvq5q1ii7ys9I0MTSUJKouty8eta6pLjHJsoW0watcsEiyqy8Gry2ySzQbLwQo4jURsuCxxq/vskUyqLEntqO01ymAtVStsSW6MF6t9SnxsUSrtDD6KRg1eCiArOcpsrfxq8Y2JTF8or+sgjc+Kg8x4TDCsKOt3DXIMM8kNLSGMCewfauvsbQwQzhCMs2qSbMIsFqMhLSgsFuyRTQQsa2s2TC7rBExSquwqvMsGqaDNHUxgSwptOYspLICsRU0bzQLtr80/S1+KpmwyDDyseCyBzEDtZ01Sq2MMmOkj6wnsoU05agQM9ywYDTRNvW0XyqiNKssaa9cqn8kmCTosB6xQyj5sJyuGay/sPu0BbQRNrGomLWyLMuxULLGHcou9rJIrBskxqX8NH0sU63SLCo2Xa7lMZaviaijKeOlRrYhLCCvb7dHKYAYs7J6sHAZNzIqsuY2HS0ts/4wcS4gtOi0nKbkrgEnOi22tHsr/S77M3ovVbO9LN4ujS8cNDWl5a5mqZGluzW0LMEvaqwKIRCq/CjKKK4pjrFVsIAwKy8Erc0tADTlpA8vGjRFNVkt27BRNWsd1bO5L42oLjZRtQIyQTA7LUY1ba6FKOCkV68OMJSiU6OrsGY0gbWNK82jlbXkIvCwPrJCs181p7C2tm61yihlpPWyebJQL4U1titls/K1eCyjMFkhTaTrOFGhgKjDJnM1azJULgItvwoBLsQyHSkbMWoyUi7Cr0E0HjHqodezai/PMwq39THsNNSqqa3/MUk0Da1GNEawibFNsf8kFzeMMag3LS7+sYKx7TBINisyQrFIKdgbQjVDKys0ObQ0qLiuaa7JNAG0ZLjGskGvwKgSN3wzrTHerlmhgqaMslWvhbItLVYVjLHlrSSsIrF7MPYwqy7ir/MoNDLOtB01UbCiMA8vxTgDpgksr60ELmY1VzLrN4CsVLRcsK2m4zGZKGqrBTVQsDg0ni52qPO4wKzFsWkxM7CtM4g1sjDaN80zKCHPskmyjzIWLhCy+K1ervKyQDRlso+wpyw3rNIuhrFptD+wPaqbq8a2hrFiuO00DhxpqVa0vTWBLhkyzCwFMCo157YCMm81NTIUsROxRrJ5sEKpcrJEs0Sr4La2qJCrgzGGrGktojGirJm1M7dwMl61ZjElpQSz0jAEN+020DCXr8KjMzH5NxCyJrE5qYEsZDXkq68oNTHKMparvbjXKi0oULh1MH4pjLKdsR0yJ7L3p7KyKrVUs/ak2qXgNGyyba8AsPaq27QssZexkiR1MBKgNJ34MzIy+KxzNfItZ7TErHWsw7DbqpMvL66gtDAxyjXkoyszyiuDMxiv+SpkLIYsKzFBoU217DBeMjKyrLAZNF2vEDSBMpUvCqgKsx6sEaV1st0vrDZgMNY1WTCVL4cvO7J8Lfs0CrGgNTU2ba5iK90iLKbQqJsoVLCbM1a3BjFqMR6ofqOYLzyoxLJ7sqCmSLGPsOGr7iz5poStc7NmMnezETY8n1WtN7RILh6XEjXcmXAc5rH4MAiqZ7JRrvGpzq80NkWsZypGKtG0E6jFqE6rY7DELsUsyLDZtAEv6rFIqRG1sDAbtdUxxrE2HFUyR7QwNHk0/K2SJaetb7H+L7Ipk6/Bq9ysuzBTLoW1My06Jbcz6aQfJu6sOqj8quIuJK0hL5ysEjARpSAperB1tmGprLVBtIkrQCfGKioyJ6ySMTQ1DzMMKbKzD7UjMVspcLBtsWAskyVRsRCwILMMMIaoYTC9MK6wlCmIMFMyjio0KWk1pKQerykoGK7AKXcrM7bVME4pHjQgtpGvVrB5tHCVITGUNbEckrDerUIsGjQbqiYqAjRYpI6vmh0nqeYwSDbLtQSwz6sDtiSx2681GyazCTH4NSOzBLSqLfSvp7KYqA2r97HuLq8r6axBMmOs1yyLtIsxZbY3tAUjILjLNGasKbQPtHqwezDBLeSy7bapLMcsOC2NMQ6ozzBNMXQxWK4fNuS1CDAGMnSzzaCmrcQ2jaqaJcAssrJDINmziq8ZL/CrICqVLCQxDzAjLeesNi6TqtyxLKmar40eVLH2sf0xRjBzLf8uai0EKzot/rLQsI4xlivhrEy3tDDqp3GumK8nq0okv7FnFu6sRi7gNGuxWzGSsO0xp7Adrfw0Jaz5NGspMbPcpqioeSoKMHg4Ta6prNEutTSbL6y0VK3YpZW1nixhq+0l/rRFriOww6RNLIexvSyZsWktVzT9HAokMa3IqLWyGzHsMJOuYzSpM/sykq5Frxw0xzKELFQlUrBxLHU066vjJjonzzBrM8YxmaBnMqOy7jBnMIy2tLeTqxkzCrXANY23Mq1drUwzAyD3qv4iEahCpQcwYK74r8IXES5fspCqci0gpUCmgDM4Ncywly7DLNOvlrbBs66pIasmpmGwzzKVLLYd+ysDMjMnkLPmKAKm3TFkM0ivwzbRM/imMzavtQQySy/QMPYpyyo4sJYtWTIfNKi1QjQWurqsxrdZsaYtHTBpsdot06qTsu4lza/BHRG3mhTBp3CkPah6NKe17KKarjuyHaq9NIAraCyrr/quQjCnsJaxoTBDLKAovDSLGUKxUis2tWktRTW/Kle1gCtNtQoz97HmtKavTS/wpIwvqbHBrESwADEGtRI0UDIvty6sPKslqjomN7QfL80lkjPStXu04bBnKpky+TWCG8CwvbNVsY+1kTCbsOkyh6gyNw0tGac2su8fhixntwIvobMrnqWp4zQ9J4CxroRzthqwUjY6JI8wJqtwrq40t61ZMCQ02rVoMnI1HDIMsZg0w7FDLeQnJ7Bnqj4uSCnvLo0oCDUctE0zqLBGm1e2zihkqBwu7TXSMR8yaTXusTKyQ7BsKk+sPKyDrfkpVLCmrcuowLD5sIKt+CTCs0Quga1YsYY0FC6ZrPGlwjWwmvwq6yWfK/Kh0aiPLvIvwzJbs7M1VC8CtRU0lCu4tOU2hC2GML2hzbBVtgWkk7AfNasvUi58stspizSKNauyRzVwMZcyYjTsLFiz0rERroKtVrJ1LJig87cUtbo0ojC8sHqvHzUsMeGyRCkatCS0My77tJayNyqIE1UynC/uLPswbDA6sO60MC9Cq7Chti6nrB20jyrhKlUwQawmuBcvXK2OrC4u7K3Pr9sz6zNPuBqcnCI0H9yyLCs+rhYw8DaIraew4C4+rruljbNtszOxKikhqRErjLDRMFSuQi+DtKutUTj+LMqsOy4wLnaq7SvZrn4wEDSSrHqsqa9uqJUp5ii0tXm2tzS/o5SyX7FWN90wAKzGJJgotq3qMto3v6wktv84TiyXq/oor7QHsF028B0rsYOlz7PPJK8pVSrprvM1x6YVtKexf7Tiql2xRrCeMwe4iLAsKi80AacfMOusXyEeo7i10bPHs+on3jOoLR80ZiWss7is5jBGt6ItMB3Lsigt5TBCpC21WzG9pmay1C7Jr/4sa665MsYoATRgr1gzwq09r5wp5zBrJk21GC6MMWkqXKrwLPMwlzHCqgkZHTARKX2KB6tcNDiiy7JsNlGqZrKKr0WyFDApo76ys66TMmcyQbIOqii0bysurB+z4aUspnu1Sa3yL2grui7GKbuzRrEKrNcspSwoNHkyVTMkM2E0m7QIt4O0Ra9jJ5+p47JYMPyw+KwVNQswSjXKKiQyXjMrpp0wsbbcMIOqqbJPiQWkh7FJrr4xD5htLkmgVKWpqHo2MS29LRI1a6kHKmwoo7dlM+QpKrUEMDew4jEjrg6xRCVoMPG2Ri8esK4r/yvbprYwKDFcrp21qyEmsKozKTM5MAqyqaiBId0it7OFspWmAig7MnitoC8PM8giOLWQLQ+l1COmtScy5jCGsvoy2jSqMQOrXbZjMBky+Cy4sLG18ii5IGszI7NuNFIwU7Gss7OnBKsdHtq4e7c/LOis0CWLrdqtgbcnNFYy2KwKJKGuTSkkLnCgdCUpMI+xG7ObrMsrhC03oXew6TKWq+Sqni3sMWsspasVJDc3Y7AaLiwwLzFDr70z2jEStBgtALWCMJsl0zFtMOIqVi0LMaAh1DWwtFgapbCcMvgvyLTtMwqrvzDYKx01wo4WrJOnrK1fsHcvFa34tMg5rCmLMW+1wSylrOepFDZms340HzJ7t52ydjbMMLgcEKwRtL0wDSg1OEW0vK/dNe008DRyMM20DbTxNHUyDLTpJXmsebSzsZGkJjQ6smi2vTU3K4CqvLAuHrMzDaKDsk2thyiHMQK2/bIToTkyDqb2r3qwaTIctXG2grACtFsp+bWmMOuucitTNVevQyyaroy28zFyNS+tBLWPrng5jLAisCa0MTLXs9mgDjKQt6YpJ5BlrVSxaDLBslW1s7gZJL84mjR3JKGzyC+KIbkxs7eSpMu1IbUpqyMx3TP1lPkx4jMJOCgxp7YYq+w2xak6MbczxTMcr88tqSb0L4gyxyQ2L9IuRTRisFKp+rWJLCm2XrYOsJCqurBHtLUz1jFYM4+0W6XdM2yxpDKQKI00EDWOqewtuKB1M3yxJ7KnNAKqibVmN/I2KDBPNGmzlLTWqfgyDjVss+kyTzVLKSOxiC+ONIsv5a5OrUs0e6ZGtcysY6g4KFQ0drKsMTu04StrMpq4OyRSsSWk+S+LMTaglbDuNFSxErBbJiQzAipkLxa1BzTzqpiq3q5nKuiyK7EEpCsuc7ZIK2MsTK2aqRaw5Cb+Kh8nua/qsi2zJyVMMRqoyzHUIwgsG62jsIEzzjNbJx4wtjG/qi6z27AtLPevMLJvKSexhqwNrMcg4C1FLcgmSie6NmylHrGzlqOsxqV6tRIuW6+UtskxVbMYrnW3BzCjLyMx268jMagouCQJseYwYi87tQYvpTGtKCezJajlrnixWDCDtGsxuSnlMW0sT7BZKmCuua99M8geArEGsJ0cETW1qCMzMi51sAEtCQgBrWkXrLANLHwoyDRItQ+1rap7rI8t+qvNry60GLMwJIezhTYXLly0ArQmqxiv3LDZKPSywzSqK2m2KLTvLA8twC94LA4loa1Tteoki6zAtNwoLjEGNaoywCzBrvcuqKm6sTmhZrPstAapVDAwMQWwxjIkKcktv7FAqWyu5DCnq0WwhDV0M7i1gq58nh0scLKlrYGwkbEuLkawg7TptdegRKhhrfKzpCJ7s8+1Raicq6Kvz61fsuEoxbHdIMYw27ZGKA200bAvtIArH7EqosYygjCsNJmswiQXtbsxsC6DMe8t6CyvrY41qrPKLSCtfLI7LlApjrQjtqosbTPgsAk50TUaNNu3TzBntWexFTIxLaWhQyoToHmvHrNLtPoqGSlTMviySiVULwytjTVaNoiyIBluLsqvd6qMreep5RzdLqcyFK4Xtl0yFC4nuEo2FK3FsfIufyfXqxWzlrUruUOlgzDtqFanXyiZrv+prLEpsA2x9AGhLMG3oipLsdEhYTGGMKKyJrAoqiWwg6dfrgMysLO8p8usNy9Uq76osy+zNH60ES3hrou0J7DgMTUytC0KNr8uri55rYwryKa3s9otUDPyNFw2RziErAWrFLRGKvap4iezOKIsWzQuNR6zEDGbs4MzJizSLQMtq6/9MvquwjCuNCQoZCiusnIu0rPPuLS0oqzXn3gs4ipmqR61UbAMKB2zNaT3mD8wgjgDt5E36CNsrzcyfBzuLd2x5bUrNBUo+q2oMHgwA7AeMy4pULVnMAGyKTV9LI+wWrV8sFYzlLLlrZ0vQDVDsYaoRTLkMJ40oiMntZyydiytqzei5q+WqlyyLrQLtqwvKypCsUuyJCumsoQ0q7blKnEyZrOZsZMwv6Zys8+rxa7+qTa27yUBraAx0bW3pz4yJi5Dpp0mLTCxq2Azpq5XNDSwgahLss8pm7EaNEwsH6lBNHGvSqnLNOc02Cn1L5kvcbEKsIyq6xomKtwoQq2oMEEsxai3MhesgrActDyzKKX0MtopXrOfJeowJynGsCU0+q1Xr5WzASgMMYqoZivbM0czprYYMwg28i2mNtcyN69kNJat/i6eNLwUL7UkMC0ytrLvsNik4ywtLSWnDqT7L+WzLLb4tSSmGSetNMKwnzH4MF8y67Dis30r9q6OrpesOixOM+WzNTHvriE4uCfHsASxkjTbND6vji2GKsGuwKxntJA0xS3DsDgxbTOKK0C0LrWFs3omi7exqu8gbDB1Mm60tbABNR6sTStmLY0qW6ZUqvaYVpC7tL2zR6jhsOU2QST2NQy2QrLNp4SpvjKGqZY0JilbsI4vbrbispckSDcZrWO2mDQKMq4yqi7asMInOykcsG+tbaj9NE8tRC4JlVYw1i0XLSWmi7JOrBeuM7O8rtQxPquUpUc3eq+pIBOlfTVcqTqn/RSuM1YqfbPUszOvireEJPAtIyhZthCw8zB5J0SumivCN0iiJLbjsMcx/K0CNCmw1zG0sAM2dCxmokCedZyqr6ax6az9s0wtNS6BMJmvJCaYuTYnFCtbMDExlK89o7Cg9KsEtVssPzKPq8ExDSpjIK4syiQ1NrEwwit9MrosOa2zKsIxBLUxMfcmJCpKrP2uPbdRr6yqVq3OroYx0TJaK6mhM6v6rBK1kKZwqpo4DjFatDqzNyf0LUuuC7JCrgC0/SqrJxe8CjECO6m17q28K9WshbGDNK4yLDBkLE82eiVzuewyfrb7tNYmTLLiqoquRDw2p1sf/LDSsYCsnLBLtx4vVys6qyenKCrirHSvXDW/rb81q6hysmGxN7d8Kiuw/qovJuAv3C9KtGOrobF3qYwsbjE7rvqpLiX8qZ61Ya5hrgK0frIes8QuLDYFLGGoNTSqqc8zUrF/Muup4qVcrSA4cSpaqwyx4h6mMTi0qq3SsjQ1vrPUpS2vvSaNDVEwGrEjLU8wxhzwMCCwr7BctWIubraFqSGjt65ZJVm0m6qgNX+1nDMtLNomvabdsZYp5zYELvGwkDRho8emLbCxNNKvkKxNtA6kyCi3MJ4iPrBloAI0vzRqsQ0xGKw5KheyrjF+J1itgDAnNIsxAqPzsVUutC9uraywcjWLMsK1lyXHMNkwb7TbLisxWrSRtICrgjOLKEyz3ynMtqaoFjUercQu/LBsrdQ1i6/Rq78y5DGQK4QxOqoGsTOxZi7QMIOwDDber7SyQTher2Mmu7QoLVWuLqzNN/ctEzKpsTs1ibhEMG6zBakItG81IDgcLyWyebDZMeIqxy24LFWmNipmI+Ckfa6esVirFi6yJmut7bB5p0iuFyk6oYckszMNqQEwqjP1tiQeMCoDpE6rWCwwMSOufK+rtziyWqzANImwm63BpNonUyT8rJUw9ygZLuWoZDLYMm0uPqilLi80o66WqX2xUjGKrRWzuivZpcUyKrKbMWym7rXrryGlijC+s9avyzlrsXGzpys0reqyJ6v6LBEtRzaNK+6snKzSLl802KyLNV6tgLSVJl6wnTKUKns0tKkSs4sslK3rLmcw/KqsMMSzsCpxLucyg6kHrhu0aDHxJDKyHbRrIf+jLKaiNKWrESznsWsrXrNbLYinWjTwKpQ3oanGlXUtYrUJs9kyjioiokw39q6+MVceMisQJw8uNq26MkC1uzBrND4lYzBZrwchvbUDM5AgqjCXs/UkSS3zsFeqerAFN92yUDbXquIs4rHUM2QrDaiNMt0pLSQtMDyoCixmKr+xnywbLyUxZDFIqkEePiAnqq0oRzDFLzqi167NtvOmO6jJrImwEK93szw23aRtrqQxSbJkMScwWyNbKJmu77EuL7MmNqSgqoaxWz2BJQ+1ILHONCeqkTSmq2wonag/NLMelCf4KkUuGaxDqXslSqhcMNKnwCk2tWSwub20oBsv/yxjNOOzxS6CrWKsHLT1Lzsw8K26LaSy+7Jlp7CqFTTeM60r9C01nWCsfSxBNMy0DzD+sP8nhCgcr/20sbCXrguy0Sp1I3AxMy0qMUir3atosUaomSohPQUtcK3/ttwrNSp4pkwuj7T2slEuOjDMvHUuCkANsmkRKC2whlQpWS6OLlwoiDAqNgEq17xJLDy7M7jarF60pSVprHc6HK0Kppitd6eCpXSwbLioKGyuKa0vsP+sYp8Hs2I0yLBKJGyyuqhHNMWm8bISJFa0lbZmnPcs6jSAsF41v62Hsa6xyjCLMFmttigMs3ouEbNKskExorEmosU10q26sFyvNbDyLR6lZSuHMH62WDGDMIMsHSTdNEy1/i77rkIxmS5gMwcphyprpGCtLDGjMnQ4mq0EMA4yuzP2Mr2sNDYftSk00y8iqwSuX6jfrNA0ZjEVM1W4UDEPtAipYLSptKkt3bJMsOO1dTNhLXOumLScrruteaW6rIWzRTAAtAety7U3tdsu5DZTNGGu6jQBLjIwJLfkLWg0HapRMNW0sLDVMjqt4jSANXQmpSYTpuk1YbHupoQ2JSZpNC8uEicQMMwpRDPiLswrjjTrsxWxcDNXs/Ot/zVssn8xu7Ids8YtJbDpnlIlKDfdr9kuma9FLBizDy4NNYO4GDKjrv0x0TFVMViocLZQsJ60QTBItKAw6rW8MpSs1aiYtHexI7CKLCsoAaciKSQuHCLqrW0werAmNIWsVp8/sVix9qjYrXerdbVjpqEnW6wxsaiz36+UsYCz3jEULVEt+7C2M5+rS7FlsNayTzPhqfEyPbFsqEov0S3Xljc0nKxCtagvdZkQMa+jJbF6tNkhM6wXtSI1rbGKLcq1qTGdLgKNrTMfpOQuabATMvovuCQWspCpOyuTNne00SoUsk0xoaeIrREw+iZZJvuxXDKOrwywfjbSrdOrBjfXtXy2rquDMOm1cDCzKiYoyzVQJ60xUbdkLe4vT7XPM4avca2snyqutDMMtMCh77OdNL80RzTsoYegHTSqKp0xX7BlMYkhQKSZLDop8CorOFI0RjRGL6M1njTjsh60bTaWpFUx67KVqxGwJqrjtX6tDzC4sDCwv6fJKucvLzIvMsazdq06tdiklKOqMjegQC7mq0EsA7Q4LHypMrRbq2u1q7MBtPc0GzUHs5ektjLGsMiwDzK4sz6u2apBLiitwbCxM7Yq4y7TMx+0Vy61qoYxG7GfpPex9iidrTUxAiyYqlmxliu4tCmrnix+Mtcy9Ch6MrCrpi6TtGsxgqvcMdwQoii7rVElMDCOqHi0QrMkLoMytzCWrXwxHjWBss4mQiJCpHYuOS7AMfeczjDNKS00ja0SNECrurNGKz8kCCvrsmg4b7OVqnizBjZ4sfIqgzUjqw41PzEALvIvijGBlfSzkS1/Kk0c7rA5rZotkCp2rJooFjBIMTmxsqyPM2ExFqupMqCtCCpttI+p1CxQqrKpVzDGMgExcq1IJU2unK6Pk262m7QktMWyi6s5sHGd1K8irFwuniCQMPC0rC1wqnCxjLANpq8uxzMPqhItezBnMEew6jQCLSInKybYMRU8qq4XsxKft7Q0sBksgSN0MKcq06xNMwOwgyq1NCKuoCyqNE0kNiF4r50soa22NdU0HDLNsvoufLL1MVavBjJ1MseuUikCqzGwmiwwM6AhmzHPsqGwXKoHqWssKhrxta80JjCuLxIoiqajt+imPaxitI4z97FTLmg1Sa5KsGU3ICy7NLwx36xBM2yudKuuNVEwdSxpMWk0n6x0tTC1da8IsMUqpygwsCglbrCltAyn4q1es54xPTKQr/mt2C+nrOMwADMWtNirrzYtrKsvzzHNLEWuZ7HrLiosD68rsjekcC5pqnq1uyuNMuuggzIdsWg0Lq55Jfwyui/Xsvqx/Kp4sPmz+x5vNWuumi3vMk0tKrAUsuSwEapzMwaiZSx8Il8gKaxoMDks963XtWo6dTCrNievrSzDq2ox6jpnKDythTQfMVouJab2KfsyhaUIMXOzUjSTrY2wWisyMxWuYazhnRgqeS0wssmuYC9Rrj2wCbCGnvmxcrBGMrqsq6nxNM4vNroLNQGyYKyyrR0tpKzVrT0vmq2BrEcsSTLvrc61LKoMNCy0o7JeL+Y2MiU+sXm59TAILzixvzn9s0Es8DWyOFSwMy/IppywFrD2MFcwLiwVuPUcfZs7s6CsArQprKIvLygiqKWsAawdneqvrDPer6Aqoi5+rYqowzF0M7u4Xiixkk4pKSGYsJQvX6hjrxS1Tji8sCOz6iovrC8gOjMvsWctUbCqsB0o1bQ4JJKmCzLlr0a2lC27MT4oXim+pSA0D7HWrAgwizFNMBqlFK+kMdAyrLF6sqetlyXlLQSvEbC/sSOwtyMdtWQmZaRmMuqubzA6odApLDGRsgO4xDJuNB4tOjROr0wxQK6jNeWspy3WMt0sSq4GNcQvtbG+sP6xjLANr62icayerh+twbG+MvcpEzQhsaYwfLItMDkx5TGArLQ0cTB6pQ40nS6DMIcxl5eBLZAqRioOJLgot7BQLtIxla+YI/qyQrITM1M1NLOBsuqzH6/jMSGny7TcsDC1gDAeLVG03S9rImYpry4FrsyuJ7ILr+0svTPtJEij4rFpLIgnrrT6sdspkym4KUizdjE/ssIsETAyJKExS6CosKCzSrSLKgsniTMFrQovn7L1r30wiq2uKBqoYaAotJIwhKRisSEv2jB0MSSsz6jOMM6vzqsIKZy0ITXArvAqZTGFts2py66NKbm0mTOQMNMjDqTEtmuzabCsrCWd1ab7M92xjDQhosqssaieLx8zWqcSL9cs/awiszO0AisBhCKtZqwUL2ooqSmPJIGt7S6BLbIwE7CFr1Q07CfDNA408S8qq4auQ7BYGCyuCbTYsEizcK5PqxQ1MykMNCu06DBiKcyuOxzQqr6yqy2oKWUwAav9tRwphLG4L7qyx6l1nXAiODQkMzCutzSPsnctIS/mMm8w4zPZsPulHy7NNLsrn7TwLk8kV6rErVGqPi1dopI2LCd4rbox9a5jM7mw1DaSrdWpWySLLQe0jzRuLrquoLS1qGYjiaUtNn0xE6O4rcutc7DNKPWt9K2qJ861b7D1sYIy0La9NFaue57GLrwmibXrn1K1HC+6MMqvzzEZrr8yRbOXMHIxfqmcNVYiyC50N9mpDq8KMcMtBKjBq+M1ja4ANMM0oK7DshatP69LtK2uCbJjMCGs4CswpBA1HixYNbakshxKtICqcqRiofKvcy5+NNgwN7GyLuMoT7WYsyewkLI5LkWy3qKXtDKzUy5Cqw0iR7FarvM0gzI8KkevmjCgoWUtDLN5rDmgbipltgOukTHPrFa0XqZoLOoeWrFErMyn/KdgNNuuIDbosYkxBLW/NhuvBLNXtXAxiy+jrbS1P6mIMWmyPzFTpRCxvS4NIDkuNRtCMMmzFzQfswm0GLKerli0ya8uLLYyETF5KGylnjR6scaq+jFxqt2rv6y+MA4ziLNZsFIy3DIYLg+0FjD2l7kxz63RtMIkYi7GrEuwiDHxOI0zObRLMDwqXinXLXGaa6kTrDktSKa0MwUgE7GfLGOvB6pYMKg0CjQ0tJ6g4jV7L7myJS9NMBwrJbhzrFIwJC3MJc2m6i3QKtOwaq8dqgSddrWBqzO186QgNdwyjSxsLoC2Si+mtEAwYirysnUxBSSrshSxiylXtJeyhzMAMlMzXR7WsI6oBC6JOB4r9LExKeEzXCTHn8Mh4Ku5LUc0+bCQKuUp4a0+Kl0sKi1lM0O2sDEXsS0zDqaOthSwhTBVqdecfimrmp8w2RX1qtQsQbFVJUesQzFANtqzlLPqrPkyZRdHtQk0rqmIsSwu9qhtMOOpBLaXHtKz/q+TsMAtCTRFrAC0ELC+r4yz9DKGKcqvWyLLsW00izbIL2EtvaPfrq4usypus2CsH6ewLikyXC1kuCIwP7Kws94xALfPL5s1Q7LQswm0aS2+q4uw9SeSMH2o866QtYc46i/ONvGytzA4qJgyxjiSG/MsnjjlNJ4vlS3wLgytnLJ/MYS1OTLNoKYv6aMDM0UhJy2QqvcrQSicHgOxRC0grvm0vrEltI2sBLa4MoUaMDAFNLCwWLhxM1axd7BPKOcwAp+VrWwyUCydsRAvhjNrtOi5Ey75Niu2c7Vpqe84CTERrjq7FzKhLg+0bDeurFMyijWNOACyEDAeLSCwvqnVKZEo9S0xuCmk0LJUtWqtvLNasRMroC1rK1musrETK7G0XDTXqw2q4THcMfMl/iwGN+C1+rCHKUivgSlXrVOvvrCpromwmjmzgxi3hCzmMyQwKbRvLbqpCjJFL9ywR7M9rDw0G7Bon5AzOiiQsaizea69Ndgo1DBSMnMxNK0hGU+1AzSnsSGuYzISLH4wvLX1rr6yuzMBtIU0GDHtM4Gz2LGMLGkwW7F+tCKoDK0cJ9418q4DrfMwX69+KFGiMLTJL0g0sDHNMOMxHDQhs6uyGqq9LEEz7rR9Mjatl7Mdm4MsdjV8pwS15y1kM/spd7SBsV40Y7JDMEKtOy31KyCqq7E8q5anhLDDtXayfi6TrhAnNa9vLLu0aTFRItKlBCdvtDuxHi6AH5Mxe6oBq3e1BLCuNLUsK7SHr50xZa4ErnIloTEJMBAurqTWL0+t8bEHryywcyKPsnQ2AjFjMs0laC37r9+p1S48stKytrKFNu2teKZxr6eqU6lHrm+yGrIGtTIvPLF0Lq4tWjDlsg8ucKmZstKm06TdLcozNjKXqGQiYrRsMD8ixy3PMQG1dC9EpRQtvTFOHYmsVDIFKVIw4CSiKiEx2jE1rRM0ejAfsOIxSLNtLXkwjy4sNR+vlTfBNO6w8bjrJ5cw7DAiLosxWLESKBcv4DMhsBSw2rUYoXQjkCSDt4W0TiTHLQIoRjI+uGoyXqITL2YwtKgnMRMsKTQvtTs08TJIp8M45DOQrXsxLrHILz6wlDBUsUu0hK4Dsf0sy7ATORQk7SydsfimEDXLMcupBau2rYOzjzHfs0o7WzWPIncslzR3LY425DpcLHSxjSsgNUYqmLI1Ne4xfi1PMTWybSytnDosIjM8MeW2IawBtoosR7KaKsWwDTWcMQk0IC7+MmOsuS0MqcEzZjQMNFaxWbleLlMtdrYGM+Y0TLRuMpgzuqwuNAK05aZDMIK3QajjKSe2Mbb5rd0uQ7POpsK3irIQNJ2vyTeurpsxyzXwMrOx4LFsJoIxlKR6tz2qizS1sH+yejDtqMIwNKhdt6Qx+aqwM66sgqmSr36xga4KJdUsjyEWmwKwmzFLKbKgpibXNDqsVCkeJ7Y0LbJ+qJsgOy0CMmgzxLRtqDcwxKJIM/egSrKzsJiwxC/1sDsrz7S9smcseS58KbctnSATtIWrl7Dqsq0s/CgCM5mvbKgpuPgtQTAqMXowhbjzNDiw+7KZJvmqQK37MMUwQa8xnkI4tzEMKiqwy7XNp5g2zKnFsDO0LbH8MjcsjS6dNN6zrKmzsjA0Aa5TLECumCSbqJc5LioFNvqxg6t2sOmv5qmcq9IyNyzSrFYs1rUgIdKxNrlbsnmwBq2eriotCa83tAAqDirQs7ArHq4cMFwqdS9aMQws5THfLcYmCDajsNKtl5qaKw6zjzZZNH8xVaZWNSQxNSHAtA0uRLBjKvQz/DYLMskpaymRMcCr/qyLHG+l2yllrKk0ty8kr9usmjictW81La1IsbOk6iw2O+4qt6qANSOYxSg4KgOpdbBhtIIgP59Np5gkcbFFsPsyyKz7KdAo87JuNIwwxCw1qfAoQahtKGCr8yJvnliJIK4JE4w4zCTotfQ2E65brYGhzyfBJywuIKWyqQ+uUzjBKOUmZbZJHMkvKLL2MPulDTe8MromGbk5LXkszCgFOx2voaXyND40I7BLKhazLa1nss8k7qnYqzm6H6odq4aowbKEsEgtva1Yq1uu6q5esEKuHqpGMAGxhTGVKlQzMbBSnN4ni7ioMr2wOyahsGCk3bDYLkmnHB+2OB4xNy9+rrKyUrTtLP2kGa7TtH0wBTSLMW4qE6IULzewea5zrn8tl6mLMCu1Ty2Ts2+wEa+MKeMzqjh9tAEnOaxvp2MxnqVoMmooHSxlsAo0nLbbssS4GDFuNZut8CboqYE0J7MUqZYaCrI+rNA1TCcVMNktCDUjqq8vu6+5sR+0UyZbILSy1y5PssSxoi+6MW+1SamWMEml/po3tdosOjS/tDCwWqQYpmQzRq/ILGao0a2tp0icS63pMH02pa2EsE6ohTFnLGs1QS54NruwpTC0sj4rYTLNMeY1bS/oqx6uP7D1oMk0fDU6rP6zVKniNs4kp573LBgg1q5vmG6tPiwdprezYDFos8Exyq6PrHcoXTDZmSGzpTEcszsyirfRqJY1XKNcpTqzZrN9sWK43Sw2IG4rVLFltLqtLKyepVu0NTF4n1usvKh/qNypb69Br+CzXDiMNX2xTK9qsIEtfrKGJsuxDKw1qTcmC7PGtFoxDLXQLT20UDGWmR+1TqgnpKIuWa0/tPokCzEFNWurrzaRNIasCLHMt+wx8Sc4KISwsCggqpSwzzYusFsuwbgwshqschxVsc0vC6jtsukshDjXHl6tFKhhsUC0ZyouLUypVrBALgExOysQqEiy4DB/rCsw07CaJDOvFTa3MZGwNrY/r6cyfi8in7CpPDJOqjUszKnoJpKx9bBjrUOxo7FHNTe1zSxzrBSjzbXPMvggMy47qUwwn6qCLgov1yhttH4s/bFgqdgzFrJVsOK1azEXsLCuqjIpKrwpTLTMN5216a9csewyMrJiIjgqpq5DtAcpFiYBLFeo1y61tagmuS/UM7UxNaWEpJOv+yopNCAu47QAsyCxQa8qKZIzrCqPsoQvbq8Dr9UkD58kpwsxILJfLFq0ibYerAowAzI6tlgu8yTBKYGvJ7RINkCoSTRgqryw1jfZNXOxrLGqrog0dDJGtKmuk62WsTuzPDEsMbW0ZDIwrMSxaLAWs68umbLSsKA3q6H5txGzkyvktcisci7RL8cpV7Mopnmu+qmEpeAzYChbrFmtf6kGKnC1x65ONCOq2KtMKVm1U6tuK5o1nDRyLiY09CjCKf2mqiu7sOyu+y3VqTotyyzoriUxqa1pOF8sFrDRsgcofbZwpQgy/S3QMnewQiAWm4EdSTVDLAS0RzKOL9UwZywFrvWxrDjfM1OyWDXpoYsxsK9+sA22PClyL7usdxeKLMQ1xascsGe1cCqhrSss+rKVpt4xl7SRMykzlbFopE80rydrLNKqVK8ctTuz6qw8r9Anq7CIKqmtdqmgKf+n4yanL2etdi4qNtKvFii+NGixRrUjLMMsQq6FsDCvxqzlsNup3S2GHxQoDTJ2L4wx0i/MqU0xGhwsprMm0DFhM82riLRwrmqnAS1tMm+kLK1BsL0lsq60M4ss9TB7MPkoSDOrrkEvrKzoKuqz4C8apFwvDrOZrSUdHbRAr7YoDSmYsUslWKabnc03DzEYqL0reLYZqO8uczE5HZC2ECs1sFQuXC/NqlIt0bOwpHkygivOqYQkHa/GMbUwYCwrpE02rq1hNX2w0CpcsZiqFrEYqI4oULDwsVmz8bHLqteveyjRLdGwfCaNK0gpXjSRs/yxt7DlLGKvC66+sfsrV6QAMcUuiDF5KhqwbqmhqRUyHyCeLF6eeCmvKcS1UTAEtF001K5jsPOeQjV6JyGi3i6UJmOvTywTNW6qL7KvMGc076z2srIyIC3YtXe0RLVXq+AzgzAjpMarWSjMMekuBzPsMiMskavDsPovFzBNG7svqbNnMwydga0EsI0yJLMXLCkylDLBKOmfHTSrrZ4nyLN6NO8sl6+QsAYlGyHsrC8wsq52L3+2JDIPJgswlR/mMaWxqSqBIbC0tDPfKgm2xanwonaxkrRnKpYuljJlsdswJzORM02vZqpGNACxIqXsJBUtmS9QLTuyy7BkNDau47R2rZAxSLNYMHokHysrKOCrQSFGqqOxfrVMMM6qSbMPrV6zZrBjLAa03TKyr/a3Ba4RNSmwqbQ0Mx0uW5nKqNK2ODKWILQwNbCQLtOuILG5sj6i6zHos7YsIbEvtBYvfylmqS43GrEgLAawMrEQK2+3bq0XNagyEqnMMfMwATIjrjGtxShvKrip3qSzi10r2yystVUmazKxrRUp/y2Ms1Q2BygTsKsvVK8mqZky67LIrK8uY7DjruSeA7PasAAuSLU8IRwzKi1SqZYyG6+Cs+kvO7N5KhGz96+hpRIxKTZksVmy2qU1skmswC4OMOiqv6liMWiepqrxq+azx6UnLm0zsyHfrk8w4jJEtI6zECnsGMqlJDEusgANMzPltvodZyfmLSEoFjaIsLGt8KwgNJUulq0sF+MyJi/Mp3up8yhrtHSyl68dtICwxTb+NeqyFzMtNTg2K7MSrdOzXrOasuytBrSwrmQr3a2hs0qrObJPMec1DKRiMG4sJzkIHK8rtSyOtVq1oiKLLtu5ezBDKoc4drh1Ls6pGLO7MAAuOKaknsewNq62tEaytS34MymxnrAfLCU13DNmLiC0za7lNHKk+TXAMtUrmLcZrAou9LTesE4yXjf4NOc0iS3+MbwthTSbNwQuHa6FtrUsb6pYNJwwPjQctEal/jKWsKov0S62NAGy/jBPONio37ZFqzkqv7YFr2koiK7oNVir9DD4rY0tkzPqOFUwlKRgnakrmbI7NbkyQy9dMwYxS7CWt5ebfLLcMw8wIqbRsCkyBS5KKXMeS68GsfCyfbQEKhM2DDBJMGEvVa9zLqgsIy5iNsKzkjWTL9Ss7rDSrLatKbPRqoK0AZiTsc6n7Kp+rS8puC0Bs9MzAq7qsGsw7Z0ptCkhYKp+rKGydrHXMTStdLivLa0z2Co1rxavS6zhLFidNzJwNWWxpC4RKUoyc7X+rzkyxqwsK0at1jE+pf0q5TA+t3wu17ATpxA0ojEuJDwqerAlNNstezTBLAAv/DBhJMituLFCsg0UwLAXLLKyfbXMsGIurCalrkwxvK6nsfA0BqtILoAoaq0tuBaqx7MFL18zLrX7LjIu0LVNqCQwzC7bKSIs1jK4MaYsKbEwtmEztSm6KSs0ITC1qgm1x60Bp/M1lzJoscSvaqz5sZOk4bU9s+Osn7TosfiyeK6nM3izOLRGLBU0A67orA+trDQ3qeEwNjE2NAArgjM/MO+wtrBrrCUqSa+lMXEwuS8BtSWsWTdYKEsd2rSdMK+0aKeVInurDBCAMFGp47CxNXwq4ai2MhwuSTMAsNA2ETTFMQ+oUiedMoYtErKUKs2utjISqq+sv7RpsVSzBAX3qmswd7gDtHWlMDLHr7ghjKrTMRElZLNsN6qpMyjhJJWtq7QGLqUz4S3fKuevM7SgLa60eSswLWQx4KN0rlMz8bSkHWAwrzULMVGoVDDuqt4zky8Pqzmwwi0EMWWpkigzsX4gcjCbNjCyeTHUqtIykyjoMwU0orK/JdwtfDGTKHgsOjDGsKywdLA4JwKz9rEBMyKxvbWQrcg5KLIZtQGwZ624GscnBTHLqPAiha4fKFotGjMtI120gTeMsxMS7bQBKaI0JbFcLvgslKjfmKiuQaeLrK0lNjGzMVk0V6CBLIeu2DMfNJouSytSqhovyrRDIWebqC79pcyV8rApMUiwNjKtMYIypzCjr2GwVCwnLZiyGpqSs56wdbB0JU6mra0bs1qgfSuML3eucDDXLo+pWa9LMG85CC1YtD0yRq4uqgwxby3JM72x5rCgJJc1a7RZL3oxwLOcMVOsUam/LFuYsTBtsSYvuTP/tJSp3CrOMYuy7KgKsICvUrSVsrM0p6whLRiyijFZs7u0w65Sr9A0nizhsDO3Ly1LGMQooLGLoHIwiyqltXoqUjMKLu0xrKpuuNM1XS69GIcw47PjrGgtACdSs06vZjTLr66xwzSzMrgxLSEPtPYxcJ4yNH8sEKyZsmwqUDGKMUwtxbQoIccqrC3GLQcwurCpLsatrbI5MIk0YKNOLkAyVTWwMyCwNS6tsEexyLFEo1mwuKjVr6+w9zCAMWSvOC+8slWseTTZM7EhyLUTsE00tajnsP4oMSv8Maerqa1eLDq0BKQ+MDMzwCwurrQgEaN+szMpVKn6rnu00DTpKs6yQixbqPmz5ig8NTIAjjNUMuql2C6BLkgx+DCvNYO0pChwqhE1dzIVt1kis6+ANCg2QTQGtLq0ALDfrQ0rFDRsK2UfcioUtlExdzAZtFoklqkqL1w0njKKtmwqsTPtMSOuHTTKsE8s0jD6ruO30zcer5AkhK+9rVOtvqXWLFQytjVDr1unZaVottqsVLZSqOwyY7Clr2c2n7EXJhkwnrE5tkSxAaHBq4kuwzGupwI1cLAnMZwWqzSssNu0bDMYLdUtaS9YoT+vIbJAsjUzaDRqqCos4jOltVg0Qyl7K0Uz7iwgJnKw0CXbs8IfxbA9soSucza+MFazJSv2LOmqBrN3oP0zQa7lsB00ZrLUsdwsODACNBSko695svWwRC45q3Y2jagZMYKvSC7qLaQuZqvPM7E2aTHvrCuuxrBpt50iGLVAt1eyU7edrWwybqmTqaS1EbQFMsGvzyczqTKxiqhcNMihurH2KaMzqq9asJ2s5TdfKCcsGzFBNaAsIaPzrx4xKzQbNZyqZDL9M3IvaSWMMNw05axlsE6um5eXKP2lKzAdNY2wirVmrFKyibXkqME0abJCKQAtjTOCoNegky4OqIAvkShSMoUxMjecoUwzpLIZsfewdKhatheu0C9EtfAqFLR8snStqS8RMqGjEjL2oaiy7KyaseEoXbVLN+AxkDP5tKcqlAvcr08wmTXINhu0uTIXsgkYSTetpjisTy1HoRcsmbIwsGGu97K3s3inY7GHHVq2mLWTrM2xAx9gmiA3VbQPpHctBbaXNI6oPC61Ncw0hqzWMmax/6cPNL2xZrXOMbwyK7gHsDGwta/KrM0tKTQjsCUzKqkIstCzGzCUtca0Jqy4s9+zji1fsjUxty7ALr8geDDqJlw0ETRxNdcyQLKbo1ArG61SqEw27SmtqByszShZLSMpPzBqsXIxMy62tJurqTIEtGCt+y86MBs4OaYKMJena518NcQusDAbt7ioOCpTOI8kOyQFrB+wwTm6H5mzFbHJNfuuADQBrLYoNaqRNH0SC6mjI7gv86xRpWmkVqwvMNCYuCc6tTiqfL73LEkwJi+HND2zEzAPrN2sJ7VhMMcta651L4mxDbIYrSym7TMjM5IsEi9woUGwPTBKNDC10y2Sq6ipWCgnsX63vrChrdSxcqdXLE0xCS9tMZqt3KuqsZOlxis+POgvBK8Etw0k0Cy3qHwtRLQNs0gwfS5ZvB4uBkDFsi6jXC1fqBwqVi53LpIsGzEEOO8m4rzmLSO5areKqca0F6jMqeU6HazDpVCtMKpgJXOtR7mPLLOhg6z1rAuuB6b2smE2Rq8/LCKzhKngqUCtzyhfKAq1ZZ04NXMt8ColsQck1S2usCAm+y/RsQUxdpgdr98wLq9snkkuLKxatZ0x9zSsMc2st7Guq+SynidBtDYjA7GTMck4wDNGrg2lejA/qdYr3hgrIdotG7CaqlCsHbLLs8mRDTCerZGsBTRRsP2vXq92srIyZbL3L5Qt+zROqcSudDGOrHU1uKaXMNQuW66BKvywjZ3VrNA1TDfNsDGwqS/zqhotQbGnJni2SCRWqUqiXqesL1ErlKTaMam0jzJUsmAyZDEGNAAyASqSpRixqik7MFMyVLC7stKzATT8sng75y0JLFk0DKUAsEqu6KTjNt8zRjJKNcQqBLEMs8SuGy0vqmQ4NDQosMeyc5j0tJgzSa23M8OygTSgLvYt37WbMaKv2TDlNaesOKeNpTM3da+VrbevLKQ/uE6YTDR/sDkvGKogNfoxoTRUrXKytblRsaKx06rNrXIudikRs34xMLOLmFkmkDQcrmcwUaias1msXyzRKTKxRDSJMvm3lLQ/reAxfrM/NYsqJCkENf0t0a+lMckxEDgOKBQ2RzKVMKewErQKM3MoAbRTsXk2eiqKpbQqSi01sTIrwrB1roqwj7MoLgu0RLEEtAGn2rCkLxqcA7SwNXYvRbBLsBY1FKiVK2K1h68RKBYtjDIXsREzhqMms3qxL7MzJPWxgi8lNN6vDagmsFQwwCKDMj+sazDRsVUqmil/oo8xUrUULI6pUrPhsJa0ba2qNFAuXyzIsIs2UBVWL8ItXyt5Lx2vSjQrtU4qe6ycsA+1dzdCNYssyrE5KrgyCq30MvKwS7JtsJ8wY54orsGyCaYhLGiuSbGkttWxtao8pD20C6c1Ko0wrK8iM2qyGLCANN+1O6hAsR43yi8WtD+3dLNJsEEsz7F8H4ihD6NMMiuyVSriMOanuy3XN/U0oSw7sh4wVjONLKQsY629KTUjTDIDMH0uY6h9sjMpyLQutdosljQHsDygOiunOpww2i25J+OyFDFxqA+pXSjIrxWwZTS/sMWrDq/uoJ0x1rATqQ0lOCkFK9e2/yqqsbIufjGEskE2ZCottF4yFClUJmkqrSr5MbI01yqKK9irLrAIMVgxKzDItCyyFS9dpdunoaU2swmlLTAvs8Iy4K2WLFyb47MdrIIpG60iMKi3XDL1JbcxJ7DfJ0auKLEkJRCl57BjMtIwF7W3L1ov0yd3sWsw4SuUMpey+imTrc4xAS6PMcs3AKtssfCnFKc9rZKsxSp5qq6x9KkSLCswUrUwsIssBSZmMI6xDiyhs8osQKwjlfss9iURrNYvmLRqr2kxOSa2MV43QTCotNiltbBTsc0xNbSLLAGurKx5NFwo1DBZLdok9rJnMCeleDDLtaA1PDYZo4Esei2DoFKygq5Zo5IwsCivoWC0tzApolwrsi7YsMixc7WNtPYqkjemsGQ1urEdKCOnVjHBMdYncbDeMMc1NzHCH68s2DLPKMOyGa2zLiQwfyuqLacpXbXbKemtZ6wLsuY0Lq8lMOi06LA5LM4uRzFhstQszSt9sDSsA7DaKgq1waWzNN0uri6htKcvgDCIMkMyhrA5Mz2sni+3sTG2ASlDLGW03bV5L7yd1y5Es9AprCjWJFQwHCfHs/Yxzi1BrbAtEq27svYxSzNULImvarYkthEvyDRLMGQgQzHGppIoYbDjsQkzWjG3Lk8sgzIqspk4VTAwti6tfiAOLGSshLeUKhKnbaGNtNisQbSyLkU0MjC7rUMu1LGStBSxoTHftEctILO6NG0ugy25qZC0tSr8sLMnsrWDNcqzUSsfL0I2HLJttXUr0SK7LH2soSY+MTqoZCrGKc4v1ysSLaSkEy8gstwtsJTxNAIy6623rXyx26y7J/gszKx7tD40p7DgqNOwxi9FqICyQzGAL7Mz1KiOqu2t+y0SpfKvT6ntLD4pe7C5qEe0Da7Wsiu0aS2gL0usvbCKqJgxHyeWsYWsrSkbKs6xCKpfKQq0NLL7rvquRDTXsj8z6CLguPMw+CgssggzDjQvLqau6LJFtlamli0dofQqBKaFMpS/LpNaNiUxFrPpqIe2LSsoLIqm7bOaFzuqJ60DpGkeOyqGqamoeK64LAuv6TaEMg48fC3XrUOpIrQ0NIesQy7KK1Qy1q52sRow2x3sMWs05ajjKgCyGLXFKB+sJqeTKJaxxbJSMnuxETTOsaCojh/SNAAq6y0UNGCwLiyLsXuoN7KRKwwv/Ct5MNejrLyjqHEtEzgWrIIi4iWssCw0eDLpqMmyQz3OrNq87i11IJqvUZ+noBCtkqz/m4ix0LaxsC49Nic4PZc3zS1SMbarKypfuvMu8yxBMP0k/yTAMpszE6U4MZIrCDA5MOuhEzRrr/4uM5poMUocSCw6qQKjKx1YrfKSki/FqRQylTEuLH8z/DC1rZex5bHnLLKzOTBfFTqt/i+CJIypOabxtLQwy6f8sJExXq1ZtJkscLGRrTqz4KeFr9kxeC+PMQqxLLLIshew1bM/qy2xKjDXrBWs/bPTrm0iIq3csf8qZrMhsEmvYJsJq1QmhbWhLc8w9axZtMuuTSE0MoEvo7Akq06xhTFHt2uudy2NsdQ0Na5urByiX6iCMncsqrSkoKApKC0MLEcw7C8Hnxs0VSy+NTaxyqipNZIzhi37pLys0rVAtII1SqKQMBuwNTJNsNUt7jLCuBowqTNiM1EltbCHMwOy/q7ys5W0Qi3lL7O1Hyx9M++vZTOqrOmt+TDprlk1xbgxsO4rFywrI6CttjGysCazkzFqlPEkAbRvMjOtJDCtsKYwiSWXrfuuRyBnM7Aw2i6DrVgtC6Zsr2CzETHsMLwt8qcOKywvdCassIGxRrX1sAKxlLdRLrolEzFkoF2tJC0atOsyB64Xtv43xzMQoR0xWK//rRa1rzPMq70w7rXsMmM0rzJ2pNkx2DV9snspIDJXMY+tQy1RriawS6jFHdwuDy5QrIQ1LClYs8UsByz4KkW0iiSjM3+sTySrsB6VTDAFthipOLCdokyvXjTYqWCzGaAuM4Su+Kx0pZewxa4cr9gxZarnq5ytYKmjMEQxNiLcLwA0h7FBsLAvUarSMxSvfjEGL0yu9zKcrQU4XjXDMksttjNILk8tpzNqqaMp3iaUKR2ztp2hnkwyLasctyQuditbqIuqiyb+LoapKqHkMqQsOTXGo6c0GLGBLbSxnjWOKZ+1+TbeqiYnE6lRM+AxFZ6AsqYpUTKkMtKtnqWBKBIwdrWFt9Mx/rEMNhskBDHbtlqrNqp8Myk4CKn5tT+tlSr6p8WtYzBHMGctTidLqq0qFrferzcnfi0XrqWxTi3CsxWczi6Pq0avU7W2p0Uxbix5kxGw8DO9oqglLLPStI6iHy2nr8gzxq1JMYwqrS8cJBY05DQNNK+f3qoQNDsyCbHDsiOyJbEaLfiskio5KawzCDTGse8rJjFgsfoxuDE6MAKtTq0YtAE16yevKyQyQqV7Kqm2xa/qryEx+jMHsN23IJxUOeesfK6PsrWwPjNlsvox3SUPsUA1iLCys1AySC3mLAw0nrTBsPwnizI2sQ0gzzTanluxDTZXMJI0Z6s4sD4wHp6+MQwn/CQos2YycDNuMBswEK3RrmSqpS05M6QyR6w9NY6pVSh2LNepZLE1LRgxBzT4McswczAntMQoMrKMrZyzwaybsJunAjT4MxCxMahhtQKwAjRqK3etS63hOQSo5a5htgk0DjP/L2eqTqAarq+tnyw+KSEw6CsQsEovtjFKMIC16qqmtVquWZ8ZNI8s6SgwKO6x+C/mL/atnjWQM9cx2aycKlgyEqZNMdS6HKyyKo4wMiantMAzdLIJJswsoKxaLRGvgyKmoZqvnzIFIvu1I7BotfssQy2aIMew27QkKA0xIi+9tuw2PywCLds07KRQtCcxJq8Jqlu2Pzmes00urDPftzwuRyoNNImqui7JNOwoMS2dtcAneq6Fts6kNTJMrA8w0DAys9Y0oKYGs0Cydq+OMG2dXzG0slsxW6s1MsSwOLQYLCW0TyHzLg8uKSaCMM+u77FWtGcwFrZrsviyMbAytOYuX7ACLxIzNiy4MJcsLbFDqwAq1Kx/NL2sMjElLNW0urRjrD+zFCvDr3QsOyz1s/4wuLJxLkIwMrKDN4En17YoLgoxFTKLsLmwpK5Cpq6uq67oJrO1qjXHLDQ0xRCVIyGvabNHsUswMaqEtaqwiKsDrKk0czAAJX4wSi/2MIIwliHXsEQyJzF5L9g0gDH7KeKsYrSXtssvxCw5tag4uCvEOC4ocaeTt/2qIzirN80sOCSDsferEqy6MPykjqDsMUSz9TWeMqWwk7LDtp+ixSgrLom1e7HWHiQhfrTqmpslHjZDLs+xIzf9tKAtfzD9sBitxzKmrCQtXbcbrnEz1K0qo8ik/iZusTWoEqnMLHc03yPAtAOlRzB1rMauTzU0NKQzoDR1qB8srypvLNQribdts36whySttDCiPaEHrViYZrRXMSAvcjKysAOyZSzUp2cxBiQYL7Ivky8vKMIhLyvVrcoz4bAoKB+ve6ayp7U0DynipicxCqkZLpOxgyV8MVAyA7MpMmU0VrYGLcAyFK+1stUykp1dtaowO7GdK+A0mK3uteKsXCqxJpy1p60sHIYxQClXMFajDTFvr9osKKjWtGsuGyx2tp+rQTHHMkArBjD3LUs3XTDYK7MpSTXmL98p2jEEryor5JxnpRK2Ca8/rZkuYKxqqEsWailPLyExLzBEsVOzCDVCLqwyRalIp1Qxu6uErhCwOzXesoC0zirxr12quzBsrQwuSyY5sFO0a6ZrKHq0K600rqWwpx61qh41Ezd5rse3CDMEtMI0ayhGrqatC7VqpC40LbSOtqsoMSP6pYWzGi1UMDErSapYsCKyHC2ZsAA2nKxAsR8tLjZ+r/yjgLDjMawxdaynH8+0Ayk8pIQk5C4vJQ40ZLIBNmipDrdasRwojjS/LumzGa/6tNmnCqw0rHAb3ioFp/iybyVANTExjq0LLkuyATKDqBIt8qlQtMssezUOJ2Svay7yLOCoBCurtCktf5tqmP01uzayLJ6yd7LTKDuwJax1KUQyAjJwsLSyW5JxLq2nNTElsSEmmjNKmc2xw7S/pL0sPTG+LCoy1avKq4Ey567jKs40RDhhubSqSSkfKHIpiysQNKM0BaWMrjkwzyimM4ymwifZtMCf97cgNVGrM6rruE803C58rf6t+zEzsfSZjan6KGO0wy8PLau2gS8eLAIsQ7KTMD6w97IitF+ysSlZr6Yl8LEhLZwyATCprrO0HSODtmQnXaBGNHcu57EMsR8zbrFbMIi0/zE8IVkysS81LzCrt6a0NhQxqjE0M9qsDLXVq9WnpzDcNOOhXSIvKX43LKxZNr4uC6gmrmKtZioArVwhxrDFs9g06jQeKQQtSCIupiy1p6x+sF2tAycNtKaUAiV7syu0RC3aqpYwejCEKFKt95xgsq6wGbcDMrWzYrTbJpi0ZrGIrucwXzTGrKK03aqys7y0rScYJgQx8zHoJwStLC/cMh820S3Ou08sniiorT002i6YpHCxm6TlKhOzwKL3MC6xXLAFLoKyUzdZKT0kDbD7o9wxVC/LKIqq2i1MressHaynMBWxHqzGrk6xMR0eMeu0oiC2KfwmnSsMNcEuwq2gGDGywS21sgImlawJsAexdaaktBy2erDPsrupgLQPNqCzSzP5LNUxnTMKLQ4O0637q/Q0gawSMvGto7ScsektdSvBuO2xQy4PrDKs0rDRrwChrLHrNI0wNSzMsQGu9K+DsGmzc7JvIY4xUjPHlPmp8RghomMueaBwsySqM7MmtPkk0Z/5sA6zorQHrUuwAi8sLqM0F65lIDkvzrHUMJgtaDKjsYIz1SxMLFmv/jK9M5CyFCmMskU00rDUrNivzymVtOoqgDO5r94v5ShJNc20vLLNsb2uhKZRrwcwNTGrNXSyNK1PMgWzki8SMREsBa/6s0Uzyi/cpZWxvrAqMdeccrD/qhCuDDBztjK0czB7KjqyO7J5p/ot7jKPKtg0mTMdpTexEzBONLAkyy85NO6rCrBJrIg2FarIssEwIzFQNTaqey6rNqk0PatXJ5+wcqtWsDstPCjHMqOuLjCHME4xb7DwL9Cc5BlVp1G1pDDjGSIyE7OSti8nczK+MEgkujPvLqc0HyhyMOY0Dys7qPaglyRanUulMquSJh8xWbE5LuAhsjAZsvAn2zMQqbyrZKJxMHA07SyotAMya65NMhYxaaamrV0uHKHGrpUzB7T8NUMutjUurG01kKlBIampIrBrIHE0PrIQLZ+0/K/uLOoy4SkNrwWsrpjIMRIq1q8JsKgwCLMVLQWusBuEMnGppLMMMJgptbJKtqCwPyY5sBiqMyqgLQuwx66EHKWm+ahIqXAtzzHsqoUqmSyerayxhrHJL4M2xrWwsGExoqzhsEmqXDUzL3qsajNfKzyyM7Imsh4rnDEZsGu1Py5INXykai/NJUM136W0qIutYbJ6sEIy/Ko5KaYrSymgsQkcUjTiN1yxYiuwMMCy56L4pywy+zELs4kxGDNfsJK2BKvQtWwkJKnirrkz3i+LsAc1Cazcr6+wWTIbNAiqYKjNMkcXp7AiNDU0RK6+L8ozzjHGsA2ytbL/sjEwtqxKsQs1zK0ttWy1higWMqSppiymso+p6Sy4n/syFzMmsm2mwiYesqwpwzCPMPWwKTJ4pHsxITPKtEoyEjFeL6Cuey07LzKvMTe2NJ2suqWonnCgtTK4r6ktyK5zou8fSiUxtZsvOzWPpUO0WCozrMAu2qNcLLcwMrJ/r+0sMrXwIig1aiqQNgWvlrImsu6yJyvjMlUxETUwMAa1+Km6rXmuLDGnqwstfzV3LlmyAquntfEmjq4NNCAyirT0so0tMTSJtCQzNrBDKI2ulCZrKDY0HDFrreUl9TK/LoAnBLEfJWsvwqffKeiqPLLyKYy1i6pgpfMs/DBUsK4pCi1nNFozSK8kMFmkGbGVKUSy8TP+t6+etix3MKwmQaeirYKzG6iTsRgwVbW+MKeu4C5GpRQlsTCrMfwQqq0ONFy1zi84socrb6n4sOWuxyllsocy7jIRMZUo8zRBM9izjzjhrQawhjQuHvE0vi5jIII4HKT/Lm4sKjDeNh8gnq9eODEtI7NzsRG1Qi3IsEswgbIwMcqzozaAAyCx/LBWNNSwnS6CsPmyoyhSNUYzXh2CMV+zeylMseo2uCyjsnUq7iVBMKuwt7BCI6UgMDUFNjSnZTZDmqI6qDDQNz8tcTBLNSQvRy44qNIx1DAmK7ugR6WLHdeq0iagrJi7FTSvML8lUrVpLhesA7W1nGe0nDEfLuGx/LDOpkAlN7a5uJS2AK4RNMe0Xak+OQo2BLX8KjuvoKn5tqw6VyfRNWGiLB9lrEmxVCpAMJMx9i9wLcwvArZkMCix76l9s8GvxLgnsC20yzB2Npsl37KEMTOg9i06MGEZv6GOND+0YjBHr9CuzLKTsEE0pzCKsBm5UTKJr5stqLUFLP60trNmMnOvSrEAMAO1HjMKNASymazJsAQ2z63YKuwlJrEqtPCoSipys4szdLCXMFwuZTBeqI+1HbiBNPeuurJfti0ixLWSMDMwt6zps3UvDzG+LJcwULEtsHQuBzEyLGeo0SsVNfqoEq+YpEQ03a/4Nqc1nTTXLF+0DrHksCY1kDVCL6Asvi2ULfOtMK6RM8MplLBatBI3Qy0GrXogtrHbtEEwdyY1qZutay0ZNVepsK1crUUy75q7siw1zbLLNPecZCzJKtI12qfvMyeztJ6sL9qqUK+iMOQom652sWAkUrAYNvclJbGLLh+uWTRQroq0OjVzs0gkfbMXM7gsG7BusOaoVDOas9i0US7mtFyx7K+ZtOI08zSNtGa0iqiVtccwg7RJNNCqCbSKsMYworJpstKwnKhNK8Cux7GSK78z47IhMLay0LC9MP4wVjX+NCMz1CxsLWGv4bIGtFUoUqrqsaSueSw0rpG0RieLNDSt6DDmMyYjvbFrsfmebTBorICrSTEaqdkuW7ENMpCz0Cs2rB+ykSxZNAkwlKeEpggomzHUpbMsKK8CL+CxTDPasc4qeTU3LNw0vrM5sQmmsSemISEu/zWsqHC3NyFEMN4s3aGcNAwqSy2Is/S0mCiIsZUedzIqNYGzdLiIsjoo8DBlL2S2Gy9eLXstIrRPtm6dhS8ar7UytK+DqR+qk7FhMSI2pbWpq+aQ9jJLsHiv2KF+rwgptaOVqjWlazcOLiEvczX9MnG22LJ7tIox0rSusp+rYrRFLgOx9CMtMO6tu6kCN9kyty4FKC8tPTHSsf4dPbR1pXozcLFTqr+rprEiLQqkcCSBMGQqIC0btZovhK43MYsxIzYXsrWzxS3eM8cy+JbvKrKnlKn7oaiuVLROnPIr3CRxLtOXKTDApcsnXbU5MkwvAaHILHuyeqZgr/M2BjQDLxscdzPFmnchgrdvLGYy9LV3s66qT6rPLDcoiS1jsuUtVDQ8tEi04bjIrtA1/C/qLSEPTjIMLQI0pLRNquay37MZrtc1AzKcqtQxozTdN80rwbFWrUQ3ZzPXLs8pUC/6rwotGrW0m4QvM6+YNdgtXSyAs5qwVraZqAKyQ7gQoRsxdbHHteg12THNMaWnHLC9MpKx+zXnqoA2KTBsry4xly0jLniyUS3PMZ2x3rOONtsxZ6x/Mjmtd7FttGon8jQlsa8yfDP7nOisXy9JNIss56tMtXyrvSxztUexkaA/Lp00M7RTrxmm3iukly+5gCxyHSiwWTWiKhAx0q0WMAKzPauqqAEpYrJNNe+0HTXrsrGt/7T1rFG2l7N5p40qbbSwsHknIyu8sL8hLitFtry0taQkK0y2WjRaMMixMrS2J3W0ZChoMww0iDRONOMuZiz3Mm4lEDMnraypwagLr9UpVS1jKk60L7AQMIIlq6awtFWyabQLqTipsan/MLmypTFtKmysX6guL2A2RzEoLQszXjUZuIoxAjRZMCuoWSofKyy1JKVKtDmzzypJrD4tWLNoMcanga3xoc2zf6cErT0t0bXEqSIl5rXwMqEyCjC7M8soSCyOMa0zQS2eswGuSTHlq/QsN7PKo4MyBp8YsZQirTQ/pDAy2TQzsaetNqdyJaIwX66LsCuxGaG7MH2gf7EttakvCC14qyKvdKYSM4cwwiwQLmClYjA7sYo5tJ8rtVqxUSsKMnI2/yy/s1I0JzCgrxqw6DChsRkusqvqLwgzNCxTo2E05rYEtDK4g7NaJK0r8zPfsSuj5ifTlou0GDEeMNWtQ6YJriGynTCFstkxtzI8pCqhVS1EscgxnCa3scQzebQfNuomYDRQsIIxPBzQsDkuKrQaNAYuVzJ+rGaxpS3SqqGwGjj/qGu0g7AMMCqpp6qpNQ2serKgKUw0O7esMiQ3561hMrIo2ykHsPSteaa3rJ8yrywpMEu5ga5HuI+0hCmTLT6uwy5QNuapXqA3qM6rraoWtJsuGa0ytJcxVK0ktq0sG7XHJRWygSJIscIjf6+jtPSserHYlOmvNC0hMSapDaKanCcwLyXhs1urqTLNq0ss06/6KIOtCbXStposTzGZNxKxyjKAsMowVi8FpLwx5zLZNFKxwDZNs+OslrbUMNI2cK4rKK2xbDXSskqooDMttJguaDcDLowsKKYOMiEy/ai6rYG0patmtcWq66cQKRqt1LIJp/8wzLUCLwykeC9eLEK0OzErNaWsqLF9ElamKSSasQ0tUq4XqTm1ciNLNIukiDHcsH2rNC7fNW8wODdEM9EwJrGXJN+yBK4rKQIxazYeMDay5C9WrditVafNMoesrLD7tAE4wzX/tNAzeDDetaWqjqgfoq8we7bpKZqy/bRdKCW2R7BHN+01LbEFnZEyOrUfnhC3WChptQGhcy0/sz602zGwqho01jRKqhO0A7MTMauuADYZLiQw0bFtLbAr1C8WrjEo7C6TqFOozihQsRK3zy8Pt7q2vbWqq5yzfai3LOmzj6+QrigxnaGXsOivqxkKKAUy6ahVsAAxtzdisbSyqJgQN78tCjBzOHoukzKFsiKqeaqDMgYvi6sZMpE4HjQ4K24oEDXoL8S2drVhNroyk6tyHtowi7WeswmtuSRRswgxwTLkrxuvtS29IgGyT6/qMievYzUtMSAwPS+mOE0vUzQKse6q36sMpniyFC0qpG2zbLAHrcC0DzOUNWY1Z7YlrOcvDCRWsZKvLaYeJ7I4djAGMMi1PK7StEQ4hS++M2YzDC6tKEooyDEarOssFSSvqRGynyEZMbgffyuCtaoksLGhMp8snqDHt3EveCexrh2wJTIntRAzR7A5MZCoWDFlNmez6DRAsrY28bLzLK00PSl8H9a0k6Z0tlyvPjQar28soa3ZL3KxiDTOMYYjsKNer7Mx16U4sJuru7KMs/K2iTK9NBMtM6WRHSqhaCaYN/CzM64AshywLqljMPuvirTONdirJq9qrCMuwrFQJBKb4DIuJHqt9LI1MMCkta/QJCSwT7CDNCcxCreIJ2qtEq7Xr/KwOTPSsTUgU666MNEp4TSgrjas4a0rssIeeSuHt+yyVrDSJrAx/SxxqVytxa/oK6axe6pNsRe0MzAPkSmv6LMJJYmm+aVjMrWwvDTKtKoub6/npFqzoTX4oq2sPTAuNl40ky2rr7atiaz4N7WdkLD7LSmsSjSVn+wwDSuwk4Mwhi5HNDao4DHrtDWpUa6/NP4yFC4PH4+vMjJss+WoXrXxMZ8vgzFoNJizFae0LJOyqLBBtbgrSSXaIuCpt7ZNEIuxoLX7KWesTjMgs9QxCq9EKcQwjSyULjk2d6q6H1qocq4ttBA2yaY/MDsqUDTaMHK3AKxCMD+qyC1yNAov6CwHMsElhzWXLBErFifIs6wy8bbwNNYq+TPfrrkuZx+Zsf0wTyD7s48xVrHYMX+x+LCRL7Gm9iatrXwqw7KTNYQyOTVENbEwAa7fs5IzQzVULZiuhDNKLMKsKzfAMPmp6TVNpv+w5a6drmIxNx1lKDQtRLRZsgc0Dy3lLxwu0Kxeq+QllapQNA0ofK00MNczJDRito+rl67Ns22qdDWjtBug/BRWMW4vBzEWqCOyVzS+rSizR7GtOFmtkre7rOcwDLcas2mw3a07qOOo9zM9lZypPjZQMVE26DOIK3Isu69bL1G2AK/kKrCrGKFMtMQ0xypHL+8w1KPlMDQwC7aBNEWtvi6CLkuwg7RtM9ixVa6Zqocxf6qksf8v+alcrA2wvTRFteMyn6xps+GyxC7UMmUzyTGBMI8xfqlAs6QzEbBIrOgtPrjDLVM0qy8GMiavyC2BoTCtIy0HoACycaXerkysFrGtsEerojTqpRQyELOqswsySiQWspgwHq8UMrWxXjYLNoI1D6NsMiQv7THepyWvn5xiJEQv8yi3MHqwJC0RL98lljAIL2euxTGWrUowy6rzJ2EhnDCzMFkot7BeLZ20GK8SrVqxR7B/lb2nSLVytFyqUTK4qrGymTNbKA0xgDWcrNsxTbcDNHGsP6wHsLIrZ7aMtBe0RivIrlywXbRUmn6nTC2eL7qyl7RdMSYxmrABONwqfbNzLeI0HCzTKZUmojNlNBerOyrbsnePgauSsh4xTysgqWG28LHttf62NDBlrn81TTSqrdikD6xuMTKxrbYzuCk2nCrEtGKyBSywKKOwdagPtrEvhLSFMmA2BrfvJgWrWaBPtV8t9jPOr/m0v6/vMBsz/Kw4tTYvODR4K7MofB5asiS2b7RbsVk4IKkwteKwXrQYL7Gp2y/vKMSxQbUMrsAyMivNNraz0rFpNv8xQC5DthC1u7UYsqYyM7A1tq0r7SQDpnExFKBQs7wycLDFsRcxHDA2J0itYjIUuR6sEbVTsqI0ALWjrWqwkbJvMl2vZKpPtN00fi27r1KsVTUfIO+1HLHOtSmpHRkLJ+CyACwEqXIwWapSMTcwHyo/tPAk+DCmpTEplSjXsp2xvjATtvixPjALq4wzhLX7MkKwP7p+rHovxy37r7WqpSiUM5MmaS5es64s1C0ds5CvfbGHrZwpTTRWtyM2myQ2Ndg48zClqfMwUCh6sN6s5TFmsTgxmSgTtIEx0q2iIl2wjyrUMFsz87SJs7kvdTJrIzSpL7GVNEM0VTKQKXw0l7Lwrf20obEfsZi18qN4s421WKssMeSx2KwLMEuS8BLCLcyxoqw2MBUz+6mXtmKwC7gyskmzK7MwtbesVyZqNIS3IrSatGiyuSUSMwKyGKm7proqrTR4I963CTE6qroxeyqfNYS0Da+pttGs0rB+Ls8wy7N0N9sqIq3iMgy0zzX+JbYwKTWQtRGzH6GPtZCzGSB7qfIzWawmtCmwKK8otoqo2TPKt5Yc/K+ltR6tvDRBMkquvjA+pZ8tN7L6qUQ0drKPtjCwhChOtq6rZKZILXO05rJ0NG+tgjNurw2wLSy+MpW32bR/GIMzqLQyrgm0sTGPNS4037CEtcWoFTNTNFgx4KF2oSGklq/IrWMt+DXIMHafmqevptcxla08LZKwSS2RML6ufisuLiWz0LGksCkiYyk6K1kysyf/tmEzDK0oqF2lM6lCphM16SRmLcAxOCnDNHiwOrF5Ly6oWK8ILvqyQDSmLLU39SrhrJsiWzCxsjw44K6Jsa8yoyoqMl2wg7KqtJStbTXVNmA0srBDpmOxAKNXtfuspSqQoB83rzQBsUstoSNSNtUxsTbmJu8xLKdtMQapj7AVrJyjLTN/qYAxkDCNsaMjXp1ltpMcIa42ML2kFbJ+qwC4pK4kqaY0YywVKjekRqyBrSyvhSMALLOxmTGXthKtVDZ6M4i2LCJMsNGwDCK9N0w01iV8MOWyOKbBtnqoLq+qtnWuy67rMlC11i67rK+xb7X7IjCz9q8Mt9GptrJatdopCTWtspmn9DSFJPAmZDRptdOf0amjJdEvoTE0sfuv5apXrsS3nbLbtSsydrDOqaSwVLj8sfwxe7hLtfqwsqiLp0itzigMri0sYLARJQCz86K5tPIynK0TMAm0kDBELLw2FawzLC4nU6njMa8yxDVVs6shDLJEtQgzdzfqsO0ylCxKpKKyri1GMrMqKq7BIlwoHK7Bogo3qLH5suwxtjimrW2yYrD2LLg2GKyaNEM25LkBLrCxibFrtjGUBah+oO8wKqg1L2WlXakxOAQuyCU8NbwsCzBXJWUsWKAVrJkuuTDoJKgzmK0Bq1irGbJTsVmtA7SxtNYywjIwqa6teDHSrWQyNTM4M+wkI7qyK0UzyjN+tmKw/DLOtwStfDE7M8Y0zrOfM/S0BTSvrx02LLdJqw0w0y8TrG0mJzAhK3k15q44tGWz3qz/srMr57MzMT60LKZaseYvtzBUsAEtkDFiNMOtfrUquNeqtLUyL6G5mS3/sjix8yUEs9UoeyhjL1a0m56Vsw2nrZ0zpi+xK6qbK6A3CLI9srQqZTjAshM0gTY3JNw1OqqusPA21RXGKgYvNjN6NVoowCsNse0yDjHJtoeyjjS2uKorDiwaNH+5LqgptDCrra17M8kpOLKOsVwg+bP/r6yorirusVIxIx0/slkvujnCMQEzaLhosRcrKDOhqXCdPLXFsG8mpSJItQUuzSyHtKw01K30sliwezQ+rDi1K7VtNPkfj7EbtCcyOrRiOo+vLDT2NBmqObZyL1+labSArIAxbjC3K3+wMLIhp2KxWTN/tDc1H7RcLNG0ySsMsh22JDHSNcm1zjN5Nba5xKILrWA3IDT6Le0u+DVzMWyuEDarM4M1YzV7Nkw2/zZssD8w6buoLTsgGy5OMDA0nqjhLio0oraVsYQ036zErZ4yybD4KpoXkjXlKps0iC65sj40KKAftQm4RSoJMIMmSCm1taWuOTXtr521fDBBLgWuJDq4tBk2OjBPMaI4DDLvtr+fkLESMVCwNS0QsQ21rTIKMnYruraEMEezM6yToCgwkTAbs9AwjSZAo8EnWK6gspOxWS7JLAqt4y5SHeK3dC/jL94rLy4KIoU00DCUrSQp/61sMVKz7ykJLxkwiTBquXax37KhNHsma6yYLRorSLN6qxyv8DQfMg62Hi6ptaic7zZqsKqsV7ILLfIpNTFxtSwvIzHLMryqUDG4JUas5q+9nnyv+jXzsTI0SjGdqAcu+iagqG2wZLQzMA00US+Hsr6mX7Gosfou9q6NrdEtfSrvsK0hZKj+sf6267KyLIGkQ6qVqGM0Q6a1M8cjji5NMl6zCq+bNb4oQTCFMe0owbYyKXU1fa9nteGu3zDUtfCvvimSMbsjFyh6ISg0KKnwIYyy4i3jqTGevCN0MfUuF65ZMUGtxajfp/opFCKHNFo0RSz4uYCxq7E8txetUqg0KWQz4yw3r0cxtq9FqNmwDzVgMOovebTPMw6evqzdqCU0n6bbsFKiWTG5MpMteqhwoeeyYKZvMMa1urHpKpWnVDUhq/y38bEkLvWz5qbCLDY0A6UjNNmxQjdEJt6v8zLuqYEoMCzDJ+s2GzLWrYqcWjNtNH0unijrtWgpdrIHsMwtejIjM8OlajI0OGk0SbDOpsivBbQ6KMYyU6dBLa6uEbGiMkcq0K02LqArlqg0MjY2FzPqsa0mpy+9Mt6yxzNwNYmsZqjGpbKj87Lltb0pKLHALT6wYKtlrQKvsRnppI0qLrK6rwe4UzQWsaMmCidtL08h3axWqRWkebH4sDAz9S3Lpx+w8DE/rDUrmTFAMTSyYrYBM0KyIq1Mqpqz17bLLn2ob6S1NpUpbDOsqXW3dqvLMVkxizCmtJIxNjddFdwwqrGDGvyyLLXPstqyVZ5aK/swATMWNGotrjGErOswwS94qLYnurBGNBS2oLHnIIOwCLJWuEQkHxY5Lj8xybRBsiIw/LI2sl2p1a7HKvq3cjQhpaEwzxyHrIGvaS5JOCmwnDHksQO3KKPLrKQzti5kNSotOqG3M6E2yagjLPazaCjhq/sspDGDLkku8Cb+rLiw1qtYrx40DLp0rxQ4JjW4oGywp7ZzLnEoDLAks8auRK4+s54v/K0pLmwo5az9qK8aBxwgMaE26zUPLq0tranJJxk1BSwXMYwwg6/fszSzBqYAMyIzxy7EqV0uEq+EKFstWq8sos8koDCkrlQtCbMkNTO4ii2tJY0xJTBZMUg0c7FdMcOx9rJ8qoAt663xKqMw2aJHuvYsNTOfNGqwRypeLjuxtTRlNHgwSLakOs6sB7hZMQyjWbLKsckuOawXrkUwrLFNs6KvXDuKMLE7qjYwq/EypS2/MK25lydnrUI0WLBQLZUuBrTmrKEtSKkYMJszcKthM+0r4zB5Kyc0Pi2IsSW0jS0BNF6wFjTDML4vry4bq/K0DDLyMV61mzActE2rfSyqNFKwLDFUsXcvc6w/sGSu5zSrGfWxsqPRHfkjlaHTNE8fVzQgte43K63aMAG07zC0snkenra2pOievjENNA202jexMA8yTK3vsYscNKznnb40bzK0r52xmTF1MRS2vxu1MCauWKdgKFk1QiP+ogI2JC8rs4czcKsZqgciyqUjriAyRqbzM4qw5STwKIwnhTKuM9exUJhpMXYqLjdjKlCx9DJAqBmp6bWSMPy3QqjQqUA2nJ30IRcwnjJnKWmtIa/dJBuoObTwK/u1PSZJMKKsKbOkp8U0Q6xcMOmygJhFtee0Zi92rCgoRzYTMPYmLqhRMRuvsTJ4NAGxVrXJKaKwpqekt14wSSw1q8yuJ7NDsUQxS7LYthg0ADR4sC4hhbbkLfeyX60gMlwxMi6kLA2pDLYEKMe0Kq1KshKt3i7Qo8OwKCwBq6iyczBktOoteyADqDMtYa/Vr5w25bOUspwxWjDErLsfzyygMseohi+0MQUziLLMsEWuIRi1JzI04rSGpBqsjS3VsmUs1rUSsFaqdi6StWGxlzB3ofSoxy8UtN8xOiSmtNU0KS7mn12qNh0Os/4tdDNqMqytXJyLst80ZLLSrSYtri2TLrax+TJ2t8exJzDRNCYvUC5YsJypECHyJ7kwgCvjMZCwGLXVJMc17bhxLxewOrJhMS+uvzbHMTgvEzjroMgrQi7kKm6xvLTsJjEyECMFsaC2HyvtM3Czj65CN1KwBinuKA8ta7HKo68xx661nbWvozM2rLkpqi4PNg2lCLArNX6vKStJqPmsXTQoNA2zO6xZsY4317ElqbqyibEvsPuyCjN9Jw454CtHIAC5ha9xrVw08DQCLEat9LGRNgI0rSLdKRIzPKtEr3miIq2suEmy5izCMD2oVLAQMFqyHa+Zsdwp26uQKC0puzJloqOt+qRJNhK0/rIVsrixrzN6tRsc46hdHUOzSzEJrNgtPi7OMkM0Aq8VrKMt3q0ANfcxEDE/n6MquLZjrz8vIjYSLissrLFnseawmK3aNLAyAS8HNt2xRrP6MTUppqhJL70s2DAEpFOhmLF6LUm0rzPNrXSmMK9fMQazqbLZKHwxdzC1sAAqYzM1qrg2C6zyqOgu8iJxrs2hTbFftDAx6a6PMtcxHjhcrgGyArRIpEqwEq77LogsnKu8IWCry69FLZu1WjUjNTWv1qmbrdEt3S0oJm2zkrLBM78wDq5grkIygS+6s3y1mjHLGsCuardsqfKk2jIDr0Is/jX+KworZTYJKoYyei4jLQK2dS63NQ62nrCmrDim8a6FLhssKy7drnSyK6u/LxArS7gQNRIywzcPLH+3fbd0Mk0sUbPSq4i0HzIUK5k3Bi54sZcsGqOzGzM0Q7WotFQzmDGQNPqyQi1Wqr6uMTJ0NvexbapUtDC12LHHLeKsr68cNUE0YTGxMjQp7TD5MOgycTWUNGQl37PILxspdjUyLEcyvjKQrCSkaKicMYUukDBMsSMwLK93M2GuirOisJaxZa4/svQvVa1vrNYo2aSKtiywTigatOO0Q6Wztvivli57L520TCk4r8+p2bH6NVuvezh+sj4q+LDXsZIxTyxmMYY12C/zqC6tCzWPsSsyLa1VKI+vHi3csrA167OWtDqrODRFtkmrRDROMJkySTjct5Im9KwMtOSxfaz6MhswRaETsYuwrjQtqoaxdaw+rlgueLJ2sMUyl7NKNBqy+S1nq4u0JK09NEY0f7CiNPsuMqmrq/AyWjN8oxCwzDJ2NO4w7zKVqbgp/DP9tlImL6y0KU8zIiw0qCEovyw3s2So0bHYL80ujLKhr7UsVikEMGKj2SyONNusUyU7sH2wnBgishIoqDe1JT0oQzDwMUexe6B6MVi0WzKBrmeveqktIi4i9S3PpY+zea0TrBisR7AbHswvmjDkswqlrKQvNMWq3bKlJ5axPi6VLZQxqy+Ws5mkVLA+KhAvG6yrMAYvhLNWK/0j7bOrMx6oGzHENGYoXrBxMVovz6xGsvqoKTDYoHeuLLMmtDI0JKnHMi+1xDHnrK8x8bYiqpAueLYhsyGi8bD0svwjkjMHnZuxAqd1KbihybBoLVqmnDPdLEw1MDWKMAuyrjM2MDetoaMWK6owTqvtsmem6zJELJQz3y8VMm017zDnMmAp4yyGM5oyTaonpqy0UjHKsMAxlY/3rO8cLLOwIL2mZS22rRCtBDYZsouwYqGSMg8wQbAhr2C1+7P6MI4whjEmLyCxj7NWtJ40wDOpsKkpzrCBrt6xOrAvLuQwSC/2r5C11KTZLXKsFi3JsSSuU7F1ruowbJ2op5gt4KdpMEMqODbisCgzW6qWLzwuETYtIjGwmzR6IUCupygcs/y04iqlMWChrzBQtmwz9LITqK+xTjUDKW6kBJ80sic0JTVfNdkkeyx+sDYrfbR5Nskt9LGlJossNjUvrwK2trRmMos0/DV6Lx02K7TmOLovmjUarS6hqTb0rOEynK+YNcWweK9wNQ4kVSpEIRAuQaWOt9022Jx8qiW0kzB3pVclQ6RWtMuqBDBlqycwx66pqTK3QLWKsV4wYjcUsdWxwzXRN0Ol4zeZsoCyV7MqOLIwQzaoMYOuRy/7sDI0XSxJMTkvdiybLgopcTBBqnCgDKzPr6O2vK5Ctp01tTYZINm1ei6KMA0xry3zqJmxeC1DqJcsUSSxsAqkUK6uKUauwLCTrY+0AzXaL0ivNKodsMylL7aLtBoxhakksSMm+iohopcqULChINysvZOdtAatbrIjsnc2O6+MMNMuGjF8sDco+qKPoQm2rrAisYiuz6+vMBGuJzRFsjUchDZ9sEoq2C/rHT+1CawLNbKvWDLEruS0mjTEKDCm1rEaM6k1ALPTNc+0oqiTslI17ZzlINyw/Lc+kjwm567GsV0rJTS3pKCr8LJOMwEyCrIZOGuxELAQNb2ZsDQarhQ4ji8isaYsNaKYMrmyEixmMuYqujBatO4s+LEINC81uy1Rq7EZEjDNI+qu/TOyppeq9LWutBivEjUXrUMrvLGvL6qyejRCNQIg7jKbqFyp4bLXLHox6S3ssEWwq7E2MTkmbTMzM2yylq+3sjmzZzMiNNiytDVpLp4vPaf9GsYsAC29rqIscDF/MLKYdDF+qcUtoLQTseIsdqkTMtg0B7LLtV4xQLRGqgayfTC9rW8tCyGDs9wphTKwL/GyRzAIMLQZ4LGXJigrr7EDMEI0YC0FMGu046lgMzOojTNntMgwubO5M0K0lbXXpCQhfLaCtLCuE7Kvrraw5jIWL+MsETS+pE20jzJCIMOyXyJDtNexkjP1NbIxbR8Rrv2zmDIfNVoufLEULy8t0670r1Cu5qYgNk8ofjL7Mly2qaBzs6kyKSJfM82pfiPdsnc12C2qqE8zVLb/KsgpS7NRNFciErRIJUqvPy1vM6el2Ch0MmK2irizrb8kB6utoTE0XCZIuE4frTVuuMewrDHprJWx2bDUsssrgSpELBuuiyL7qZmypLKwr8orxqJ6qK+zTS0zM7QxL69ZKQawUS/zMWW1qq8mqyc0YzGyLLswMilrshKgAqxcLdq0e6eBHxGpfjUjsq+d6TCdL3W0iDO2MRAwkjTKMbSqHzLFr42o2K47Hz8x0ClzMGCpHayjsT2q+7CFqucwBjG4MQ81Pymaq+svqbNEuea02LJTMhy1JK03NIWyZqzCrkiuOq/ZNd6qnizirICwziUxJLQ1XjS8Mz23HDKAqcSvErK/tLC2QbeFqmEygC9fNEE4u6C4rFGq0KMstCe0VLNQNMUxwrcCLCarfy5Ut78kKbBHrjW0CDB9r+Gsta2HrRC3i7aEKoe1prQgtSMj4zglMvumgC93tCetZzGMs36soypdrNypcjDKrvcshTZzL/Q1UTZQMViw+jR+rMw4JLOZrYgqsLMpsk4siCU/tgozITTxrjy3XzD/MqEkKTPlLcYyBLULMDy2lix6NLo08SWWtAyp1h/dtcgkzqKDNC6wVbBUrPCsNLTcMs0niK43MYgoeaR8GRWxY7HksgQs0K0PscEtxjCYtBGmpqSAoOEwDjILLmGtDyx8NZGyMjTypUAwgrFeIZ4wxyJitGcsDiuyMI2zYCvTMA+skidsKHaVrihwLcmyHzPmspcwybNQMaSwnKcUtDUvhSS8s1asZqx4sBAuorB0ngwrsCrpJGG1P6tOrTm08zFHrFC3N7Q3nCat2ahPMR40RqsCsyQs9jK3tHw1fTBSNyKwbK4ysu2wurG1KXU1xjT8JtK0TDAOqpw0vKj1rGYsKaQMqP6pxSyMMCo0LbP4LXuvZ7CptOMuAbCGqnGtKjRDMpgsijP2Js8jsDAcMwww4TRjsSCwozHsMKooLSRdsn0fJbGDq2Iw8qnJsxi0hTc0NEqzVDAHMOsrb62UpBUssi/uNUgzbjDfuScdurWWNv6yYzSTM3+xBDKXJsItahxmLms1xTB3seethrB4LE4zyC3Eq8OsuDXNMVayr7UNMF0rpSuttGM0abfXNiQw+iugs1c0rTOytUYsI7TPNm+yGrS0Mx8tRiRNsfayJ62ftT02JK43qg60XiUNsVsySy2lrRQoHioEr9ghoyh2r82027I/tOUzFDdcK+2huiwWMqkxDDmpsQQt3aiIMGAzsCvELAGsUTSMoOql3yDKqmCzaiitLVItvbJtqDW0VTDzscW18rD5sPUvmDjysYawTJ3SMUmopLJEsXC0xSH7LCEoOhggsaUtkyhOpK4aBKjoNnmzmDY5q88x6CqmLteo/rC/L/IwbrBAIV0BfS+0MRot8KzQK1AtP7MSMw4tgiPfMHSsEp7xHbAl4KcLJ84pAbA+MHyw3bDYobeghjAcL12m4ag7qyepZjINMKaxByp3oUyirC+yrUO3LawDsFy1B7J9pdE04aq7rGstLrWepjex9qSiLVAwo6Zwt8mrzyoDpNOqYLOhsQ2kjqw6r8EjwDM2rqwpXicaISwuZSJ8KL2lfi+vNiqyKK6TJy8x+aqgpCKuSzBQrQgtH6z4rIItOpn8K5Ypf7VwqgmreiYJLZqvCaDPJHs2/yY2M8GxXzPNMQgwRrUgKaqsyqCVMoK0wy8HqjMlVK1Bsz00uaWdrYouMiy5MLW1iTA9o3amZShyMw62xye2Mn4gyrJRtCoxbqE0MhekCSkatVw1mTJlrHAW+yD4rwGxqjVXIKCZyKqYrqUqy6Cvr/qvWzYXM8ssfikDKju4/ixqLS8wDjBVMXC5LjBqM/yyGqwXJJqtm6Lrsbc0tg+6LiuyZC5QM5izqyT1q4OlaaqHsGqvHDVeJPgjqCh8s20pCTUopR8s8aE9M5IwjC7zMIK68C8SnJIsMCmSrGGnWijntO8xNzH1LEUo/yhqMbMhjKmkL4u1nyVXJvgxH7WZLfEkciQvswEuJzK+nEYkMqeJLEO4RzVqpeoqfiUwtM4tiDNvKtyk5yq1qtE1ALRmJu6lEKhHMu8vdrTEqjQq8a1Ft0Eq8zBmNJok7jAoNJqxbrTrq0Qw0BzmMH+0lrR1sEkwZjTWG1u02DPeKIysdyb3Lw2zJ6ouKsgsviY7r8SwxTU6p+0oC6DfsUwrAzIdKzQtUa2qJwStFCkaqlusYCpUNWC3ja9bqk4xb6eEsmI1uDCEkh2v/61hM2+0ZrHvLT8okyPHtoOlkay2M40iyjaENKS1RKeprHQkLirptNwonzCZMUCfLypWpRswwpXFsPcuoaTfqoc1Xqwlq+iu2iXmNcm0E60Srwmgdav7MhWuoq99rkKsbShMNfetrrS0qiknMqy9NOeuobPuIvKoKqTxrWi0FTbFpQAqFikpsZ4n1ykOpFAy+JjGp+k0hbRWJFUmHSJ/MrK0ZLDyJE4w9STMsmogWS/VLIgqUR4/tHc0hy3iJ8ipsyfPsyCtGq3msDc6pbBstPguJTEXomAxTSVYMYMYSirlr02u9qwcsjo0tzA5p+Ks06hiLFOpSbLpKlMqUCWhrVcw2y6oKN2xHiaesNIwEi7YIVGp1io6MhG0KqbpqeScIC3PLsith6jUMgYwurZaqrU0cKlOpy+hzLDGMTiu5bIjpoEtgqu/sWEkXyNRobc267FtpsIz8rWkBpIuTiW0sgk3XakEIqOm1aQfsU6wpSimrS8zfDLIqBuwCS5YpkcwdZnntRAwxjiPrRmsdqRLNB+wCrBVpGixN6SytCKlz671LnU4obCTNoq0k7URsJcsgCe+tGOttipVGts25ij6rxk0EaUvsH4tgaHzsIu00DYZMa2g5agctoQnNDAqpCs3QaozM1iwC7QOKjCqHS6zLkajLK7RLpUxH7ZCtW4ytixdLOosQChxMM0uCiyvMMq4MzCUsckv5zRtr8qvTyg5sfg0+JB0rN0sP65XLQkxD60kKOUuwrUrNBavpKc9pSC0qCrmLYMuEbP1qfYeHyveMgKxVrXeKiojxR7JMGu2PzdetASpkSlIMEW2yyYhK3Ebiy+xMsQy8C1pMISwa7goNhS3LrYfKvks1SsDIMGyCDRtIlWtHSm3MxutILQOHEixfyxoNbGuM7FjKk+1dSeVtS404TSEJeasA6qSNPOuJbekL7Wq0SrDLPWsFbRnHvUu6ipus1+igzVJpa8tEqYErLcuuCgvKXUXzqjJrTgsAqA/suKwdTfDIG+tnqvhqrQy1avzNMmfKrj0mTenWCmHthk2Ija1IQ2vAyhuNecnszBzsjixhbT8LfAnfzR8sp2u1688IMOuvi2jmq2oByZltvA1MjZsr9KolBmNrj8n/zIcKKOweCtOJwg2WLKJsb+kmqnjsBg3PrCKL+CunqtOsSYk5zJtKF8f2avlqOoUhaj8sPMzcakYrtuzfDWPqYMYzilLNGuwf6h6rOaxoCUBto4wmTQCLconESSuNVuyILD0pziyXiROtHywKrPcsMkv9DmNOJW04rZCrgQlsKumpCq09TMgrEuhCy2ysVA2UylrqUewXaWzKimzBCs9oDikMS1usiMzPxtELG4sfa6utlc1NzQiqGWrQytImA8yyqGvJHiup60QtNc1rSxvEpStVy2jNESw0CkpqD+01aIcoCAg7ygdrQiruDDDNhOzYbScr38q0KjgJhS1AjWUGA8cB6xKsAovdCwYMDe0oDE="
 
 
+def stablemax(x: np.ndarray):
+    s = (x + 1) * (x >= 0) + (1 / (1 - x)) * (x < 0)
+    s /= np.sum(s, axis=-1, keepdims=True)
+    return s
+
+
+def softmax(x: np.ndarray):
+    e_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return e_x / e_x.sum(axis=-1, keepdims=True)
+
+
+# binary checkpoint: magic, uint64 length of the JSON header, header, then
+# the raw arrays, each starting at a multiple of CHECKPOINT_ALIGN bytes
+CHECKPOINT_MAGIC = b"WUMPNET1"
+CHECKPOINT_ALIGN = 64
+
+
+def _align(n: int):
+    return -(-n // CHECKPOINT_ALIGN) * CHECKPOINT_ALIGN
+
+
 class NeuralNetwork:
     """Simple Neural Network that supports exporting/importing weights
     """
@@ -28,21 +54,17 @@ class NeuralNetwork:
             self.biases.append(b)
 
     def forward(self, x: np.ndarray):
-        def stablemax(x):
-            s = (x + 1) * (x >= 0) + (1 / (1 - x)) * (x < 0)
-            s /= np.sum(s, axis=-1, keepdims=True)
-            return s
-
-        def softmax(x: np.ndarray):
-            e_x = np.exp(x - np.max(x, axis=-1, keepdims=True))
-            return e_x / e_x.sum(axis=-1, keepdims=True)
-
         for i, (w, b) in enumerate(zip(self.weights, self.biases)):
             x = np.dot(x, w) + b
             if i < len(self.weights) - 1:
                 x = np.tanh(x)
         x = softmax(x)
         return x
+
+    def compile(self, dtype=np.float32):
+        """Inference-only copy of the network, see `CompiledNetwork`
+        """
+        return CompiledNetwork(self, dtype=dtype)
     
     def get_weights_flat(self):
         arr = np.concatenate([
@@ -76,12 +98,82 @@ class NeuralNetwork:
         )
         return string_repr
     
+    @classmethod
+    def from_arrays(cls, weights: list[np.ndarray], biases: list[np.ndarray]):
+        """Network using the given arrays as they are (no copies)
+        """
+        net = cls.__new__(cls)
+        net.weights = list(weights)
+        net.biases = list(biases)
+        return net
+
+    def copy(self):
+        """Network with writable copies of the weights
+        """
+        return NeuralNetwork.from_arrays(
+            [w.copy() for w in self.weights], [b.copy() for b in self.biases]
+        )
+
+    def to_bytes(self):
+        """Binary checkpoint, see `from_bytes`
+        """
+        arrays = [a for w, b in zip(self.weights, self.biases) for a in (w, b)]
+        dtype = np.result_type(*arrays)
+        # offsets are relative to the (aligned) end of the header
+        offsets = [0]
+        for a in arrays[:-1]:
+            offsets.append(_align(offsets[-1] + a.size * dtype.itemsize))
+        header = {"dtype": dtype.str, "shapes": [list(a.shape) for a in arrays], "offsets": offsets}
+        header_bytes = json.dumps(header).encode("ascii")
+        data_start = _align(16 + len(header_bytes))
+
+        out = bytearray(data_start + offsets[-1] + arrays[-1].size * dtype.itemsize)
+        out[:8] = CHECKPOINT_MAGIC
+        out[8:16] = np.uint64(len(header_bytes)).tobytes()
+        out[16:16 + len(header_bytes)] = header_bytes
+        for a, offset in zip(arrays, offsets):
+            raw = np.ascontiguousarray(a, dtype=dtype).tobytes()
+            out[data_start + offset:data_start + offset + len(raw)] = raw
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Network whose weights are views into `buffer` (bytes, bytearray,
+        memmap), without copying; they are writable if the buffer is
+        """
+        buffer = np.frombuffer(buffer, dtype=np.uint8) if not isinstance(buffer, np.ndarray) else buffer
+        if bytes(buffer[:8]) != CHECKPOINT_MAGIC:
+            raise ValueError("not a NeuralNetwork checkpoint")
+        header_len = int(buffer[8:16].view(np.uint64)[0])
+        header = json.loads(bytes(buffer[16:16 + header_len]))
+        dtype = np.dtype(header["dtype"])
+        data_start = _align(16 + header_len)
+        arrays = [
+            np.ndarray(shape, dtype=dtype, buffer=buffer, offset=data_start + offset)
+            for shape, offset in zip(header["shapes"], header["offsets"])
+        ]
+        return cls.from_arrays(arrays[0::2], arrays[1::2])
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str, mmap_mode="c"):
+        """Memory-map a checkpoint written by `save`. With the default
+        copy-on-write mode the weights are writable, but changes stay in
+        memory; "r" makes them read-only.
+        """
+        return cls.from_bytes(np.memmap(path, dtype=np.uint8, mode=mmap_mode))
+
     @staticmethod
     def from_string(weights: str):
         import ast  # For safely parsing the architecture string
         import base64
 
         arch_str, dtype_str, weights_str = weights.split(';', 2)
+        if dtype_str == "int8":
+            return QuantizedNetwork.from_string(weights)
 
         arch = ast.literal_eval(arch_str)
         dtype = np.dtype(dtype_str)
@@ -90,7 +182,8 @@ class NeuralNetwork:
         layers = [shape[1] for shape in arch[:-1]]
         output_dim = arch[-1][1]
 
-        decoded_bytes = base64.b64decode(weights_str.encode('ascii'))
+        # bytearray: views into bytes would be read-only
+        decoded_bytes = bytearray(base64.b64decode(weights_str.encode('ascii')))
         flat_weights = np.frombuffer(decoded_bytes, dtype=dtype)
         
         net = NeuralNetwork(input_dim, output_dim, layers)
@@ -122,7 +215,190 @@ class NeuralNetwork:
         print("OK")
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_agent_network():
+    if AGENT_CHECKPOINT:
+        net = NeuralNetwork.load(AGENT_CHECKPOINT, mmap_mode="r")
+    else:
+        net = NeuralNetwork.from_string(AGENT_WEIGHTS)
+    if isinstance(net, NeuralNetwork):
+        for a in net.weights + net.biases:
+            a.setflags(write=False)
+    return net
+
+
+def agent_network():
+    """Network of the shipped agent. The weights are decoded on first use
+    and then shared (read-only) by every agent of the process; use
+    `.copy()` to change them. int8 `AGENT_WEIGHTS` give the shared
+    `QuantizedNetwork`, which is inference-only.
+    """
+    net = _shared_agent_network()
+    if isinstance(net, QuantizedNetwork):
+        return net
+    return NeuralNetwork.from_arrays(net.weights, net.biases)
+
+
+class CompiledNetwork:
+    """Inference engine for a `NeuralNetwork`
+
+    The weights are converted once into contiguous float32 (or float64)
+    matrices, and the activations of every layer are written into scratch
+    buffers that are allocated once per batch size. float16 weights as
+    shipped in `AGENT_WEIGHTS` are slow in `np.dot` on CPUs.
+    """
+    def __init__(self, net: NeuralNetwork, dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        self.weights = [np.ascontiguousarray(w, dtype=self.dtype) for w in net.weights]
+        self.biases = [np.ascontiguousarray(b, dtype=self.dtype) for b in net.biases]
+        self._scratch: dict[int, list[np.ndarray]] = {}
+
+    def _buffers(self, batch_size: int):
+        buffers = self._scratch.get(batch_size)
+        if buffers is None:
+            buffers = [np.empty((batch_size, w.shape[1]), dtype=self.dtype) for w in self.weights]
+            self._scratch[batch_size] = buffers
+        return buffers
+
+    def logits(self, x: np.ndarray):
+        """Output layer before the softmax for a batch of observations.
+        The result is a scratch buffer that is overwritten by the next call.
+        """
+        x = np.ascontiguousarray(x, dtype=self.dtype)
+        if x.ndim == 1:
+            x = x[None]
+        last = len(self.weights) - 1
+        for i, (w, b, out) in enumerate(zip(self.weights, self.biases, self._buffers(len(x)))):
+            np.dot(x, w, out=out)
+            out += b
+            if i < last:
+                np.tanh(out, out=out)
+            x = out
+        return x
+
+    def forward(self, x: np.ndarray):
+        y = softmax(self.logits(x))
+        return y if np.ndim(x) > 1 else y[0]
+
+    def act(self, batch_obs: np.ndarray):
+        """Greedy actions for a batch of observations; the argmax of the
+        logits is the argmax of the softmax, so no probabilities are built.
+        """
+        a = np.argmax(self.logits(batch_obs), axis=-1)
+        return a if np.ndim(batch_obs) > 1 else a[0]
+
+
+class QuantizedNetwork:
+    """Int8 inference engine for a `NeuralNetwork`
+
+    Weights are quantized per output channel, w[:, j] ~ q[:, j] * scale[j]
+    with int8 q, and so are the inputs of every layer: the network input
+    with one scale per row, the tanh activations with the fixed scale
+    1/127. Every layer is then an integer matmul and one rescale.
+
+    The int8 values are kept as float32 for the matmul: their products
+    are integers below 2**14, so the sums are exact in float32 for up to
+    1040 inputs and BLAS does the integer accumulation. Wider layers
+    accumulate in int32.
+    """
+    ACTIVATION_SCALE = 1 / 127
+
+    def __init__(self, qweights: list[np.ndarray], scales: list[np.ndarray], biases: list[np.ndarray]):
+        self.qweights = [np.asarray(q, dtype=np.int8) for q in qweights]
+        self.scales = [np.asarray(s, dtype=np.float32) for s in scales]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self._weights = [
+            q.astype(np.float32 if q.shape[0] * 127 * 127 < 2**24 else np.int32)
+            for q in self.qweights
+        ]
+
+    @classmethod
+    def quantize(cls, net: NeuralNetwork):
+        qweights, scales = [], []
+        for w in net.weights:
+            w = np.asarray(w, dtype=np.float32)
+            scale = np.abs(w).max(axis=0) / 127
+            scale[scale == 0] = 1
+            qweights.append(np.rint(w / scale).astype(np.int8))
+            scales.append(scale)
+        return cls(qweights, scales, net.biases)
+
+    def dequantize(self):
+        """float32 `NeuralNetwork` with the quantized weights
+        """
+        return NeuralNetwork.from_arrays(
+            [q * s for q, s in zip(self.qweights, self.scales)], [b.copy() for b in self.biases]
+        )
+
+    def compile(self, dtype=np.float32):
+        return self
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in self.qweights + self.scales + self.biases)
+
+    def logits(self, x: np.ndarray):
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[None]
+        x_scale = np.abs(x).max(axis=-1, keepdims=True) / 127
+        x_scale[x_scale == 0] = 1
+        last = len(self._weights) - 1
+        for i, (w, scale, b) in enumerate(zip(self._weights, self.scales, self.biases)):
+            xq = np.rint(x / x_scale if i == 0 else x * 127, out=x if i > 0 else None)
+            x = xq @ w if w.dtype == np.float32 else (xq.astype(np.int32) @ w).astype(np.float32)
+            x *= x_scale * scale
+            x += b
+            if i < last:
+                np.tanh(x, out=x)
+                x_scale = self.ACTIVATION_SCALE
+        return x
+
+    def forward(self, x: np.ndarray):
+        y = softmax(self.logits(x))
+        return y if np.ndim(x) > 1 else y[0]
+
+    def act(self, batch_obs: np.ndarray):
+        a = np.argmax(self.logits(batch_obs), axis=-1)
+        return a if np.ndim(batch_obs) > 1 else a[0]
+
+    def to_string(self):
+        """Same format as `NeuralNetwork.to_string` with dtype int8; per
+        layer the payload holds q, then the float32 scales and biases
+        """
+        import base64
+        arch = [q.shape for q in self.qweights]
+        payload = b"".join(
+            q.tobytes() + s.tobytes() + b.tobytes()
+            for q, s, b in zip(self.qweights, self.scales, self.biases)
+        )
+        return "{};int8;{}".format(arch, base64.b64encode(payload).decode('ascii'))
+
+    @classmethod
+    def from_string(cls, weights: str):
+        import ast
+        import base64
+
+        arch_str, _, payload_str = weights.split(';', 2)
+        payload = base64.b64decode(payload_str.encode('ascii'))
+        qweights, scales, biases = [], [], []
+        offset = 0
+        for n_in, n_out in ast.literal_eval(arch_str):
+            qweights.append(np.frombuffer(payload, dtype=np.int8, count=n_in * n_out, offset=offset).reshape(n_in, n_out))
+            offset += n_in * n_out
+            scales.append(np.frombuffer(payload, dtype=np.float32, count=n_out, offset=offset))
+            offset += 4 * n_out
+            biases.append(np.frombuffer(payload, dtype=np.float32, count=n_out, offset=offset))
+            offset += 4 * n_out
+        return cls(qweights, scales, biases)
+
+
 class Agent:
+    __slots__ = (
+        "size", "p_pit", "t_max", "actions", "net", "map", "pos_agent", "orientation_agent",
+        "has_arrow", "has_gold", "wumpus_alive", "pos_exit", "t",
+    )
+
     map: np.ndarray
     pos_agent: tuple
     orientation_agent: Orientation
@@ -151,17 +427,18 @@ class Agent:
             self._act_shoot,
             self._act_climb
         ]
-        obs_example = self._get_observation()
-        self.net = NeuralNetwork(
-            input_dim=obs_example.shape[0],
-            output_dim=len(self.actions),
-            layers=[]
-        )
-        if len(AGENT_WEIGHTS) > 0:
-            self.net = NeuralNetwork.from_string(AGENT_WEIGHTS)
+        if AGENT_CHECKPOINT or len(AGENT_WEIGHTS) > 0:
+            self.net = agent_network()
+        else:
+            obs_example = self._get_observation()
+            self.net = NeuralNetwork(
+                input_dim=obs_example.shape[0],
+                output_dim=len(self.actions),
+                layers=[]
+            )
 
     def new_episode(self):
-        self.map = -np.ones((*self.size, NUM_PERCEPTIONS), dtype=int)
+        self.map = -np.ones((*self.size, NUM_PERCEPTIONS), dtype=np.int8)
         self.pos_agent = (0, 0)
         self.orientation_agent = Orientation.NORTH
         self.has_arrow = True
@@ -263,11 +540,18 @@ class Agent:
 
 import gymnasium
 import wumpus_mike
+from profiling import PhaseProfiler, profiling_enabled
 
 
 class WumpusEnv(wumpus_mike.Wumpus, gymnasium.Env):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, profile=None, **kwargs):
+        """
+        profile ... time the phases of step and reset into `self.profiler`
+            (a `profiling.PhaseProfiler`); default: the WUMPUS_PROFILE env var
+        other arguments as for `wumpus_mike.Wumpus`
+        """
         super().__init__(*args, **kwargs)
+        self.profiler = PhaseProfiler() if profiling_enabled(profile) else None
         self.agent = Agent(
             size=self.size, t_max=self.Tmax, p_pit=self.p_pit
         )
@@ -282,13 +566,34 @@ class WumpusEnv(wumpus_mike.Wumpus, gymnasium.Env):
         )
     
     def step(self, action: Actions):
+        if self.profiler is not None:
+            return self._step_profiled(action)
+        self.agent.actions[action]()
+        perc, reward, term, _ = super().step(action)
+        self.agent._update_game_state(perc)
+        obs = self.agent._get_observation()
+        return obs, reward, term, False, {}
+
+    def _step_profiled(self, action: Actions):
+        """
+        `step` with the agent bookkeeping, the world transition and the
+        observation timed as separate phases
+        """
+        t0 = time.perf_counter_ns()
         self.agent.actions[action]()
+        t1 = time.perf_counter_ns()
         perc, reward, term, _ = super().step(action)
+        t2 = time.perf_counter_ns()
         self.agent._update_game_state(perc)
         obs = self.agent._get_observation()
+        t3 = time.perf_counter_ns()
+        self.profiler.record("step.agent", t0, t1)
+        self.profiler.record("step.world", t1, t2)
+        self.profiler.record("step.observation", t2, t3)
         return obs, reward, term, False, {}
     
     def reset(self, *args, **kwargs):
+        t0 = time.perf_counter_ns() if self.profiler is not None else 0
         perc = super().reset()
         self.agent.new_episode()
 
@@ -303,5 +608,11 @@ class WumpusEnv(wumpus_mike.Wumpus, gymnasium.Env):
 
         self.agent._update_game_state(perc)
         obs = self.agent._get_observation()
+        if self.profiler is not None:
+            self.profiler.record("reset", t0, time.perf_counter_ns())
         return obs, {}
 
+    def close(self):
+        if self.recorder is not None:
+            self.recorder.writer.close()
+        super().close()
@@ -0,0 +1,124 @@
+import numpy as np
+from wumpus import Actions, Orientation, Percepts
+
+NUM_PERCEPTIONS = 5
+
+# movement per orientation, indexed by Orientation
+DX = np.array([0, 1, 0, -1], dtype=np.int32)
+DY = np.array([1, 0, -1, 0], dtype=np.int32)
+
+
+class BatchedAgentState:
+    """
+    Game state of many `aufgabe2_mike.Agent`s kept as struct-of-arrays.
+
+    `observe` writes the observations of all agents into one preallocated
+    (n_envs, obs_dim) float32 buffer, row i being what
+    `Agent._get_observation` returns for agent i.
+    """
+    def __init__(self, n_envs, size=(4,4), p_pit=0.2, t_max=50):
+        self.n_envs = n_envs
+        self.size = tuple(size)
+        width, height = self.size
+        n_cells = width * height
+        n = n_envs
+        self._idx = np.arange(n)
+
+        self.map = -np.ones((n, width, height, NUM_PERCEPTIONS), dtype=np.int8)
+        self.x = np.zeros(n, dtype=np.int32)
+        self.y = np.zeros(n, dtype=np.int32)
+        self.orientation = np.zeros(n, dtype=np.int32)
+        self.has_arrow = np.ones(n, dtype=bool)
+        self.has_gold = np.zeros(n, dtype=bool)
+        self.wumpus_alive = np.ones(n, dtype=bool)
+        self.exit_x = np.zeros(n, dtype=np.int32)
+        self.exit_y = np.zeros(n, dtype=np.int32)
+        self.t = np.zeros(n, dtype=np.int32)
+        self.t_max = np.full(n, t_max, dtype=np.float32)
+        self.p_pit = np.full(n, p_pit, dtype=np.float32)
+
+        # observation layout: s1 (10 scalars) | s2 = map[:,:,:2] | s3 = position grid
+        self.obs_dim = 10 + 2 * n_cells + n_cells
+        self.obs = np.zeros((n, self.obs_dim), dtype=np.float32)
+        self._orientation_view = self.obs[:, 0:4]
+        self._map_view = self.obs[:, 10:10 + 2 * n_cells].reshape((n, width, height, 2))
+        self._pos_view = self.obs[:, 10 + 2 * n_cells:].reshape((n, width, height))
+        self._time_left = np.zeros(n, dtype=np.float32)
+
+    def new_episode(self, env_ids=None, pos=None, orientation=None, has_arrow=None,
+                    wumpus_alive=None, t_max=None, p_pit=None):
+        """
+        Start a new episode for `env_ids` (all agents if None).
+        The keyword arguments override the defaults of `Agent.new_episode`
+        in the way `WumpusEnv.reset` does; pos is a pair of x and y arrays
+        and also becomes the exit.
+        """
+        if env_ids is None:
+            env_ids = self._idx
+        self.map[env_ids] = -1
+        self.x[env_ids], self.y[env_ids] = (0, 0) if pos is None else pos
+        self.exit_x[env_ids] = self.x[env_ids]
+        self.exit_y[env_ids] = self.y[env_ids]
+        self.orientation[env_ids] = Orientation.NORTH if orientation is None else orientation
+        self.has_arrow[env_ids] = True if has_arrow is None else has_arrow
+        self.has_gold[env_ids] = False
+        self.wumpus_alive[env_ids] = True if wumpus_alive is None else wumpus_alive
+        self.t[env_ids] = 0
+        if t_max is not None:
+            self.t_max[env_ids] = t_max
+        if p_pit is not None:
+            self.p_pit[env_ids] = p_pit
+
+    def apply_actions(self, actions):
+        """
+        Update the agents' own bookkeeping for the chosen actions,
+        like `Agent._act_*` does
+        """
+        actions = np.asarray(actions)
+        width, height = self.size
+
+        turn = (actions == Actions.RIGHT).astype(np.int32) - (actions == Actions.LEFT)
+        self.orientation = (self.orientation + turn) % 4
+
+        forward = actions == Actions.FORWARD
+        self.x = np.clip(self.x + DX[self.orientation] * forward, 0, width - 1)
+        self.y = np.clip(self.y + DY[self.orientation] * forward, 0, height - 1)
+
+        glitter = self.map[self._idx, self.x, self.y, Percepts.GLITTER] == 1
+        self.has_gold |= (actions == Actions.GRAB) & glitter
+        self.has_arrow &= actions != Actions.SHOOT
+
+        self.t += 1
+
+    def update(self, percepts):
+        """
+        Store the percepts at the current positions (`Agent._update_game_state`)
+        """
+        self.map[self._idx, self.x, self.y] = percepts
+        self.wumpus_alive &= percepts[:, Percepts.SCREAM] != 1
+
+    def observe(self):
+        """
+        Write the observations of all agents into `self.obs` and return it.
+        The buffer is reused by the next call.
+        """
+        obs = self.obs
+        idx = self._idx
+
+        self._orientation_view[:] = 0
+        self._orientation_view[idx, self.orientation] = 1
+        obs[:, 4] = self.has_arrow
+        obs[:, 5] = self.has_gold
+        obs[:, 6] = self.wumpus_alive
+        obs[:, 7] = self.map[idx, self.x, self.y, Percepts.GLITTER] == 1
+        np.subtract(self.t_max, self.t, out=self._time_left)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.log10(self._time_left, out=obs[:, 8])
+        obs[:, 9] = self.p_pit
+
+        self._map_view[:] = self.map[:, :, :, :2]
+
+        self._pos_view[:] = 0
+        self._pos_view[idx, self.x, self.y] = 1
+        self._pos_view[idx, self.exit_x, self.exit_y] = -1
+        return obs
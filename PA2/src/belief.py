@@ -0,0 +1,257 @@
+import heapq
+
+import numpy as np
+from wumpus import Actions, Percepts
+
+# movement per orientation, indexed by Orientation
+DX = (0, 1, 0, -1)
+DY = (1, 0, -1, 0)
+
+
+def iter_bits(mask):
+    """
+    Indices of the set bits of an int
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BeliefState:
+    """
+    Knowledge of the logic agent about one Wumpus world.
+
+    Cells are numbered c = y * W + x and every set of cells is a bitset
+    (Python int with bit c set). Percepts are folded in incrementally:
+    a visited cell has no pit and no living wumpus, a cell without breeze
+    proves its neighbours pit-free, a cell without stench removes its
+    neighbourhood from the wumpus candidates and a stench restricts them to
+    its neighbours.
+
+    Pits and the wumpus are placed independently, so their marginals are
+    computed separately: the wumpus is uniform over the remaining
+    candidates, and the pit marginals of the frontier (unvisited cells next
+    to a breeze) are exact, by enumerating all pit assignments that explain
+    every breeze, per independent group of frontier cells. Those results
+    are cached by constraint set, across steps and episodes.
+    """
+    def __init__(self, size=(4,4), p_pit=0.2, max_group=20, cache_size=100_000):
+        """
+        max_group ... frontier groups with more cells than this are not
+            enumerated; their cells keep the prior p_pit
+        """
+        self.size = tuple(size)
+        self.p_pit = p_pit
+        self.max_group = max_group
+        self.cache_size = cache_size
+        self._group_cache = {}
+
+        width, height = self.size
+        self.n_cells = width * height
+        self.all_cells = (1 << self.n_cells) - 1
+        self.neighbors = []
+        for c in range(self.n_cells):
+            x, y = self.pos(c)
+            mask = 0
+            for dx, dy in zip(DX, DY):
+                if 0 <= x + dx < width and 0 <= y + dy < height:
+                    mask |= 1 << self.cell((x + dx, y + dy))
+            self.neighbors.append(mask)
+
+        self.reset()
+
+    def cell(self, pos):
+        return pos[1] * self.size[0] + pos[0]
+
+    def pos(self, c):
+        return (c % self.size[0], c // self.size[0])
+
+    def reset(self):
+        """
+        Forget the world, keep the cache
+        """
+        self.visited = 0
+        self.no_pit = 1 # the start cell never has a pit
+        self.breezy = 0
+        self.wumpus_alive = True
+        self.wumpus_candidates = self.all_cells & ~1 # nor the wumpus
+        self._pit_marginals = None
+
+    def observe(self, pos, percept):
+        """
+        Add the percept received at `pos`
+        """
+        c = self.cell(pos)
+        bit = 1 << c
+        before = (self.no_pit, self.breezy, self.wumpus_candidates)
+
+        self.visited |= bit
+        self.no_pit |= bit
+        if percept[Percepts.BREEZE]:
+            self.breezy |= bit
+        else:
+            self.no_pit |= self.neighbors[c]
+
+        if percept[Percepts.SCREAM]:
+            self.wumpus_alive = False
+        if self.wumpus_alive:
+            # the stench also lingers after the wumpus died, so it only
+            # carries information while it is alive
+            if percept[Percepts.STENCH]:
+                self.wumpus_candidates &= self.neighbors[c]
+            else:
+                self.wumpus_candidates &= ~(self.neighbors[c] | bit)
+        else:
+            self.wumpus_candidates = 0
+
+        if (self.no_pit, self.breezy, self.wumpus_candidates) != before:
+            self._pit_marginals = None
+
+    def observe_miss(self, pos, orientation):
+        """
+        An arrow shot from `pos` did not cause a scream
+        """
+        self.wumpus_candidates &= ~self.line(pos, orientation)
+
+    def line(self, pos, orientation):
+        """
+        Cells from `pos` to the wall in direction `orientation`
+        """
+        mask = 0
+        x, y = pos
+        while 0 <= x < self.size[0] and 0 <= y < self.size[1]:
+            mask |= 1 << self.cell((x, y))
+            x, y = x + DX[orientation], y + DY[orientation]
+        return mask
+
+    def safe(self):
+        """
+        Cells proven to have neither a pit nor a living wumpus
+        """
+        return self.no_pit & ~self.wumpus_candidates
+
+    def wumpus_probabilities(self):
+        p = np.zeros(self.n_cells)
+        n = self.wumpus_candidates.bit_count()
+        for c in iter_bits(self.wumpus_candidates):
+            p[c] = 1 / n
+        return p
+
+    def pit_probabilities(self):
+        """
+        Exact pit marginal of every cell given all breezes seen so far
+        """
+        if self._pit_marginals is not None:
+            return self._pit_marginals
+
+        p = np.full(self.n_cells, self.p_pit)
+        for c in iter_bits(self.no_pit):
+            p[c] = 0
+        for cells, constraints in self._frontier_groups():
+            key = (cells, constraints)
+            marginals = self._group_cache.get(key)
+            if marginals is None:
+                marginals = self._enumerate(cells, constraints)
+                if len(self._group_cache) >= self.cache_size:
+                    self._group_cache.clear()
+                self._group_cache[key] = marginals
+            if marginals is not None:
+                for c, m in zip(iter_bits(cells), marginals):
+                    p[c] = m
+
+        self._pit_marginals = p
+        return p
+
+    def death_probabilities(self):
+        return 1 - (1 - self.pit_probabilities()) * (1 - self.wumpus_probabilities())
+
+    def _frontier_groups(self):
+        """
+        Split the breeze constraints ("at least one pit among these unknown
+        cells") into groups that share no cells
+        """
+        constraints = sorted({self.neighbors[b] & ~self.no_pit for b in iter_bits(self.breezy)})
+        groups = []
+        for constraint in constraints:
+            cells, members = constraint, [constraint]
+            rest = []
+            for group_cells, group_members in groups:
+                if group_cells & cells:
+                    cells |= group_cells
+                    members += group_members
+                else:
+                    rest.append((group_cells, group_members))
+            groups = rest + [(cells, members)]
+        return [(cells, tuple(sorted(members))) for cells, members in groups]
+
+    def _enumerate(self, cells, constraints):
+        """
+        Pit marginals of the cells of one group, None if it is too large
+        """
+        index = list(iter_bits(cells))
+        m = len(index)
+        if m > self.max_group:
+            return None
+
+        assignments = np.arange(1 << m, dtype=np.int64)
+        bits = (assignments[:, None] >> np.arange(m)) & 1
+        consistent = np.ones(len(assignments), dtype=bool)
+        for constraint in constraints:
+            local = sum(1 << i for i, c in enumerate(index) if constraint >> c & 1)
+            consistent &= (assignments & local) != 0
+
+        n_pits = bits.sum(axis=1)
+        weights = consistent * self.p_pit ** n_pits * (1 - self.p_pit) ** (m - n_pits)
+        return weights @ bits / weights.sum()
+
+
+def plan_path(size, start, orientation, goals, allowed):
+    """
+    A* search for the shortest action sequence (FORWARD/LEFT/RIGHT, all
+    costing one step) from `start` facing `orientation` to any cell of the
+    bitset `goals`, entering only cells of the bitset `allowed`.
+    Returns (actions, orientation at the goal) or None.
+    """
+    width, height = size
+    goal_cells = [(c % width, c // width) for c in iter_bits(goals)]
+    if not goal_cells:
+        return None
+
+    def heuristic(pos):
+        return min(abs(pos[0] - gx) + abs(pos[1] - gy) for gx, gy in goal_cells)
+
+    start_state = (start, orientation)
+    queue = [(heuristic(start), 0, start_state)]
+    parents = {start_state: None}
+    costs = {start_state: 0}
+    while queue:
+        _, cost, state = heapq.heappop(queue)
+        if cost > costs[state]:
+            continue
+        pos, o = state
+        if goals >> (pos[1] * width + pos[0]) & 1:
+            actions = []
+            while parents[state] is not None:
+                state, action = parents[state]
+                actions.append(action)
+            return actions[::-1], o
+
+        successors = [((pos, (o - 1) % 4), Actions.LEFT), ((pos, (o + 1) % 4), Actions.RIGHT)]
+        nx, ny = pos[0] + DX[o], pos[1] + DY[o]
+        if 0 <= nx < width and 0 <= ny < height and allowed >> (ny * width + nx) & 1:
+            successors.append((((nx, ny), o), Actions.FORWARD))
+        for successor, action in successors:
+            if cost + 1 < costs.get(successor, cost + 2):
+                costs[successor] = cost + 1
+                parents[successor] = (state, action)
+                heapq.heappush(queue, (cost + 1 + heuristic(successor[0]), cost + 1, successor))
+    return None
+
+
+def turn_actions(orientation, target):
+    """
+    Shortest turns from `orientation` to `target`
+    """
+    diff = (target - orientation) % 4
+    return {0: [], 1: [Actions.RIGHT], 2: [Actions.RIGHT, Actions.RIGHT], 3: [Actions.LEFT]}[diff]
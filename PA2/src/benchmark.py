@@ -0,0 +1,202 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+import aufgabe2
+import aufgabe2_mike
+import wumpus
+import wumpus_mike
+from agents import AgentV1, AgentV2
+from evaluate import run_episode
+
+SIZES = [(4,4), (8,8), (16,16), (32,32), (64,64)]
+P_PITS = [0.1, 0.2, 0.3]
+BATCH_SIZES = [1, 32, 256, 4096]
+RENDER_MAX_CELLS = 16 * 16 # larger boards take seconds per frame
+EPISODE_MAX_CELLS = 16 * 16
+
+# agent class -> grid sizes it supports (None: all)
+AGENTS = {
+    "AgentV1": (AgentV1, None),
+    "AgentV2": (AgentV2, None),
+    "aufgabe2.Agent": (aufgabe2.Agent, None),
+    "aufgabe2_mike.Agent": (aufgabe2_mike.Agent, [(4,4)]), # fixed network input size
+}
+
+
+def throughput(fn, n_ops, min_time=0.2, repeat=3):
+    """
+    Best rate in operations per second over `repeat` runs of calling `fn`
+    (which performs `n_ops` operations) for at least `min_time` seconds
+    """
+    fn() # warm up caches (icons, buffers) outside of the timing
+    best = 0.0
+    for _ in range(repeat):
+        n_calls = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            n_calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, n_calls * n_ops / elapsed)
+    return best
+
+
+def step_loop(env, n_steps=1000, seed=0):
+    """
+    Random actions, resetting whenever the episode ends
+    """
+    actions = np.random.default_rng(seed).integers(0, 6, n_steps).tolist()
+    env.reset()
+
+    def run():
+        for action in actions:
+            if env.terminated:
+                env.reset()
+            env.step(action)
+    return run, n_steps
+
+
+def env_benchmarks(size, p_pit, min_time, repeat, select=None):
+    results = {}
+    tag = f"{size[0]}x{size[1]}/p_pit={p_pit}"
+    for name, cls in [("wumpus", wumpus.Wumpus), ("wumpus_mike", wumpus_mike.Wumpus), ("WumpusEnv", aufgabe2_mike.WumpusEnv)]:
+        if selected(f"{name}.step/{tag}", select):
+            # a long Tmax keeps the loop from measuring mostly resets
+            run, n = step_loop(cls(seed=0, size=size, p_pit=p_pit, Tmax=10**6))
+            results[f"{name}.step/{tag}"] = throughput(run, n, min_time, repeat)
+        if selected(f"{name}.reset/{tag}", select):
+            env = cls(seed=0, size=size, p_pit=p_pit)
+            results[f"{name}.reset/{tag}"] = throughput(env.reset, 1, min_time, repeat)
+    return results
+
+
+def render_benchmarks(size, min_time, repeat, select=None):
+    name = f"wumpus.render/{size[0]}x{size[1]}"
+    if not selected(name, select):
+        return {}
+    env = wumpus.Wumpus(seed=0, size=size)
+    env.reset()
+    return {name: throughput(env.render, 1, min_time, repeat)}
+
+
+def network_benchmarks(batch_sizes, min_time, repeat, select=None):
+    results = {}
+    net = aufgabe2_mike.agent_network()
+    rng = np.random.default_rng(0)
+    for batch_size in batch_sizes:
+        x = rng.standard_normal((batch_size, net.weights[0].shape[0])).astype(np.float32)
+        for name, model in [
+            ("NeuralNetwork", net),
+            ("CompiledNetwork", net.compile()),
+            ("QuantizedNetwork", aufgabe2_mike.QuantizedNetwork.quantize(net)),
+        ]:
+            key = f"{name}.forward/batch={batch_size}"
+            if selected(key, select):
+                results[key] = throughput(lambda: model.forward(x), batch_size, min_time, repeat)
+    return results
+
+
+def episode_benchmarks(size, p_pit, min_time, repeat, select=None):
+    results = {}
+    for name, (agent_cls, sizes) in AGENTS.items():
+        key = f"episodes/{name}/{size[0]}x{size[1]}/p_pit={p_pit}"
+        if (sizes is not None and size not in sizes) or not selected(key, select):
+            continue
+        env = wumpus.Wumpus(seed=0, size=size, p_pit=p_pit, Tmax=max(50, 3 * size[0] * size[1]))
+        agent = agent_cls(size=size)
+        results[key] = throughput(lambda: run_episode(env, agent), 1, min_time, repeat)
+    return results
+
+
+def selected(name, select):
+    return select is None or select in name
+
+
+def run_benchmarks(sizes=SIZES, p_pits=P_PITS, batch_sizes=BATCH_SIZES, min_time=0.2, repeat=3, select=None, verbose=True):
+    """
+    Run the benchmark matrix and return {name: operations per second}.
+    Operations are steps, resets, frames, network samples or episodes,
+    as named in the first part of the name.
+    select ... only run benchmarks whose name contains this string
+    """
+    jobs = []
+    for size in sizes:
+        for p_pit in p_pits:
+            jobs.append(lambda size=size, p_pit=p_pit: env_benchmarks(size, p_pit, min_time, repeat, select))
+            if size[0] * size[1] <= EPISODE_MAX_CELLS:
+                jobs.append(lambda size=size, p_pit=p_pit: episode_benchmarks(size, p_pit, min_time, repeat, select))
+        if size[0] * size[1] <= RENDER_MAX_CELLS:
+            jobs.append(lambda size=size: render_benchmarks(size, min_time, repeat, select))
+    jobs.append(lambda: network_benchmarks(batch_sizes, min_time, repeat, select))
+
+    results = {}
+    for job in jobs:
+        for name, rate in job().items():
+            results[name] = rate
+            if verbose:
+                print(f"{name:60s} {rate:14.1f} /s", flush=True)
+    return results
+
+
+def environment_info():
+    return {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save_results(results, path):
+    with open(path, "w") as f:
+        json.dump({"meta": environment_info(), "results": results}, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Benchmarks that got slower than (1 - tolerance) times their baseline
+    rate, as a list of (name, baseline rate, rate)
+    """
+    regressions = []
+    for name, rate in sorted(results.items()):
+        if name in baseline and rate < (1 - tolerance) * baseline[name]:
+            regressions.append((name, baseline[name], rate))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput benchmarks of the PA2 environments and agents")
+    parser.add_argument("--out", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--select", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--quick", action="store_true", help="small matrix and short timings")
+    args = parser.parse_args()
+
+    if args.quick:
+        results = run_benchmarks(sizes=[(4,4), (8,8)], p_pits=[0.2], batch_sizes=[1, 256], min_time=0.05, repeat=1, select=args.select)
+    else:
+        results = run_benchmarks(select=args.select)
+
+    if args.out:
+        save_results(results, args.out)
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.tolerance)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old:.1f}/s -> {new:.1f}/s ({new / old - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print("no regressions")
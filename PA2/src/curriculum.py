@@ -0,0 +1,164 @@
+import numpy as np
+from wumpus import build_grids
+
+# difficulty tiers as `wumpus_mike.Wumpus` keyword arguments, easiest first
+# (the env_fn_easy_v2, env_fn_medium_v2 and env_fn_expert_v3 of train_ppo.py)
+TIERS = [
+    dict(p_pit=0., with_wumpus=False, Tmax=(15, 100), start_orientation=None),
+    dict(p_pit=0., with_wumpus=True, Tmax=(40, 81), start_orientation=None),
+    dict(p_pit=(0.0, 0.25), with_wumpus=True, Tmax=(40, 100), start_orientation=None),
+]
+
+
+class WorldBank:
+    """
+    Pre-generated worlds of one tier as packed arrays, one row per world.
+    The worlds are drawn like `wumpus_mike.Wumpus.reset` draws them, but
+    all at once and from a generator of their own.
+    """
+    def __init__(self, n_worlds, size=(4,4), p_pit=0.2, Tmax=50, with_wumpus=True,
+                 start_pos=(0,0), start_orientation=0, seed=None):
+        """
+        n_worlds ... number of worlds in the bank
+        other arguments as for `wumpus_mike.Wumpus`; ranges are sampled per world
+        """
+        rng = np.random.default_rng(seed)
+        n = n_worlds
+        width, height = size
+        self.size = size
+
+        if isinstance(p_pit, float):
+            self.p_pit = np.full(n, p_pit, dtype=np.float32)
+        else:
+            self.p_pit = rng.uniform(*p_pit, size=n).astype(np.float32)
+        if isinstance(Tmax, int):
+            self.Tmax = np.full(n, Tmax, dtype=np.int32)
+        else:
+            self.Tmax = rng.integers(*Tmax, size=n, dtype=np.int32)
+
+        if start_pos is None: # a random corner
+            self.start_x = rng.choice([0, width - 1], size=n).astype(np.int16)
+            self.start_y = rng.choice([0, height - 1], size=n).astype(np.int16)
+        else:
+            self.start_x = np.full(n, start_pos[0], dtype=np.int16)
+            self.start_y = np.full(n, start_pos[1], dtype=np.int16)
+        if start_orientation is None:
+            self.orientation = rng.integers(0, 4, size=n, dtype=np.uint8)
+        else:
+            self.orientation = np.full(n, start_orientation, dtype=np.uint8)
+
+        pits = rng.random((n, width, height)) <= self.p_pit[:, None, None]
+        idx = np.arange(n)
+        pits[idx, self.start_x, self.start_y] = False
+
+        # any cell but the exit: draw from one cell less and skip the exit
+        n_cells = width * height
+        exit_index = self.start_y.astype(np.int64) * width + self.start_x
+        idx_wumpus = rng.integers(0, n_cells - 1, size=n)
+        idx_wumpus += idx_wumpus >= exit_index
+        self.wumpus_y, self.wumpus_x = [a.astype(np.int16) for a in np.divmod(idx_wumpus, width)]
+        idx_gold = rng.integers(0, n_cells, size=n)
+        self.gold_y, self.gold_x = [a.astype(np.int16) for a in np.divmod(idx_gold, width)]
+
+        self.wumpus_alive = np.full(n, with_wumpus, dtype=bool)
+        self.has_arrow = np.ones(n, dtype=bool)
+        if not with_wumpus:
+            self.has_arrow = rng.random(n) >= 0.5
+
+        self.grids = build_grids(pits, self.wumpus_x, self.wumpus_y, self.gold_x, self.gold_y)
+
+    def __len__(self):
+        return len(self.grids)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in vars(self).values() if isinstance(a, np.ndarray))
+
+    def load(self, env, i):
+        """
+        Put world i into `env` (a `wumpus_mike.Wumpus` in the middle of reset)
+        """
+        env.p_pit = float(self.p_pit[i])
+        env.Tmax = int(self.Tmax[i])
+        env.pos_agent = (int(self.start_x[i]), int(self.start_y[i]))
+        env.pos_exit = env.pos_agent
+        env.orientation_agent = int(self.orientation[i])
+        env.has_arrow = bool(self.has_arrow[i])
+        env.wumpus_alive = bool(self.wumpus_alive[i])
+        env.pos_wumpus = (int(self.wumpus_x[i]), int(self.wumpus_y[i]))
+        env.pos_gold = (int(self.gold_x[i]), int(self.gold_y[i]))
+        env.grid = self.grids[i].copy()
+
+
+class CurriculumScheduler:
+    """
+    Serves worlds from one `WorldBank` per tier to `wumpus_mike.Wumpus`
+    envs (pass it as `worlds=`) and adapts how often each tier is served
+    to the rolling success rate (escaped with the gold) on it.
+
+    A tier is unlocked once the tier before it reaches `promote_at`; among
+    the unlocked tiers, the share of a tier grows with its failure rate.
+    Which world an env gets is drawn from the env's own generator, so
+    episodes are reproducible from the env seeds, and forked worker
+    processes can share one scheduler's banks without drawing the same
+    worlds. Success statistics are kept per process.
+    """
+    def __init__(self, tiers=TIERS, size=(4,4), bank_size=50_000, seed=2025,
+                 window=500, promote_at=0.8, floor=0.05, update_every=100):
+        """
+        tiers ... list of `wumpus_mike.Wumpus` keyword arguments, easiest first
+        bank_size ... worlds per tier
+        window ... episodes per tier in the rolling success rate
+        floor ... minimal weight of an unlocked tier
+        update_every ... recompute the proportions after this many episodes
+        """
+        seeds = np.random.SeedSequence(seed).spawn(len(tiers))
+        self.banks = [WorldBank(bank_size, size=size, seed=s, **tier) for tier, s in zip(tiers, seeds)]
+        self.promote_at = promote_at
+        self.floor = floor
+        self.update_every = update_every
+
+        n_tiers = len(tiers)
+        self._outcomes = np.zeros((n_tiers, window), dtype=bool)
+        self._n_outcomes = np.zeros(n_tiers, dtype=np.int64)
+        self._n_reports = 0
+        self.proportions = np.zeros(n_tiers)
+        self.update_proportions()
+
+    def success_rates(self):
+        """
+        Rolling success rate per tier (0 for tiers without episodes)
+        """
+        window = self._outcomes.shape[1]
+        n = np.minimum(self._n_outcomes, window)
+        return self._outcomes.sum(axis=1) / np.maximum(n, 1)
+
+    def update_proportions(self):
+        rates = self.success_rates()
+        unlocked = np.ones(len(rates), dtype=bool)
+        unlocked[1:] = np.logical_and.accumulate(rates[:-1] >= self.promote_at)
+        weights = np.where(unlocked, self.floor + (1 - rates), 0.0)
+        self.proportions = weights / weights.sum()
+        self._cumulative = np.cumsum(self.proportions)
+        return self.proportions
+
+    def load(self, env):
+        """
+        Load a world into `env`, drawn with its generator; returns the tier
+        """
+        tier = min(int(np.searchsorted(self._cumulative, env.rng.random(), side="right")), len(self.banks) - 1)
+        bank = self.banks[tier]
+        bank.load(env, int(env.rng.integers(len(bank))))
+        return tier
+
+    def report(self, tier, success):
+        """
+        Record the outcome of an episode on a world of `tier`
+        """
+        window = self._outcomes.shape[1]
+        self._outcomes[tier, self._n_outcomes[tier] % window] = success
+        self._n_outcomes[tier] += 1
+        self._n_reports += 1
+        if self._n_reports % self.update_every == 0:
+            self.update_proportions()
+
@@ -0,0 +1,218 @@
+import argparse
+import json
+import multiprocessing as mp
+import os
+
+import numpy as np
+import aufgabe2
+import seeding
+from agents import AgentV2
+from aufgabe2_mike import WumpusEnv
+
+# teacher agents for behaviour cloning as (class, extra kwargs); all get `size`
+TEACHERS = [
+    (AgentV2, {}),
+    (aufgabe2.Agent, {}),
+]
+
+INDEX = "index.json"
+
+
+def play_episode(env, teacher, gamma):
+    """
+    Let a teacher play one episode of `aufgabe2_mike.WumpusEnv` and return
+    the network observations (`Agent._get_observation`), the teacher's
+    actions and the discounted returns from every step on
+    """
+    teacher.new_episode()
+    obs, _ = env.reset()
+    observations, actions, rewards = [], [], []
+    reward = 0
+    terminated = False
+    while not terminated:
+        # the teachers act on the raw percept, the network sees the encoding
+        action = int(teacher.get_action(env.obs, reward))
+        observations.append(obs)
+        actions.append(action)
+        obs, reward, terminated, _, _ = env.step(action)
+        rewards.append(reward)
+
+    returns = np.zeros(len(rewards), dtype=np.float32)
+    ret = 0.0
+    for t in range(len(rewards) - 1, -1, -1):
+        ret = rewards[t] + gamma * ret
+        returns[t] = ret
+    return np.array(observations, dtype=np.float32), np.array(actions, dtype=np.uint8), returns
+
+
+def _save(path, array):
+    # write under a temporary name, so readers never see half a shard
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def _generate_shard(args):
+    """
+    Worker: play the episodes of one shard and write it to disk; only the
+    shard statistics travel back to the parent process
+    """
+    directory, shard, seed_seq, n_episodes, teacher, env_kwargs, gamma = args
+    teacher_cls, teacher_kwargs = teacher
+
+    # anything still drawing from the global generator gets a stream of its own too
+    env_seed, global_seed = seed_seq.spawn(2)
+    seeding.seed_global(global_seed)
+
+    env = WumpusEnv(seed=env_seed, **env_kwargs)
+    agent = teacher_cls(size=env.size, **teacher_kwargs)
+    episodes = [play_episode(env, agent, gamma) for _ in range(n_episodes)]
+
+    name = f"shard-{shard:05d}"
+    for i, column in enumerate(["obs", "action", "return"]):
+        _save(os.path.join(directory, f"{name}.{column}.npy"), np.concatenate([e[i] for e in episodes]))
+    return {
+        "name": name,
+        "teacher": f"{teacher_cls.__module__}.{teacher_cls.__name__}",
+        "n_episodes": n_episodes,
+        "n_rows": sum(len(e[1]) for e in episodes),
+        "mean_return": float(np.mean([e[2][0] for e in episodes])),
+    }
+
+
+def iter_generate(directory, n_episodes, teachers=TEACHERS, env_kwargs=None, gamma=0.99,
+                  seed=2025, n_workers=None, shard_episodes=1000):
+    """
+    Generate a behaviour cloning dataset in a process pool and yield the
+    info dict of every shard as soon as it is on disk.
+
+    Shard i holds `shard_episodes` episodes played by teachers[i % len(teachers)]
+    with the i-th child of `np.random.SeedSequence(seed)`. Every worker
+    writes its shard itself as `.npy` files (obs float32, action uint8,
+    return float32), so memory stays bounded by one shard per worker.
+    The shard index is rewritten after every shard, a dataset whose
+    generation was interrupted can be read as far as it got.
+
+    env_kwargs ... arguments of `aufgabe2_mike.WumpusEnv`
+    gamma ... discount factor of the returns (the PPO default)
+    """
+    env_kwargs = {} if env_kwargs is None else env_kwargs
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    os.makedirs(directory, exist_ok=True)
+
+    starts = list(range(0, n_episodes, shard_episodes))
+    seed_seqs = seeding.spawn(seed, len(starts))
+    tasks = [
+        (directory, shard, seed_seq, min(shard_episodes, n_episodes - start),
+         teachers[shard % len(teachers)], env_kwargs, gamma)
+        for shard, (start, seed_seq) in enumerate(zip(starts, seed_seqs))
+    ]
+
+    shards = []
+    def done(info):
+        shards.append(info)
+        shards.sort(key=lambda s: s["name"])
+        write_index(directory, shards, gamma)
+        return info
+
+    if n_workers <= 1:
+        for task in tasks:
+            yield done(_generate_shard(task))
+        return
+
+    with mp.get_context().Pool(min(n_workers, len(tasks))) as pool:
+        for info in pool.imap_unordered(_generate_shard, tasks):
+            yield done(info)
+
+
+def generate(directory, n_episodes, **kwargs):
+    """
+    Generate a dataset, see `iter_generate` for the arguments
+    """
+    for _ in iter_generate(directory, n_episodes, **kwargs):
+        pass
+    return Dataset(directory)
+
+
+def write_index(directory, shards, gamma):
+    path = os.path.join(directory, INDEX)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"gamma": gamma, "shards": shards}, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+class Dataset:
+    """
+    (obs, action, return) dataset written by `iter_generate`. Shards are
+    memory-mapped, so opening a dataset reads nothing but the index.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX)) as f:
+            index = json.load(f)
+        self.gamma = index["gamma"]
+        self.shards = index["shards"]
+
+    def __len__(self):
+        return sum(shard["n_rows"] for shard in self.shards)
+
+    def shard(self, i):
+        """
+        (obs, action, return) memory maps of shard i
+        """
+        name = self.shards[i]["name"]
+        return tuple(
+            np.load(os.path.join(self.directory, f"{name}.{column}.npy"), mmap_mode="r")
+            for column in ["obs", "action", "return"]
+        )
+
+    def iter_minibatches(self, batch_size=256, shuffle=True, seed=None, shards_in_memory=4, drop_last=False):
+        """
+        Yield (obs, action, return) minibatches over one pass of the data.
+
+        With `shuffle`, shards are visited in random order and read
+        `shards_in_memory` at a time; rows are shuffled within that window
+        (plus the rows left over from the previous one), which keeps
+        memory bounded while mixing episodes of different teachers.
+        """
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(self.shards)) if shuffle else np.arange(len(self.shards))
+        rest = None
+        for start in range(0, len(order), shards_in_memory):
+            window = [self.shard(i) for i in order[start:start + shards_in_memory]]
+            columns = [np.concatenate([np.asarray(s[c]) for s in window]) for c in range(3)]
+            if rest is not None:
+                columns = [np.concatenate([r, c]) for r, c in zip(rest, columns)]
+            if shuffle:
+                perm = rng.permutation(len(columns[0]))
+                columns = [c[perm] for c in columns]
+
+            n_full = len(columns[0]) // batch_size * batch_size
+            for i in range(0, n_full, batch_size):
+                yield tuple(c[i:i + batch_size] for c in columns)
+            rest = [c[n_full:] for c in columns]
+
+        if rest is not None and len(rest[0]) > 0 and not drop_last:
+            yield tuple(rest)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a behaviour cloning dataset from the heuristic agents")
+    parser.add_argument("directory")
+    parser.add_argument("--episodes", type=int, default=100_000)
+    parser.add_argument("--shard-episodes", type=int, default=1000)
+    parser.add_argument("--p-pit", type=float, default=0.2)
+    parser.add_argument("--tmax", type=int, default=50)
+    parser.add_argument("--gamma", type=float, default=0.99)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    args = parser.parse_args()
+
+    for info in iter_generate(
+        args.directory, args.episodes,
+        env_kwargs=dict(p_pit=args.p_pit, Tmax=args.tmax),
+        gamma=args.gamma, seed=args.seed, n_workers=args.workers, shard_episodes=args.shard_episodes,
+    ):
+        print(f"{info['name']}: {info['n_rows']} steps of {info['teacher']}, mean return {info['mean_return']:.2f}", flush=True)
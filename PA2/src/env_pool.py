@@ -0,0 +1,261 @@
+import multiprocessing as mp
+import os
+from multiprocessing.connection import wait
+
+import cloudpickle
+import numpy as np
+
+
+def _shared_array(ctx, shape, dtype):
+    """
+    Allocate a zero-initialised array in shared memory
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return ctx.RawArray("b", max(1, nbytes))
+
+
+def _as_array(raw, shape, dtype):
+    return np.frombuffer(raw, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+
+def _run(envs, start, cmd, ids, arrays):
+    """
+    Step or reset the environments `ids` (owned from index `start` on) and
+    write the results into the shared arrays. A terminated environment is
+    reset right away: its row of `obs` holds the first observation of the
+    next episode and `final_obs` the last one of the finished episode.
+    """
+    obs, final_obs, rewards, terminated, truncated, actions = arrays
+    for i in ids:
+        env = envs[i - start]
+        if cmd == "step":
+            observation, reward, term, trunc, _ = env.step(actions[i])
+            if term or trunc:
+                final_obs[i] = observation
+                observation, _ = env.reset()
+        else:
+            observation, _ = env.reset()
+            reward, term, trunc = 0.0, False, False
+        obs[i] = observation
+        rewards[i] = reward
+        terminated[i] = term
+        truncated[i] = trunc
+
+
+def _worker(remote, parent_remote, env_fns, start, buffers, shapes):
+    """
+    Owns the environments start, start+1, ... and steps the ones it is
+    sent, in order; every message is answered with its env ids once all
+    of them are done.
+    """
+    parent_remote.close()
+    envs = [env_fn() for env_fn in cloudpickle.loads(env_fns)]
+    arrays = [_as_array(raw, *shape) for raw, shape in zip(buffers, shapes)]
+
+    try:
+        while True:
+            cmd, ids = remote.recv()
+            if cmd == "close":
+                for env in envs:
+                    env.close()
+                remote.close()
+                break
+            _run(envs, start, cmd, ids, arrays)
+            remote.send(ids)
+    except KeyboardInterrupt:
+        print("EnvPool worker: got KeyboardInterrupt")
+
+
+class EnvPool:
+    """
+    Asynchronous pool of gymnasium environments (e.g. `aufgabe2_mike.WumpusEnv`)
+    in the style of envpool: `send` hands actions for some environments
+    to the workers and returns at once, `recv` returns the first
+    `batch_size` environments whose step is done, whichever they are.
+
+    With more environments than `batch_size`, the policy acts on one
+    batch while the workers step the others, and a few slow environments
+    (long episodes, expensive resets) do not hold up the rest.
+
+    Every worker process owns a contiguous block of environments;
+    observations, rewards, flags and actions live in shared-memory NumPy
+    arrays, only env ids go through the pipes. Terminated or truncated
+    environments are reset inside the worker, see `recv`.
+
+    env_fns ... list of functions creating the environments
+    batch_size ... environments per `recv` (default: all)
+    n_workers ... number of worker processes (default: number of cores);
+        0 steps the environments in this process on `send`
+    start_method ... multiprocessing start method
+    """
+    def __init__(self, env_fns, batch_size=None, n_workers=None, start_method=None):
+        self.closed = False
+        self.n_envs = n_envs = len(env_fns)
+        self.batch_size = n_envs if batch_size is None else batch_size
+        if not 0 < self.batch_size <= n_envs:
+            raise ValueError("batch_size must be between 1 and the number of environments")
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, n_envs)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        # spaces are needed to size the shared buffers before the workers start
+        env = env_fns[0]()
+        self.observation_space, self.action_space = env.observation_space, env.action_space
+        if n_workers > 0:
+            env.close()
+
+        obs_shape = (n_envs, *self.observation_space.shape)
+        shapes = [
+            (obs_shape, self.observation_space.dtype),
+            (obs_shape, self.observation_space.dtype),
+            ((n_envs,), np.float32),
+            ((n_envs,), np.bool_),
+            ((n_envs,), np.bool_),
+            ((n_envs, *self.action_space.shape), self.action_space.dtype),
+        ]
+        buffers = [_shared_array(ctx, shape, dtype) for shape, dtype in shapes]
+        self._arrays = [_as_array(raw, shape, dtype) for raw, (shape, dtype) in zip(buffers, shapes)]
+        self._obs, self._final_obs, self._rewards, self._terminated, self._truncated, self._actions = self._arrays
+
+        self._pending = np.zeros(n_envs, dtype=bool) # sent, not yet returned by recv
+        self._ready = [] # done, not yet returned by recv
+        self._in_flight = {} # remote -> number of unanswered messages
+
+        if n_workers == 0:
+            self._envs = [env] + [env_fn() for env_fn in env_fns[1:]]
+            self.remotes = []
+            self.processes = []
+            return
+
+        blocks = np.array_split(np.arange(n_envs), n_workers)
+        self.slices = [(int(ids[0]), int(ids[-1]) + 1) for ids in blocks]
+        self._owner = np.repeat(np.arange(n_workers), [len(ids) for ids in blocks])
+        self.remotes, work_remotes = zip(*[ctx.Pipe() for _ in range(n_workers)])
+        self.processes = []
+        for work_remote, remote, (start, stop) in zip(work_remotes, self.remotes, self.slices):
+            args = (work_remote, remote, cloudpickle.dumps(env_fns[start:stop]), start, buffers, shapes)
+            # daemon=True: if the main process crashes, we should not cause things to hang
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+    def _dispatch(self, cmd, env_ids, actions=None):
+        if self._pending[env_ids].any():
+            raise ValueError("environment still has a step pending, recv() it first")
+        if actions is not None:
+            # only now: a worker may still be reading the actions of a pending step
+            self._actions[env_ids] = np.asarray(actions).reshape(len(env_ids), *self._actions.shape[1:])
+        self._pending[env_ids] = True
+
+        if not self.remotes:
+            _run(self._envs, 0, cmd, env_ids.tolist(), self._arrays)
+            self._ready.extend(env_ids.tolist())
+            return
+
+        # messages of at most the share of one worker in a batch, so that a
+        # worker does not hold back environments it is already done with
+        chunk = max(1, -(-self.batch_size // len(self.remotes)))
+        owners = self._owner[env_ids]
+        for w, remote in enumerate(self.remotes):
+            ids = env_ids[owners == w].tolist()
+            for k in range(0, len(ids), chunk):
+                remote.send((cmd, ids[k:k + chunk]))
+                self._in_flight[remote] = self._in_flight.get(remote, 0) + 1
+
+    def send(self, actions, env_ids=None):
+        """
+        Start a step of the environments `env_ids` (default: all) with
+        `actions` (one per environment) and return without waiting for it
+        """
+        env_ids = np.arange(self.n_envs) if env_ids is None else np.asarray(env_ids, dtype=np.int64).reshape(-1)
+        self._dispatch("step", env_ids, actions)
+
+    def async_reset(self):
+        """
+        Start a reset of all environments; the first observations are
+        returned by `recv` like steps with reward 0
+        """
+        self._dispatch("reset", np.arange(self.n_envs))
+
+    def recv(self):
+        """
+        Wait until `batch_size` environments are done and return
+        (obs, rewards, terminated, truncated, info) for them, where
+        `info["env_id"]` holds their ids in the order of the rows.
+
+        Environments that finished an episode are already reset: their
+        `obs` is the first observation of the next episode and
+        `info["final_obs"]` (rows of the others are stale) the last one.
+        """
+        if self._pending.sum() < self.batch_size:
+            raise RuntimeError("fewer environments pending than batch_size, send() first")
+        while len(self._ready) < self.batch_size:
+            busy = [remote for remote, n in self._in_flight.items() if n > 0]
+            for remote in wait(busy):
+                self._ready.extend(remote.recv())
+                self._in_flight[remote] -= 1
+
+        env_ids = np.array(self._ready[:self.batch_size], dtype=np.int64)
+        del self._ready[:self.batch_size]
+        self._pending[env_ids] = False
+        info = {"env_id": env_ids, "final_obs": self._final_obs[env_ids]}
+        return self._obs[env_ids], self._rewards[env_ids], self._terminated[env_ids], self._truncated[env_ids], info
+
+    def reset(self):
+        """
+        Reset all environments and return (obs, info) in env order, as a
+        synchronous vectorised env would
+        """
+        self._drain()
+        self.async_reset()
+        batch_size, self.batch_size = self.batch_size, self.n_envs
+        try:
+            obs, _, _, _, info = self.recv()
+        finally:
+            self.batch_size = batch_size
+        order = np.argsort(info["env_id"])
+        return obs[order], {"env_id": info["env_id"][order]}
+
+    def step(self, actions, env_ids=None):
+        """
+        `send` followed by `recv`
+        """
+        self.send(actions, env_ids)
+        return self.recv()
+
+    def _drain(self):
+        """
+        Wait for all outstanding messages and forget their results
+        """
+        for remote, n in self._in_flight.items():
+            for _ in range(n):
+                remote.recv()
+        self._in_flight.clear()
+        self._ready.clear()
+        self._pending[:] = False
+
+    def close(self):
+        if self.closed:
+            return
+        if not self.remotes:
+            for env in self._envs:
+                env.close()
+        self._drain()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,300 @@
+import argparse
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+from aufgabe2_mike import NeuralNetwork, agent_network
+from batched_agent import BatchedAgentState
+from vector_wumpus import VectorWumpus
+
+
+def noise(seed, generation, pair, dim):
+    """
+    Perturbation of pair `pair` in `generation`; every process can
+    recreate it from these integers, so only they are ever sent around
+    """
+    return np.random.default_rng([seed, generation, pair + 1]).standard_normal(dim, dtype=np.float32)
+
+
+def centered_ranks(x):
+    """
+    Fitness shaping: ranks scaled to [-0.5, 0.5]
+    """
+    ranks = np.empty(len(x), dtype=np.float32)
+    ranks[np.argsort(x)] = np.arange(len(x))
+    return ranks / max(1, len(x) - 1) - 0.5
+
+
+class Population:
+    """
+    Greedy policies of many flat weight vectors of one architecture,
+    evaluated together: the observations of all candidates go through
+    one batched matmul per layer and play one `VectorWumpus`.
+    """
+    def __init__(self, shapes, size=(4,4), p_pit=0.2, Tmax=50):
+        """
+        shapes ... weight matrix shapes of the `NeuralNetwork` layers
+        """
+        self.shapes = shapes
+        self.size = size
+        self.p_pit = p_pit
+        self.Tmax = Tmax
+
+    def unflatten(self, thetas):
+        """
+        (k, dim) flat vectors (`get_weights_flat` layout) -> per layer
+        (k, in, out) weights and (k, 1, out) biases
+        """
+        layers = []
+        idx = 0
+        for n_in, n_out in self.shapes:
+            w = thetas[:, idx:idx + n_in * n_out].reshape(-1, n_in, n_out)
+            idx += n_in * n_out
+            b = thetas[:, idx:idx + n_out].reshape(-1, 1, n_out)
+            idx += n_out
+            layers.append((w, b))
+        return layers
+
+    def fitness(self, thetas, n_episodes, seed):
+        """
+        Mean total reward of every candidate over the same `n_episodes`
+        worlds generated from `seed`
+        """
+        k = len(thetas)
+        n = k * n_episodes
+        layers = self.unflatten(thetas)
+        env = VectorWumpus(n, size=self.size, p_pit=self.p_pit, Tmax=self.Tmax, seed=seed, autoreset=True)
+        agents = BatchedAgentState(n, size=self.size, p_pit=self.p_pit, t_max=self.Tmax)
+        # worlds of the first candidate only, so they do not depend on k
+        env.reset(np.arange(n_episodes))
+        percepts = env.repeat_worlds(n_episodes)
+        agents.new_episode()
+        agents.update(percepts)
+
+        totals = np.zeros(n)
+        running = np.ones(n, dtype=bool) # still in the first episode
+        last = len(layers) - 1
+        while running.any():
+            x = agents.observe().reshape(k, n_episodes, -1)
+            for i, (w, b) in enumerate(layers):
+                x = np.matmul(x, w) + b
+                if i < last:
+                    np.tanh(x, out=x)
+            actions = np.argmax(x, axis=-1).reshape(n)
+
+            agents.apply_actions(actions)
+            percepts, rewards, terminated, _ = env.step(actions)
+            totals += rewards * running
+            running &= ~terminated
+            # autoreset started new episodes, their agents start over as well
+            ended = np.flatnonzero(terminated)
+            if len(ended):
+                agents.new_episode(ended)
+            agents.update(percepts)
+        return totals.reshape(k, n_episodes).mean(axis=1)
+
+
+def _evaluate_pairs(population, theta, seed, generation, start, stop, sigma, n_episodes, fitness):
+    """
+    Evaluate theta +- sigma * noise for the pairs start..stop-1 of a
+    generation and write their fitness into rows start..stop-1 of `fitness`
+    """
+    eps = np.stack([noise(seed, generation, j, len(theta)) for j in range(start, stop)])
+    thetas = np.concatenate([theta + sigma * eps, theta - sigma * eps])
+    f = population.fitness(thetas, n_episodes, seed=[seed, generation])
+    fitness[start:stop, 0] = f[:stop - start]
+    fitness[start:stop, 1] = f[stop - start:]
+
+
+def _worker(tasks, done, population, theta_raw, fitness_raw, dim, max_pairs, settings):
+    """
+    Reads the parameters and writes fitness through shared memory; only
+    integers (generation, first pair, last pair) come through the queue
+    """
+    theta = np.frombuffer(theta_raw, dtype=np.float32, count=dim)
+    fitness = np.frombuffer(fitness_raw, dtype=np.float64, count=2 * max_pairs).reshape(max_pairs, 2)
+    seed, sigma, n_episodes = settings
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        generation, start, stop = task
+        _evaluate_pairs(population, theta.copy(), seed, generation, start, stop, sigma, n_episodes, fitness)
+        done.put(stop - start)
+
+
+class ESTrainer:
+    """
+    Evolution strategies (antithetic sampling, centered ranks, Adam) on the
+    flat weights of a `NeuralNetwork` playing `wumpus.Wumpus` rules.
+
+    Per generation, every worker process gets ranges of pair indices; it
+    recreates the perturbations from (seed, generation, pair), reads the
+    current parameters from shared memory and writes the fitness of both
+    signs into a shared array. The parent then recreates the same
+    perturbations to compute the update.
+    """
+    def __init__(self, net=None, size=(4,4), p_pit=0.2, Tmax=50, n_pairs=64, n_episodes=32,
+                 sigma=0.02, lr=0.01, weight_decay=0.005, seed=2025, n_workers=None):
+        """
+        net ... initial network (default: the shipped agent weights)
+        n_pairs ... antithetic pairs per generation (population 2 * n_pairs)
+        n_episodes ... worlds every candidate plays per generation
+        sigma ... standard deviation of the perturbations
+        """
+        net = agent_network() if net is None else net
+        self.shapes = [w.shape for w in net.weights]
+        self.theta = net.get_weights_flat().astype(np.float32)
+        self.dim = len(self.theta)
+        self.population = Population(self.shapes, size=size, p_pit=p_pit, Tmax=Tmax)
+        self.n_pairs = n_pairs
+        self.n_episodes = n_episodes
+        self.sigma = sigma
+        self.lr = lr
+        self.weight_decay = weight_decay
+        self.seed = seed
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.generation = 0
+
+        # Adam
+        self._m = np.zeros(self.dim, dtype=np.float32)
+        self._v = np.zeros(self.dim, dtype=np.float32)
+
+        self._pool = None
+        ctx = mp.get_context()
+        self._theta_raw = ctx.RawArray("f", self.dim)
+        self._fitness_raw = ctx.RawArray("d", 2 * n_pairs)
+        self._shared_theta = np.frombuffer(self._theta_raw, dtype=np.float32)
+        self.fitness = np.frombuffer(self._fitness_raw, dtype=np.float64).reshape(n_pairs, 2)
+
+    def _start_workers(self):
+        ctx = mp.get_context()
+        tasks, done = ctx.Queue(), ctx.Queue()
+        settings = (self.seed, self.sigma, self.n_episodes)
+        workers = [
+            ctx.Process(
+                target=_worker, daemon=True,
+                args=(tasks, done, self.population, self._theta_raw, self._fitness_raw, self.dim, self.n_pairs, settings),
+            )
+            for _ in range(self.n_workers)
+        ]
+        for w in workers:
+            w.start()
+        self._pool = (tasks, done, workers)
+
+    def close(self):
+        if self._pool is None:
+            return
+        tasks, _, workers = self._pool
+        for _ in workers:
+            tasks.put(None)
+        for w in workers:
+            w.join()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def evaluate_population(self):
+        """
+        Fill `self.fitness` (n_pairs, 2) for the current generation
+        """
+        if self.n_workers <= 1:
+            _evaluate_pairs(self.population, self.theta, self.seed, self.generation, 0, self.n_pairs,
+                            self.sigma, self.n_episodes, self.fitness)
+            return self.fitness
+
+        if self._pool is None:
+            self._start_workers()
+        tasks, done, _ = self._pool
+        self._shared_theta[:] = self.theta
+        # a few tasks per worker even out differences in episode lengths
+        bounds = np.linspace(0, self.n_pairs, min(self.n_pairs, 4 * self.n_workers) + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            tasks.put((self.generation, int(start), int(stop)))
+        n_done = 0
+        while n_done < self.n_pairs:
+            n_done += done.get()
+        return self.fitness
+
+    def step(self):
+        """
+        One generation; returns the mean fitness of the population
+        """
+        fitness = self.evaluate_population()
+        ranks = centered_ranks(fitness.ravel()).reshape(fitness.shape)
+        weights = ranks[:, 0] - ranks[:, 1]
+
+        grad = np.zeros(self.dim, dtype=np.float32)
+        for j, w in enumerate(weights):
+            if w != 0:
+                grad += w * noise(self.seed, self.generation, j, self.dim)
+        grad /= 2 * self.n_pairs * self.sigma
+        grad -= self.weight_decay * self.theta # ascent on fitness, decay towards 0
+
+        # Adam step towards higher fitness
+        beta1, beta2 = 0.9, 0.999
+        t = self.generation + 1
+        self._m = beta1 * self._m + (1 - beta1) * grad
+        self._v = beta2 * self._v + (1 - beta2) * grad * grad
+        m_hat = self._m / (1 - beta1 ** t)
+        v_hat = self._v / (1 - beta2 ** t)
+        self.theta = self.theta + self.lr * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+        self.generation += 1
+        return float(fitness.mean())
+
+    def network(self):
+        """
+        `NeuralNetwork` with the current parameters
+        """
+        return NeuralNetwork.from_arrays(*_split(self.theta.copy(), self.shapes))
+
+    def validate(self, n_episodes=1000, seed=0):
+        """
+        Mean total reward of the current parameters on fresh worlds
+        """
+        return float(self.population.fitness(self.theta[None], n_episodes, seed=seed)[0])
+
+
+def _split(flat, shapes):
+    weights, biases = [], []
+    idx = 0
+    for n_in, n_out in shapes:
+        weights.append(flat[idx:idx + n_in * n_out].reshape(n_in, n_out))
+        idx += n_in * n_out
+        biases.append(flat[idx:idx + n_out])
+        idx += n_out
+    return weights, biases
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the aufgabe2_mike network with evolution strategies")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--pairs", type=int, default=64, help="antithetic pairs per generation")
+    parser.add_argument("--episodes", type=int, default=32, help="episodes per candidate")
+    parser.add_argument("--sigma", type=float, default=0.02)
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--p-pit", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--out", default="es_agent.ckpt", help="checkpoint, see NeuralNetwork.save")
+    args = parser.parse_args()
+
+    with ESTrainer(
+        n_pairs=args.pairs, n_episodes=args.episodes, sigma=args.sigma, lr=args.lr,
+        p_pit=args.p_pit, seed=args.seed, n_workers=args.workers,
+    ) as trainer:
+        print(f"start: validation {trainer.validate():.2f}")
+        for g in range(args.generations):
+            start = time.perf_counter()
+            mean = trainer.step()
+            print(f"generation {g}: population mean {mean:.2f} ({time.perf_counter() - start:.2f}s)", flush=True)
+            if (g + 1) % 10 == 0:
+                print(f"validation {trainer.validate():.2f}", flush=True)
+                trainer.network().save(args.out)
+    trainer.network().save(args.out)
@@ -0,0 +1,162 @@
+import multiprocessing as mp
+import os
+from statistics import NormalDist
+
+import numpy as np
+import seeding
+from trajectory_log import TrajectoryWriter
+from wumpus import Wumpus
+
+
+def run_episode(env, agent):
+    """
+    Play one episode and return the total reward
+    """
+    agent.new_episode()
+
+    terminated = False
+    percept = env.reset()
+    reward = 0
+    total_reward = 0
+    while not terminated:
+        action = agent.get_action(percept, reward)
+        percept, reward, terminated, info = env.step(action)
+        total_reward += reward
+    return total_reward
+
+
+def _evaluate_chunk(args):
+    """
+    Worker: evaluate one chunk of episodes with its own seed stream
+    """
+    chunk, seed_seq, n_episodes, agent_cls, agent_kwargs, env_cls, env_kwargs, log_dir = args
+
+    # agents drawing from the global generator get a stream of their own too
+    env_seed, global_seed = seed_seq.spawn(2)
+    seeding.seed_global(global_seed)
+
+    # an int seed, so that logged episodes can be replayed from it
+    env = env_cls(seed=seeding.int_seed(env_seed), **env_kwargs)
+    agent = agent_cls(**agent_kwargs)
+    if log_dir is None:
+        rewards = np.array([run_episode(env, agent) for _ in range(n_episodes)], dtype=np.float64)
+        return chunk, rewards
+    with TrajectoryWriter(log_dir, shard=f"chunk-{chunk:06d}") as writer:
+        writer.attach(env)
+        rewards = np.array([run_episode(env, agent) for _ in range(n_episodes)], dtype=np.float64)
+    return chunk, rewards
+
+
+def iter_evaluate(agent_cls, n_episodes, agent_kwargs=None, env_cls=Wumpus, env_kwargs=None,
+                  seed=2025, n_workers=None, chunk_size=1000, log_dir=None):
+    """
+    Evaluate an agent over `n_episodes` episodes in a process pool and
+    yield (first_episode, rewards) for every finished chunk of episodes.
+
+    Episodes are grouped into chunks of `chunk_size`; chunk i plays with
+    the i-th child of `np.random.SeedSequence(seed)`, so the rewards of
+    every episode only depend on `seed` and `chunk_size`, not on the
+    number of workers or on the order in which chunks finish.
+
+    agent_cls ... agent class with new_episode() and get_action(percept, reward)
+    env_cls ... environment class taking a `seed` argument
+    log_dir ... if given, record every episode into this
+        `trajectory_log` directory, one shard per chunk
+    """
+    agent_kwargs = {} if agent_kwargs is None else agent_kwargs
+    env_kwargs = {} if env_kwargs is None else env_kwargs
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    starts = list(range(0, n_episodes, chunk_size))
+    seed_seqs = seeding.spawn(seed, len(starts))
+    tasks = [
+        (chunk, seed_seq, min(chunk_size, n_episodes - start), agent_cls, agent_kwargs, env_cls, env_kwargs, log_dir)
+        for chunk, (start, seed_seq) in enumerate(zip(starts, seed_seqs))
+    ]
+
+    if n_workers <= 1:
+        for task in tasks:
+            chunk, rewards = _evaluate_chunk(task)
+            yield starts[chunk], rewards
+        return
+
+    with mp.get_context().Pool(min(n_workers, len(tasks))) as pool:
+        for chunk, rewards in pool.imap_unordered(_evaluate_chunk, tasks):
+            yield starts[chunk], rewards
+
+
+def episode_env(episode, env_cls=Wumpus, env_kwargs=None, seed=2025, chunk_size=1000):
+    """
+    Environment right after the reset of episode number `episode` of an
+    `iter_evaluate` run with the same seed, chunk size and env arguments,
+    e.g. to look into one bad episode out of millions
+    """
+    env_kwargs = {} if env_kwargs is None else env_kwargs
+    chunk = episode // chunk_size
+    env_seed, global_seed = seeding.spawn(seed, chunk + 1)[chunk].spawn(2)
+    seeding.seed_global(global_seed)
+    env = env_cls(seed=seeding.int_seed(env_seed), **env_kwargs)
+    for _ in range(episode % chunk_size + 1):
+        env.reset()
+    return env
+
+
+def evaluate(agent_cls, n_episodes, **kwargs):
+    """
+    Evaluate an agent, see `iter_evaluate` for the arguments
+    """
+    rewards = np.zeros(n_episodes)
+    for start, chunk_rewards in iter_evaluate(agent_cls, n_episodes, **kwargs):
+        rewards[start:start + len(chunk_rewards)] = chunk_rewards
+    return EvaluationResult(rewards)
+
+
+class EvaluationResult:
+    """
+    Total rewards of evaluated episodes and their statistics
+    """
+    def __init__(self, rewards):
+        self.rewards = np.asarray(rewards, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.rewards)
+
+    @property
+    def mean(self):
+        return self.rewards.mean()
+
+    @property
+    def std(self):
+        return self.rewards.std(ddof=1) if len(self) > 1 else 0.0
+
+    @property
+    def stderr(self):
+        return self.std / np.sqrt(len(self))
+
+    def confidence_interval(self, level=0.95):
+        """
+        Normal-approximation confidence interval of the mean reward
+        """
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        return self.mean - z * self.stderr, self.mean + z * self.stderr
+
+    def histogram(self, bins=20):
+        """
+        (counts, bin_edges) of the total rewards, as `np.histogram`
+        """
+        return np.histogram(self.rewards, bins=bins)
+
+    def summary(self, level=0.95, bins=10):
+        low, high = self.confidence_interval(level)
+        lines = [
+            f"Episodes: {len(self)}",
+            f"Average total reward: {self.mean:.3f} +- {self.stderr:.3f}",
+            f"{level:.0%} confidence interval: [{low:.3f}, {high:.3f}]",
+            "Histogram:",
+        ]
+        counts, edges = self.histogram(bins)
+        width = 40 / max(1, counts.max())
+        for count, left, right in zip(counts, edges[:-1], edges[1:]):
+            lines.append(f"  [{left:9.1f}, {right:9.1f}) {count:8d} {'#' * int(round(count * width))}")
+        return "\n".join(lines)
@@ -1,34 +1,25 @@
-import numpy as np
 from aufgabe2_mike import Agent
 # from agents import AgentV2 as Agent
+from evaluate import EvaluationResult, iter_evaluate
 from tqdm import tqdm
-from wumpus import Actions, Orientation, Percepts, Wumpus
+import numpy as np
 
 size = (4,4)
 n_repeat = 1000
+n_workers = None # all cores
+log_dir = None # e.g. "logs/interact" to record the trajectories (trajectory_log)
 
 if __name__ == "__main__":   
-    env = Wumpus(seed=2025, size=size, p_pit=0.20)
-
     cum_rewards = np.zeros(n_repeat)
-    agent = Agent(size=size)
-    for run in tqdm(range(n_repeat)):
-        agent.new_episode()
-
-        terminated = False
-        percept = env.reset()
-        reward = 0
-        while not terminated:
-            action = agent.get_action(percept, reward)
-            # tqdm.write(f"{action}")
-            percept, reward, terminated, info = env.step(action)
-            # tqdm.write("   percept: " + str(percept))
-            cum_rewards[run] += reward
-
-        tqdm.write(f"[{run+1:02d}] Total reward={cum_rewards[run]}")
+    with tqdm(total=n_repeat) as progress:
+        for start, rewards in iter_evaluate(
+            Agent, n_repeat,
+            agent_kwargs=dict(size=size),
+            env_kwargs=dict(size=size, p_pit=0.20),
+            seed=2025, n_workers=n_workers, chunk_size=100, log_dir=log_dir,
+        ):
+            cum_rewards[start:start + len(rewards)] = rewards
+            progress.update(len(rewards))
 
     # compute stats
-    average_total_reward = np.mean(cum_rewards)
-    print(f"Average total reward: {average_total_reward}")
-
-    # TODO plot histogram
\ No newline at end of file
+    print(EvaluationResult(cum_rewards).summary())
@@ -0,0 +1,143 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError: # the kernel also runs as plain Python
+    numba = None
+
+# fields of the int64 state vector
+X, Y, ORIENTATION, HAS_ARROW, HAS_GOLD, TERMINATED, WUMPUS_ALIVE = range(7)
+WUMPUS_X, WUMPUS_Y, GOLD_X, GOLD_Y, EXIT_X, EXIT_Y, T, TMAX = range(7, 15)
+N_FIELDS = 15
+
+# values of state[TERMINATED]
+RUNNING, DONE, TIMEOUT = 0, 1, 2
+
+# fields of the reward parameters: cost of every step, of shooting, reward
+# for grabbing the gold, for climbing out with it, for dying and for the
+# timeout, for entering a new cell without gold, for every step spent at
+# the exit with the gold, and whether a pit sets (1) or adds (0) R_DEATH
+R_STEP, R_SHOOT, R_GRAB, R_ESCAPE, R_DEATH, R_TIMEOUT, R_NEW_CELL, R_AT_EXIT, PIT_SETS_REWARD = range(9)
+
+# values of wumpus.Actions, wumpus.Orientation, wumpus.Percepts and the
+# wumpus.Cell bits as plain ints (numba freezes them as constants; wumpus
+# delegates to this module, so it cannot be imported here)
+_FORWARD, _LEFT, _RIGHT, _GRAB, _SHOOT, _CLIMB = range(6)
+_NORTH, _EAST, _SOUTH, _WEST = range(4)
+_PERCEPT_BITS, _PIT, _VISITED, _NOT_GLITTER = 0b111, 1 << 5, 1 << 7, 0xFF ^ (1 << 2)
+_BUMP_SHIFT, _SCREAM_SHIFT = 3, 4
+
+
+def _jit(fn):
+    return fn if numba is None else numba.njit(cache=True)(fn)
+
+
+def new_state():
+    """
+    Zeroed state vector: an int64 array for numba, a list of ints for the
+    plain Python kernel, which indexes lists faster than arrays
+    """
+    if numba is None:
+        return [0] * N_FIELDS
+    return np.zeros(N_FIELDS, dtype=np.int64)
+
+
+def reward_params(rewards):
+    """
+    Sequence of the R_* reward parameters in the form the kernel takes
+    """
+    if numba is None:
+        return rewards
+    return np.array(rewards, dtype=np.float64)
+
+
+@_jit
+def transition(state, grid, action, params):
+    """
+    Transition function shared by both Wumpus classes.
+
+    state ... state vector from `new_state`, updated in place
+    grid ... (W,H) uint8 cell grid (`wumpus.Cell` bits); the glitter bit of
+        grabbed gold and the visited bits are updated in place
+    action ... `Actions` value
+    params ... reward parameters from `reward_params`
+    Returns (state, percept bits, reward, done); done is True when the
+    episode terminated or timed out (state[TERMINATED] tells which).
+    """
+    width, height = grid.shape
+    x, y, o = int(state[X]), int(state[Y]), int(state[ORIENTATION])
+    bump = 0
+    scream = 0
+
+    reward = params[R_STEP] # any action costs
+    if state[HAS_GOLD] and x == state[EXIT_X] and y == state[EXIT_Y]:
+        reward += params[R_AT_EXIT]
+    terminated = False
+
+    dx, dy = 0, 0
+    if o == _NORTH:
+        dy = 1
+    elif o == _EAST:
+        dx = 1
+    elif o == _SOUTH:
+        dy = -1
+    else:
+        dx = -1
+    if action == _LEFT:
+        state[ORIENTATION] = (o - 1) % 4
+    elif action == _RIGHT:
+        state[ORIENTATION] = (o + 1) % 4
+    elif action == _FORWARD:
+        nx = min(max(x + dx, 0), width - 1)
+        ny = min(max(y + dy, 0), height - 1)
+        if nx == x and ny == y:
+            bump = 1
+        x, y = nx, ny
+        state[X], state[Y] = x, y
+    elif action == _SHOOT:
+        if state[HAS_ARROW]:
+            reward += params[R_SHOOT]
+            state[HAS_ARROW] = 0
+            # the arrow flies from the agent's own cell to the wall
+            wx, wy = state[WUMPUS_X] - x, state[WUMPUS_Y] - y
+            if (dx != 0 and wy == 0 and wx * dx >= 0) or (dy != 0 and wx == 0 and wy * dy >= 0):
+                state[WUMPUS_ALIVE] = 0
+                scream = 1
+    elif action == _GRAB:
+        if x == state[GOLD_X] and y == state[GOLD_Y]:
+            grid[x, y] = grid[x, y] & _NOT_GLITTER
+            state[HAS_GOLD] = 1
+            state[GOLD_X], state[GOLD_Y] = -1, -1
+            reward += params[R_GRAB]
+    elif action == _CLIMB:
+        if x == state[EXIT_X] and y == state[EXIT_Y]:
+            terminated = True
+            if state[HAS_GOLD]:
+                reward += params[R_ESCAPE]
+
+    # check for death, compile percepts
+    if state[WUMPUS_ALIVE] and x == state[WUMPUS_X] and y == state[WUMPUS_Y]:
+        reward += params[R_DEATH]
+        terminated = True
+    cell = int(grid[x, y])
+    if cell & _PIT:
+        if params[PIT_SETS_REWARD]:
+            reward = params[R_DEATH]
+        else:
+            reward += params[R_DEATH]
+        terminated = True
+    bits = (cell & _PERCEPT_BITS) | (bump << _BUMP_SHIFT) | (scream << _SCREAM_SHIFT)
+
+    if not cell & _VISITED:
+        grid[x, y] = cell | _VISITED
+        if not state[HAS_GOLD]:
+            reward += params[R_NEW_CELL]
+
+    state[T] += 1
+    state[TERMINATED] = DONE if terminated else RUNNING
+    if not terminated and state[T] >= state[TMAX] - 1:
+        reward += params[R_TIMEOUT]
+        state[TERMINATED] = TIMEOUT
+        terminated = True
+
+    return state, bits, reward, terminated
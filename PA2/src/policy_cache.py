@@ -0,0 +1,240 @@
+import argparse
+import functools
+from collections import OrderedDict
+
+import numpy as np
+import seeding
+from aufgabe2_mike import Agent, WumpusEnv, agent_network
+
+# entries of `Agent._get_observation` that are not in {-1, 0, 1}:
+# log10(t_max - t) and p_pit; they go into the key as raw float32 bytes
+CONTINUOUS = [8, 9]
+
+# 2 bits per {-1, 0, 1} entry, 4 entries per byte
+_BIT_WEIGHTS = np.array([1, 4, 16, 64], dtype=np.uint8)
+
+
+@functools.lru_cache(maxsize=None)
+def _discrete_features(n_features: int):
+    return np.setdiff1d(np.arange(n_features), CONTINUOUS)
+
+
+def _pack_discrete(obs: np.ndarray):
+    discrete = _discrete_features(obs.shape[-1])
+    n_bytes = -(-len(discrete) // 4)
+    values = np.zeros((*obs.shape[:-1], 4 * n_bytes), dtype=np.uint8)
+    values[..., :len(discrete)] = (obs + 1).take(discrete, axis=-1)
+    return values.reshape(*obs.shape[:-1], n_bytes, 4) @ _BIT_WEIGHTS
+
+
+def pack_observations(obs: np.ndarray):
+    """
+    Packed keys of a batch of `Agent._get_observation` vectors, one uint8
+    row per observation: 2 bits per {-1, 0, 1} entry, then the float32
+    bytes of the continuous ones. Equal rows means equal observations.
+    """
+    obs = np.asarray(obs, dtype=np.float32)
+    obs = obs.reshape(-1, obs.shape[-1])
+    return np.concatenate([_pack_discrete(obs), np.ascontiguousarray(obs[:, CONTINUOUS]).view(np.uint8)], axis=1)
+
+
+def pack_observation(obs: np.ndarray):
+    """
+    Hashable key of a single observation, the bytes of its
+    `pack_observations` row
+    """
+    obs = np.asarray(obs, dtype=np.float32)
+    return _pack_discrete(obs).tobytes() + obs[CONTINUOUS].tobytes()
+
+
+class PolicyCache:
+    """
+    LRU cache in front of a `NeuralNetwork`, with its `forward`: the
+    output for an observation is computed once and then looked up by the
+    packed observation, until it is the least recently used of more than
+    `maxsize` entries. Observations repeat a lot across episodes (same
+    map knowledge, position and time), so most calls are hits.
+    """
+    def __init__(self, net, maxsize=1 << 16):
+        self.net = net
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def forward(self, x: np.ndarray):
+        if np.ndim(x) > 1:
+            return np.stack([self.forward(row) for row in x])
+
+        key = pack_observation(x)
+        y = self._entries.get(key)
+        if y is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return y
+
+        self.misses += 1
+        y = self.net.forward(x)
+        y.setflags(write=False) # shared by every hit
+        self._entries[key] = y
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return y
+
+    def stats(self):
+        n = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "hit_rate": self.hits / max(n, 1)}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class PolicyTable:
+    """
+    Greedy policy frozen into a lookup table: packed observation keys
+    (uint8 rows, see `pack_observations`) and the action for each. At run
+    time the table is a dict, so an action costs a hash lookup; unseen
+    observations go to `fallback` (a network) if there is one.
+
+    `forward` returns one-hot action probabilities, so a table can stand
+    in for `Agent.net`.
+    """
+    def __init__(self, keys: np.ndarray, actions: np.ndarray, n_actions: int, fallback=None):
+        self.keys = keys
+        self.actions = actions
+        self.n_actions = n_actions
+        self.fallback = fallback
+        self.hits = 0
+        self.misses = 0
+        self._index = {key.tobytes(): int(a) for key, a in zip(keys, actions)}
+        self._one_hot = np.eye(n_actions, dtype=np.float32)
+        self._one_hot.setflags(write=False)
+
+    def __len__(self):
+        return len(self.actions)
+
+    @property
+    def nbytes(self):
+        return self.keys.nbytes + self.actions.nbytes
+
+    def act(self, obs: np.ndarray):
+        a = self._index.get(pack_observation(obs))
+        if a is not None:
+            self.hits += 1
+            return a
+        self.misses += 1
+        if self.fallback is None:
+            raise KeyError("observation not in the policy table")
+        return int(np.argmax(self.fallback.forward(obs)))
+
+    def forward(self, x: np.ndarray):
+        if np.ndim(x) > 1:
+            return np.stack([self.forward(row) for row in x])
+        return self._one_hot[self.act(x)]
+
+    def stats(self):
+        n = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "hit_rate": self.hits / max(n, 1)}
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            np.savez(f, keys=self.keys, actions=self.actions, n_actions=self.n_actions)
+
+    @classmethod
+    def load(cls, path: str, fallback=None):
+        with np.load(path) as data:
+            return cls(data["keys"], data["actions"], int(data["n_actions"]), fallback=fallback)
+
+
+def distill(net, n_episodes, env_kwargs=None, seed=2025):
+    """
+    Freeze the greedy policy of `net` into a `PolicyTable`.
+
+    The observations reachable by the policy are enumerated by playing
+    `n_episodes` greedy episodes of `aufgabe2_mike.WumpusEnv` (observations
+    of other policies or worlds only matter for those), collecting every
+    distinct one with the action the network takes there.
+
+    env_kwargs ... arguments of `aufgabe2_mike.WumpusEnv`
+    """
+    env_kwargs = {} if env_kwargs is None else env_kwargs
+    env = WumpusEnv(seed=seeding.spawn(seed, 1)[0], **env_kwargs)
+    cache = PolicyCache(net, maxsize=np.inf)
+
+    for _ in range(n_episodes):
+        obs, _ = env.reset()
+        terminated = False
+        while not terminated:
+            obs, _, terminated, _, _ = env.step(int(np.argmax(cache.forward(obs))))
+
+    keys = np.array([np.frombuffer(key, dtype=np.uint8) for key in cache._entries])
+    probas = np.array(list(cache._entries.values()))
+    actions = np.argmax(probas, axis=-1).astype(np.uint8)
+    return PolicyTable(keys, actions, probas.shape[-1], fallback=net)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_table(path: str):
+    return PolicyTable.load(path, fallback=agent_network())
+
+
+class CachedAgent(Agent):
+    """
+    `Agent` whose network sits behind a `PolicyCache`
+    """
+    __slots__ = ()
+
+    def __init__(self, *args, maxsize=1 << 16, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.net = PolicyCache(self.net, maxsize=maxsize)
+
+
+class TableAgent(Agent):
+    """
+    `Agent` playing a frozen `PolicyTable` from `table` (a `PolicyTable.save`
+    file, loaded once per process), falling back to the shipped network
+    """
+    __slots__ = ()
+
+    def __init__(self, *args, table: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.net = _load_table(table)
+
+
+if __name__ == "__main__":
+    import time
+    import wumpus_mike
+    from evaluate import evaluate
+
+    parser = argparse.ArgumentParser(description="Distill the shipped agent into a policy lookup table")
+    parser.add_argument("path")
+    parser.add_argument("--episodes", type=int, default=20_000)
+    parser.add_argument("--eval-episodes", type=int, default=2000)
+    parser.add_argument("--p-pit", type=float, default=0.2)
+    parser.add_argument("--tmax", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    env_kwargs = dict(p_pit=args.p_pit, Tmax=args.tmax)
+    start = time.perf_counter()
+    table = distill(agent_network(), args.episodes, env_kwargs=env_kwargs, seed=args.seed)
+    table.save(args.path)
+    print(f"{len(table)} observations ({table.nbytes / 1024:.0f} KiB) in {time.perf_counter() - start:.1f}s")
+
+    agent_kwargs = dict(p_pit=args.p_pit, t_max=args.tmax)
+    results = {}
+    for name, agent_cls, kwargs in [
+        ("network", Agent, agent_kwargs),
+        ("table", TableAgent, dict(agent_kwargs, table=args.path)),
+    ]:
+        start = time.perf_counter()
+        results[name] = evaluate(agent_cls, args.eval_episodes, agent_kwargs=kwargs, env_cls=wumpus_mike.Wumpus,
+                                 env_kwargs=env_kwargs, seed=args.seed + 1, n_workers=1)
+        print(f"{name}: mean reward {results[name].mean:.2f} in {time.perf_counter() - start:.1f}s")
+    same = np.mean(results["network"].rewards == results["table"].rewards)
+    print(f"same reward in {same:.1%} of the episodes, table {_load_table(args.path).stats()}")
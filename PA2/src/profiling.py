@@ -0,0 +1,105 @@
+import itertools
+import json
+import os
+
+# set to 1 to profile every `aufgabe2_mike.WumpusEnv` that is not told otherwise
+PROFILE_ENV_VAR = "WUMPUS_PROFILE"
+
+_ids = itertools.count()
+
+
+def profiling_enabled(flag=None):
+    """
+    `flag` if given, otherwise whether the `WUMPUS_PROFILE` env var is set (and not 0)
+    """
+    if flag is not None:
+        return bool(flag)
+    return os.environ.get(PROFILE_ENV_VAR, "0") not in ("", "0")
+
+
+class PhaseProfiler:
+    """
+    Cumulative `time.perf_counter_ns` timings and call counts per phase,
+    plus the first `max_events` calls as events for a Chrome trace
+    (chrome://tracing, Perfetto).
+
+    Profilers are plain data, so the ones of envs in worker processes can
+    be fetched (e.g. `vec_env.get_attr("profiler")`) and combined with
+    `merge`. perf_counter is a system-wide monotonic clock on Linux, so
+    the events of different processes line up in one trace.
+    """
+    def __init__(self, max_events=100_000):
+        self.max_events = max_events
+        self.pid = os.getpid()
+        self.tid = next(_ids)
+        self.totals = {} # phase -> [total ns, calls]
+        self.events = [] # (phase, start ns, duration ns, pid, tid)
+        self.dropped_events = 0
+
+    def record(self, phase, start, end):
+        """
+        Add a call of `phase` that ran from `start` to `end` (perf_counter_ns)
+        """
+        total = self.totals.get(phase)
+        if total is None:
+            total = self.totals[phase] = [0, 0]
+        total[0] += end - start
+        total[1] += 1
+        if len(self.events) < self.max_events:
+            self.events.append((phase, start, end - start, self.pid, self.tid))
+        else:
+            self.dropped_events += 1
+
+    def summary(self):
+        """
+        {phase: {"calls", "total_ms", "mean_us", "share"}}, where share is
+        the fraction of the time of all phases
+        """
+        all_ns = sum(ns for ns, _ in self.totals.values()) or 1
+        return {
+            phase: {
+                "calls": calls,
+                "total_ms": ns / 1e6,
+                "mean_us": ns / calls / 1e3,
+                "share": ns / all_ns,
+            }
+            for phase, (ns, calls) in self.totals.items()
+        }
+
+    def chrome_trace(self):
+        """
+        The recorded events in the Chrome trace-event format
+        """
+        return {
+            "traceEvents": [
+                {"name": phase, "ph": "X", "ts": start / 1e3, "dur": duration / 1e3, "pid": pid, "tid": tid}
+                for phase, start, duration, pid, tid in self.events
+            ],
+            "displayTimeUnit": "ns",
+            "otherData": {"dropped_events": self.dropped_events},
+        }
+
+    def save_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def reset(self):
+        self.totals.clear()
+        self.events.clear()
+        self.dropped_events = 0
+
+    @classmethod
+    def merge(cls, profilers):
+        """
+        One profiler with the totals and events of all `profilers`
+        """
+        merged = cls(max_events=sum(p.max_events for p in profilers))
+        for p in profilers:
+            for phase, (ns, calls) in p.totals.items():
+                total = merged.totals.setdefault(phase, [0, 0])
+                total[0] += ns
+                total[1] += calls
+            merged.events.extend(p.events)
+            merged.dropped_events += p.dropped_events
+        merged.events.sort(key=lambda e: e[1])
+        return merged
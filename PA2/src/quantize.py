@@ -0,0 +1,80 @@
+import argparse
+
+import numpy as np
+import seeding
+from aufgabe2_mike import AGENT_WEIGHTS, QuantizedNetwork, WumpusEnv, agent_network
+
+
+def sample_observations(net, n_episodes, env_kwargs=None, epsilon=0.1, seed=2025):
+    """
+    Observations of `aufgabe2_mike.WumpusEnv` episodes played greedily by
+    `net`, with a random action with probability `epsilon` so that states
+    just off the policy's path are covered too
+    """
+    env_kwargs = {} if env_kwargs is None else env_kwargs
+    env_seed, action_seed = seeding.spawn(seed, 2)
+    env = WumpusEnv(seed=env_seed, **env_kwargs)
+    rng = np.random.default_rng(action_seed)
+
+    observations = []
+    for _ in range(n_episodes):
+        obs, _ = env.reset()
+        terminated = False
+        while not terminated:
+            observations.append(obs)
+            if rng.random() < epsilon:
+                action = int(rng.integers(env.action_space.n))
+            else:
+                action = int(np.argmax(net.forward(obs)))
+            obs, _, terminated, _, _ = env.step(action)
+    return np.array(observations, dtype=np.float32)
+
+
+def accuracy_report(net, qnet, observations):
+    """
+    How closely `qnet` follows `net` on a batch of observations: share of
+    equal greedy actions and the largest deviations of the probabilities
+    """
+    p = net.forward(observations)
+    q = qnet.forward(observations)
+    agree = np.argmax(p, axis=-1) == np.argmax(q, axis=-1)
+    return {
+        "n_observations": len(observations),
+        "argmax_agreement": float(agree.mean()),
+        "n_disagreements": int((~agree).sum()),
+        "max_abs_proba_diff": float(np.abs(p - q).max()),
+        "mean_abs_proba_diff": float(np.abs(p - q).mean()),
+    }
+
+
+if __name__ == "__main__":
+    import timeit
+
+    parser = argparse.ArgumentParser(description="Quantize the shipped agent network to int8 and compare it to the float model")
+    parser.add_argument("--out", default=None, help="write the int8 weight string (for AGENT_WEIGHTS) to this file")
+    parser.add_argument("--episodes", type=int, default=2000)
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--p-pit", type=float, default=0.2)
+    parser.add_argument("--tmax", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    net = agent_network()
+    qnet = QuantizedNetwork.quantize(net)
+    weights = qnet.to_string()
+    print(f"weight string: {len(AGENT_WEIGHTS) / 1024:.0f} KiB float16 -> {len(weights) / 1024:.0f} KiB int8")
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(weights)
+
+    observations = sample_observations(
+        net, args.episodes, env_kwargs=dict(p_pit=args.p_pit, Tmax=args.tmax), epsilon=args.epsilon, seed=args.seed
+    )
+    for key, value in accuracy_report(net, qnet, observations).items():
+        print(f"{key}: {value}")
+
+    for batch_size in [1, 256]:
+        x = observations[:batch_size] if batch_size > 1 else observations[0]
+        for name, model in [("NeuralNetwork", net), ("CompiledNetwork", net.compile()), ("QuantizedNetwork", qnet)]:
+            t = min(timeit.repeat(lambda: model.forward(x), number=100, repeat=5)) / 100
+            print(f"{name}.forward/batch={batch_size}: {t * 1e6:.0f} us")
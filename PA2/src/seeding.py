@@ -0,0 +1,144 @@
+import math
+import struct
+
+import numpy as np
+
+_RNG_TAIL = struct.Struct("<BI")
+RNG_STATE_SIZE = 32 + _RNG_TAIL.size
+
+
+def pack_rng_state(rng):
+    """
+    State of a PCG64 `np.random.Generator` as bytes
+    """
+    state = rng.bit_generator.state
+    return (
+        state["state"]["state"].to_bytes(16, "little") + state["state"]["inc"].to_bytes(16, "little")
+        + _RNG_TAIL.pack(state["has_uint32"], state["uinteger"])
+    )
+
+
+def unpack_rng_state(rng, data, offset=0):
+    """
+    Load the state written by `pack_rng_state` into `rng`
+    """
+    has_uint32, uinteger = _RNG_TAIL.unpack_from(data, offset + 32)
+    rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {
+            "state": int.from_bytes(data[offset:offset + 16], "little"),
+            "inc": int.from_bytes(data[offset + 16:offset + 32], "little"),
+        },
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+
+
+def seed_sequence(seed):
+    """
+    `np.random.SeedSequence` of an int, None (fresh entropy) or a SeedSequence
+    """
+    return seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+
+def spawn(seed, n):
+    """
+    n independent child seeds of `seed`, e.g. one per worker or env; the
+    i-th child only depends on `seed` and i
+    """
+    return seed_sequence(seed).spawn(n)
+
+
+def int_seed(seed):
+    """
+    `seed` if it is an int, otherwise a 63 bit int drawn from it (None:
+    fresh entropy), for envs that must be recreated from a number, e.g.
+    to replay an episode of a trajectory log
+    """
+    if isinstance(seed, (int, np.integer)):
+        return int(seed)
+    return int(seed_sequence(seed).generate_state(1, np.uint64)[0] >> 1)
+
+
+def seed_global(seed):
+    """
+    Seed the global `np.random` generator of this process from `seed`,
+    for code that still draws from it (e.g. `NeuralNetwork` init)
+    """
+    np.random.seed(seed_sequence(seed).generate_state(1))
+
+
+class BlockRNG:
+    """
+    Generator for the many small draws of an env reset: uniform floats
+    are drawn from a PCG64 generator a block at a time and handed out one
+    by one, which costs a list lookup instead of a generator call.
+
+    The draws only depend on the seed and on the sequence of calls, so an
+    env seeded from its own `spawn` child is reproducible and independent
+    of every other env.
+    """
+    __slots__ = ("generator", "block_size", "_block", "_values", "_pos", "_block_state")
+
+    # pack_state(): generator state at the start of the block, block length, position
+    _TAIL = struct.Struct("<II")
+    STATE_SIZE = RNG_STATE_SIZE + _TAIL.size
+
+    def __init__(self, seed=None, block_size=1024):
+        self.generator = np.random.default_rng(seed_sequence(seed))
+        self.block_size = block_size
+        self._refill(block_size)
+
+    def _refill(self, n):
+        self._block_state = pack_rng_state(self.generator)
+        self._block = self.generator.random(n)
+        self._values = self._block.tolist()
+        self._pos = 0
+
+    def random(self, shape=None):
+        """
+        Uniform float in [0, 1), or an array of them of `shape`
+        """
+        if shape is None:
+            if self._pos == len(self._values):
+                self._refill(self.block_size)
+            self._pos += 1
+            return self._values[self._pos - 1]
+
+        n = math.prod(shape)
+        if self._pos + n > len(self._values):
+            self._refill(max(self.block_size, n))
+        self._pos += n
+        return self._block[self._pos - n:self._pos].reshape(shape)
+
+    def integers(self, low, high=None):
+        """
+        Integer in [low, high), or in [0, low) when high is None
+        """
+        if high is None:
+            low, high = 0, low
+        return low + int(self.random() * (high - low))
+
+    def uniform(self, low=0.0, high=1.0):
+        return low + (high - low) * self.random()
+
+    def choice(self, options):
+        return options[int(self.random() * len(options))]
+
+    def pack_state(self):
+        """
+        State as `STATE_SIZE` bytes, see `unpack_state`
+        """
+        return self._block_state + self._TAIL.pack(len(self._values), self._pos)
+
+    def unpack_state(self, data, offset=0):
+        """
+        Continue from a `pack_state`; the block is only drawn again if it
+        is not the current one, so restoring within a block is cheap
+        """
+        block_state = bytes(data[offset:offset + RNG_STATE_SIZE])
+        n, pos = self._TAIL.unpack_from(data, offset + RNG_STATE_SIZE)
+        if block_state != self._block_state or n != len(self._values):
+            unpack_rng_state(self.generator, block_state)
+            self._refill(n)
+        self._pos = pos
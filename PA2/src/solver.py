@@ -0,0 +1,231 @@
+import itertools
+from statistics import NormalDist
+
+import numpy as np
+from wumpus import Actions, Orientation
+
+# movement per orientation, indexed by Orientation
+DX = np.array([0, 1, 0, -1], dtype=np.int64)
+DY = np.array([1, 0, -1, 0], dtype=np.int64)
+N_ACTIONS = 6
+
+
+class WumpusSolver:
+    """
+    Optimal expected return of `wumpus.Wumpus` under full observability.
+
+    For a known world (pits, wumpus, gold) the game is deterministic, so the
+    best return is found by finite-horizon value iteration over the states
+    (position, orientation, arrow, gold, wumpus_alive) and the time step t.
+    The expectation over worlds is an upper bound for every agent that only
+    sees percepts.
+
+    States are encoded as one integer
+        s = ((((y * W + x) * 4 + orientation) * 2 + arrow) * 2 + gold) * 2 + wumpus_alive
+    and the Bellman backups of a whole batch of worlds are done at once on
+    (worlds, states, actions) arrays. Solved worlds are memoized.
+    """
+    def __init__(self, size=(4,4), Tmax=50, batch_size=512):
+        self.size = tuple(size)
+        self.Tmax = Tmax
+        self.batch_size = batch_size
+        self.cache = {}
+
+        width, height = self.size
+        self.n_cells = width * height
+        self.n_states = self.n_cells * 32
+
+        s = np.arange(self.n_states)
+        self.alive = s % 2
+        self.gold = s // 2 % 2
+        self.arrow = s // 4 % 2
+        self.orientation = s // 8 % 4
+        cell = s // 32
+        self.y, self.x = np.divmod(cell, width)
+        self.start = self.encode(0, 0, Orientation.NORTH, 1, 0, 1)
+
+    def encode(self, x, y, orientation, arrow, gold, alive):
+        width = self.size[0]
+        return (((((y * width + x) * 4 + orientation) * 2 + arrow) * 2 + gold) * 2) + alive
+
+    def _transitions(self, pits, idx_wumpus, idx_gold):
+        """
+        Successor state, reward and termination for every (world, state,
+        action), following `Wumpus.step` (without the Tmax timeout)
+        """
+        width, height = self.size
+        n_worlds = len(idx_wumpus)
+        shape = (n_worlds, self.n_states, N_ACTIONS)
+        wy, wx = np.divmod(idx_wumpus[:, None], width)
+        gy, gx = np.divmod(idx_gold[:, None], width)
+
+        x = np.broadcast_to(self.x, shape[:2])
+        y = np.broadcast_to(self.y, shape[:2])
+        o, arrow, gold, alive = self.orientation, self.arrow, self.gold, self.alive
+
+        nxt = np.empty(shape, dtype=np.intp)
+        reward = np.full(shape, -1.0)
+        done = np.zeros(shape, dtype=bool)
+
+        def finish(a, nx, ny, no, narrow, ngold, nalive):
+            nalive = np.broadcast_to(nalive, shape[:2])
+            eaten = (nalive == 1) & (nx == wx) & (ny == wy)
+            reward[:, :, a] -= 1000 * eaten
+            done[:, :, a] |= eaten
+            fallen = pits[np.arange(n_worlds)[:, None], ny * width + nx]
+            reward[:, :, a][fallen] = -1000
+            done[:, :, a] |= fallen
+            nxt[:, :, a] = self.encode(nx, ny, no, narrow, ngold, nalive)
+
+        finish(Actions.LEFT, x, y, (o - 1) % 4, arrow, gold, alive)
+        finish(Actions.RIGHT, x, y, (o + 1) % 4, arrow, gold, alive)
+
+        nx = np.clip(x + DX[o], 0, width - 1)
+        ny = np.clip(y + DY[o], 0, height - 1)
+        finish(Actions.FORWARD, nx, ny, o, arrow, gold, alive)
+
+        on_gold = (x == gx) & (y == gy)
+        finish(Actions.GRAB, x, y, o, arrow, gold | on_gold, alive)
+
+        dx, dy = DX[o], DY[o]
+        in_line = ((dx != 0) & (wy == y) & ((wx - x) * dx >= 0)) | ((dy != 0) & (wx == x) & ((wy - y) * dy >= 0))
+        shoot = arrow == 1
+        reward[:, :, Actions.SHOOT] -= 10 * shoot
+        finish(Actions.SHOOT, x, y, o, 0 * arrow, gold, alive & ~(shoot & in_line))
+
+        climb = (x == 0) & (y == 0)
+        reward[:, :, Actions.CLIMB] += 1000 * (climb & (gold == 1))
+        done[:, :, Actions.CLIMB] |= climb
+        finish(Actions.CLIMB, x, y, o, arrow, gold, alive)
+
+        return nxt.reshape(n_worlds, -1), reward, done
+
+    def _solve_batch(self, pits, idx_wumpus, idx_gold):
+        """
+        Optimal return from the start state for a batch of worlds
+        """
+        nxt, reward, done = self._transitions(pits, idx_wumpus, idx_gold)
+        n_worlds = len(idx_wumpus)
+        n_states = self.n_states
+
+        # terminating actions lead to an extra absorbing state with value 0;
+        # indices point into the flattened (worlds, states + 1) value array
+        terminal = n_states
+        nxt = np.where(done.reshape(n_worlds, -1), terminal, nxt)
+        nxt += (np.arange(n_worlds) * (n_states + 1))[:, None]
+        # actions first, so the max over actions is an elementwise reduction
+        nxt = np.ascontiguousarray(nxt.reshape(reward.shape).transpose(2, 0, 1))
+        reward = np.ascontiguousarray(reward.transpose(2, 0, 1), dtype=np.float32)
+
+        # value after the last allowed step: the timeout penalty of Wumpus.step
+        value = np.full((n_worlds, n_states + 1), -1000.0, dtype=np.float32)
+        value[:, terminal] = 0
+        q = np.empty(reward.shape, dtype=np.float32)
+        for t in range(self.Tmax - 2, -1, -1):
+            np.take(value, nxt, out=q)
+            q += reward
+            new_value = q.max(axis=0)
+            if np.array_equal(new_value, value[:, :n_states]):
+                # the backup does not depend on t, so V_t is stationary from here on
+                break
+            value[:, :n_states] = new_value
+        return value[:, self.start].astype(np.float64)
+
+    def solve(self, pits, idx_wumpus, idx_gold):
+        """
+        Optimal returns of the worlds given by a (n, W*H) bool array of pits
+        (cell index y * W + x) and the cell indices of wumpus and gold
+        """
+        pits = np.asarray(pits, dtype=bool).reshape(len(idx_wumpus), -1)
+        idx_wumpus = np.asarray(idx_wumpus, dtype=np.int64)
+        idx_gold = np.asarray(idx_gold, dtype=np.int64)
+
+        keys = [(p.tobytes(), int(w), int(g)) for p, w, g in zip(np.packbits(pits, axis=1), idx_wumpus, idx_gold)]
+        first = {}
+        for i, key in enumerate(keys):
+            if key not in self.cache and key not in first:
+                first[key] = i
+        todo = list(first.values())
+        for start in range(0, len(todo), self.batch_size):
+            batch = np.array(todo[start:start + self.batch_size])
+            values = self._solve_batch(pits[batch], idx_wumpus[batch], idx_gold[batch])
+            for i, value in zip(batch, values):
+                self.cache[keys[i]] = value
+        return np.array([self.cache[key] for key in keys])
+
+    def sample_worlds(self, n_worlds, p_pit, rng):
+        """
+        Draw worlds like `Wumpus.reset`
+        """
+        width, height = self.size
+        pits = rng.random((n_worlds, width, height)) <= p_pit
+        pits[:, 0, 0] = False
+        pits = pits.transpose(0, 2, 1).reshape(n_worlds, -1)
+        idx_wumpus = rng.integers(low=1, high=self.n_cells, size=n_worlds)
+        idx_gold = rng.integers(low=0, high=self.n_cells, size=n_worlds)
+        return pits, idx_wumpus, idx_gold
+
+    def enumerate_worlds(self, p_pit):
+        """
+        All worlds with their probabilities
+        """
+        n = self.n_cells
+        pit_sets = np.array(list(itertools.product([False, True], repeat=n - 1)), dtype=bool).reshape(-1, n - 1)
+        pit_sets = np.hstack([np.zeros((len(pit_sets), 1), dtype=bool), pit_sets])
+        n_pits = pit_sets.sum(axis=1)
+        p_pits = p_pit ** n_pits * (1 - p_pit) ** (n - 1 - n_pits)
+
+        pit_idx, idx_wumpus, idx_gold = [a.ravel() for a in np.meshgrid(
+            np.arange(len(pit_sets)), np.arange(1, n), np.arange(n), indexing="ij"
+        )]
+        probs = p_pits[pit_idx] / ((n - 1) * n)
+        return pit_sets[pit_idx], idx_wumpus, idx_gold, probs
+
+    def n_worlds(self):
+        n = self.n_cells
+        return 2 ** (n - 1) * (n - 1) * n
+
+    def expected_return(self, p_pit=0.2, n_samples=10_000, seed=2025, max_worlds=300_000):
+        """
+        Expected optimal return over random worlds.
+
+        All worlds are enumerated when there are at most `max_worlds` of
+        them (3x3 and smaller); otherwise `n_samples` worlds are drawn and
+        the result carries the Monte-Carlo standard error.
+        """
+        if self.n_worlds() <= max_worlds:
+            pits, idx_wumpus, idx_gold, probs = self.enumerate_worlds(p_pit)
+            values = self.solve(pits, idx_wumpus, idx_gold)
+            return SolverResult(float(np.dot(probs, values)), 0.0, len(values), exact=True)
+
+        rng = np.random.default_rng(seed)
+        values = self.solve(*self.sample_worlds(n_samples, p_pit, rng))
+        return SolverResult(values.mean(), values.std(ddof=1) / np.sqrt(n_samples), n_samples, exact=False)
+
+
+class SolverResult:
+    """
+    Expected optimal return, with standard error for sampled worlds
+    """
+    def __init__(self, mean, stderr, n_worlds, exact):
+        self.mean = mean
+        self.stderr = stderr
+        self.n_worlds = n_worlds
+        self.exact = exact
+
+    def confidence_interval(self, level=0.95):
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        return self.mean - z * self.stderr, self.mean + z * self.stderr
+
+    def __repr__(self):
+        kind = "exact" if self.exact else f"+- {self.stderr:.3f}"
+        return f"SolverResult(mean={self.mean:.3f} {kind}, n_worlds={self.n_worlds})"
+
+
+if __name__ == "__main__":
+    import time
+
+    for size in [(2,2), (3,3), (4,4), (5,5)]:
+        start = time.perf_counter()
+        result = WumpusSolver(size, Tmax=50).expected_return(p_pit=0.2)
+        print(f"{size}: {result} in {time.perf_counter() - start:.1f}s")
@@ -11,11 +11,26 @@ import torch
 from stable_baselines3.common.env_util import make_vec_env
 from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.vec_env import DummyVecEnv
+from curriculum import CurriculumScheduler
+from trajectory_log import TrajectoryWriter
+from vec_env import SharedMemoryVecEnv
 
 size = (4, 4)
 p_pit = 0.
 with_wumpus = True
 time_max = 100
+log_dir = None # record every training episode into this `trajectory_log` directory
+
+
+def logged(env):
+    """
+    Give `env` a trajectory writer (one shard per env) if `log_dir` is set;
+    the writer is closed with the env
+    """
+    if log_dir is not None:
+        TrajectoryWriter(log_dir).attach(env)
+    return env
+
 
 env_fn_easy_v1 = lambda: Monitor(aufgabe2_mike.WumpusEnv(
     size=size, p_pit=0., seed=None, Tmax=time_max, with_wumpus=False,
@@ -54,6 +69,13 @@ env_fn_expert_v3 = lambda: Monitor(aufgabe2_mike.WumpusEnv(
     size=size, p_pit=(0.0, 0.25), seed=None, Tmax=(40, 100), with_wumpus=True, start_orientation=None,
 ))
 
+# world banks of the easy_v2, medium_v2 and expert_v3 settings; the forked
+# workers share the banks, the mix adapts to the success rate per tier
+curriculum = CurriculumScheduler(size=size, seed=2025)
+env_fn_curriculum = lambda: Monitor(logged(aufgabe2_mike.WumpusEnv(
+    size=size, seed=None, worlds=curriculum,
+)))
+
 env_fn_validation = lambda: Monitor(aufgabe2_mike.WumpusEnv(
     size=size, p_pit=0.20, seed=None, Tmax=50,
 ))
@@ -61,7 +83,13 @@ env_fn_validation = lambda: Monitor(aufgabe2_mike.WumpusEnv(
 
 
 # vec_env = DummyVecEnv([env_fn_easy_v2] * 16 + [env_fn_medium_v2] * 64 + [env_fn_expert_v2] * 48)
-vec_env = DummyVecEnv([env_fn_easy_v2] * 16 + [env_fn_medium_v2] * 8 + [env_fn_expert_v3] * 104)
+# vec_env = DummyVecEnv([env_fn_easy_v2] * 16 + [env_fn_medium_v2] * 8 + [env_fn_expert_v3] * 104)
+# fork: this script has no __main__ guard, spawned workers would re-run it
+# vec_env = SharedMemoryVecEnv(
+#     [env_fn_easy_v2] * 16 + [env_fn_medium_v2] * 8 + [env_fn_expert_v3] * 104,
+#     start_method="fork",
+# )
+vec_env = SharedMemoryVecEnv([env_fn_curriculum] * 128, start_method="fork")
 torch.set_num_threads(2)
 
 policy_kwargs = dict(
@@ -93,3 +121,5 @@ for i in range(5):
         time.sleep(60)
     agent.learn(total_timesteps=5_000_000, log_interval=1)
     agent.save(f"ppo_sgd_{i+1}")
+
+vec_env.close()
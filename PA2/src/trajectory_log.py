@@ -0,0 +1,305 @@
+import json
+import os
+import uuid
+
+import numpy as np
+
+# a record without action: the percept right after reset
+NO_ACTION = 255
+
+# per step: episode number in the shard, time step, action, percept bits
+# (wumpus.PERCEPT_TABLE row), reward and done (kernel.RUNNING/DONE/TIMEOUT)
+STEP_COLUMNS = {
+    "episode": np.uint32,
+    "t": np.int16,
+    "action": np.uint8,
+    "percept": np.uint8,
+    "reward": np.float32,
+    "done": np.uint8,
+}
+# per episode: seed of the env (-1 if it was not an int), how many episodes
+# that env had played before (the `episode` argument of `video.replay`),
+# and the rows of the episode in the step columns
+EPISODE_COLUMNS = {
+    "seed": np.int64,
+    "env_episode": np.uint32,
+    "first_row": np.int64,
+    "length": np.uint32,
+}
+
+
+class TrajectoryWriter:
+    """
+    Append-only trajectory log of one process.
+
+    A log is a directory of shards; every writer owns one shard, i.e. one
+    raw file per column (`<shard>.<column>.bin`), so writers in different
+    processes never need a lock. Episodes are buffered per env until they
+    end and then copied into fixed-size column chunks, which are appended
+    to the files when full, so the rows of an episode are contiguous.
+
+    Attach it to `wumpus.Wumpus` / `wumpus_mike.Wumpus` instances with
+    `attach(env)`; their reset/step then record themselves. The episode
+    table is appended together with the step rows, so readers see the
+    episodes of a running writer chunk by chunk, and a crash loses at
+    most the last chunk.
+    """
+    def __init__(self, directory, shard=None, chunk_size=65536):
+        """
+        shard ... name of the shard, unique per writer (default: pid + random)
+        chunk_size ... rows buffered in memory before they are appended
+        """
+        self.directory = directory
+        self.shard = f"{os.getpid()}-{uuid.uuid4().hex[:8]}" if shard is None else shard
+        self.chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+        write_meta(directory)
+
+        self._steps = {name: np.zeros(chunk_size, dtype=dtype) for name, dtype in STEP_COLUMNS.items()}
+        self._episodes = {name: [] for name in EPISODE_COLUMNS}
+        self._n_buffered = 0
+        self._recorders = []
+        self.n_rows = 0 # rows written or buffered
+        self.n_episodes = 0
+
+    def _path(self, column):
+        return os.path.join(self.directory, f"{self.shard}.{column}.bin")
+
+    def attach(self, env):
+        """
+        Record every episode of `env` from its next reset on
+        """
+        env.recorder = EnvRecorder(self)
+        self._recorders.append(env.recorder)
+        return env
+
+    def write_episode(self, seed, env_episode, t, actions, percepts, rewards, dones):
+        """
+        Append one episode given as equally long sequences of steps
+        """
+        n = len(actions)
+        episode = self.n_episodes
+        columns = {"t": t, "action": actions, "percept": percepts, "reward": rewards, "done": dones}
+        written = 0
+        while written < n:
+            k = min(n - written, self.chunk_size - self._n_buffered)
+            rows = slice(self._n_buffered, self._n_buffered + k)
+            self._steps["episode"][rows] = episode
+            for name, values in columns.items():
+                self._steps[name][rows] = values[written:written + k]
+            self._n_buffered += k
+            written += k
+            if self._n_buffered == self.chunk_size:
+                self._flush_steps()
+
+        for name, value in zip(EPISODE_COLUMNS, (seed, env_episode, self.n_rows, n)):
+            self._episodes[name].append(value)
+        self.n_rows += n
+        self.n_episodes += 1
+
+    def _flush_steps(self):
+        """
+        Append the buffered step rows, then the rows of the episodes they
+        complete, so a reader never sees an episode whose rows are missing
+        """
+        if self._n_buffered == 0 and not self._episodes["length"]:
+            return
+        for name, buffer in self._steps.items():
+            with open(self._path(name), "ab") as f:
+                f.write(buffer[:self._n_buffered].tobytes())
+        self._n_buffered = 0
+        for name, dtype in EPISODE_COLUMNS.items():
+            with open(self._path(name), "ab") as f:
+                f.write(np.asarray(self._episodes[name], dtype=dtype).tobytes())
+            self._episodes[name] = []
+
+    def flush(self):
+        """
+        Append everything buffered (episodes still running stay with their recorders)
+        """
+        self._flush_steps()
+
+    def close(self):
+        """
+        End the running episodes of the attached envs and append everything
+        """
+        for recorder in self._recorders:
+            recorder.end()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EnvRecorder:
+    """
+    Collects the steps of the running episode of one env for a writer
+    """
+    __slots__ = ("writer", "seed", "env_episode", "t", "actions", "percepts", "rewards", "dones")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.actions = []
+
+    def reset(self, seed, env_episode, percept_bits):
+        self.end()
+        self.seed = seed if isinstance(seed, (int, np.integer)) else -1
+        self.env_episode = env_episode
+        self.t = [0]
+        self.actions = [NO_ACTION]
+        self.percepts = [percept_bits]
+        self.rewards = [0.0]
+        self.dones = [0]
+
+    def step(self, action, percept_bits, reward, done):
+        self.t.append(min(len(self.t), np.iinfo(np.int16).max))
+        self.actions.append(action)
+        self.percepts.append(percept_bits)
+        self.rewards.append(reward)
+        self.dones.append(done)
+        if done:
+            self.end()
+
+    def end(self):
+        """
+        Hand the episode to the writer, also if it was cut short
+        """
+        if self.actions:
+            self.writer.write_episode(self.seed, self.env_episode, self.t, self.actions, self.percepts, self.rewards, self.dones)
+            self.actions = []
+
+
+def write_meta(directory):
+    """
+    Column dtypes of a log directory, for readers in other languages
+    """
+    path = os.path.join(directory, "meta.json")
+    if os.path.exists(path):
+        return
+    meta = {
+        "step_columns": {name: np.dtype(dtype).str for name, dtype in STEP_COLUMNS.items()},
+        "episode_columns": {name: np.dtype(dtype).str for name, dtype in EPISODE_COLUMNS.items()},
+        "no_action": NO_ACTION,
+    }
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _map(path, dtype):
+    """
+    Read-only memory map of a column file (empty if it does not exist)
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < np.dtype(dtype).itemsize:
+        return np.zeros(0, dtype=dtype)
+    n = os.path.getsize(path) // np.dtype(dtype).itemsize
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n,))
+
+
+class TrajectoryLog:
+    """
+    Reader of a trajectory log directory.
+
+    Columns are memory-mapped, nothing is loaded before it is indexed.
+    Shards that are still being written are read up to their last
+    complete episode.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        names = sorted({f.split(".")[0] for f in os.listdir(directory) if f.endswith(".bin")})
+        self.shards = [self._open_shard(name) for name in names]
+        self.shards = [shard for shard in self.shards if len(shard["episodes"]["length"]) > 0]
+        self._episode_offsets = np.cumsum([0] + [len(s["episodes"]["length"]) for s in self.shards])
+
+    def _open_shard(self, name):
+        path = lambda column: os.path.join(self.directory, f"{name}.{column}.bin")
+        steps = {column: _map(path(column), dtype) for column, dtype in STEP_COLUMNS.items()}
+        episodes = {column: _map(path(column), dtype) for column, dtype in EPISODE_COLUMNS.items()}
+
+        # drop whatever a crashed or running writer left incomplete
+        n_rows = min(len(c) for c in steps.values())
+        n_episodes = min(len(c) for c in episodes.values())
+        end = episodes["first_row"][:n_episodes].astype(np.int64) + episodes["length"][:n_episodes]
+        n_episodes = int(np.searchsorted(end, n_rows, side="right"))
+        n_rows = int(end[n_episodes - 1]) if n_episodes else 0
+        return {
+            "name": name,
+            "steps": {column: c[:n_rows] for column, c in steps.items()},
+            "episodes": {column: c[:n_episodes] for column, c in episodes.items()},
+        }
+
+    @property
+    def n_episodes(self):
+        return int(self._episode_offsets[-1])
+
+    @property
+    def n_steps(self):
+        return sum(len(shard["steps"]["action"]) for shard in self.shards)
+
+    def __len__(self):
+        return self.n_episodes
+
+    def episode(self, i):
+        """
+        Episode number i over all shards: dict with seed, env_episode and
+        the step columns (row 0 is the reset, with action NO_ACTION)
+        """
+        s = int(np.searchsorted(self._episode_offsets, i, side="right")) - 1
+        shard = self.shards[s]
+        j = i - self._episode_offsets[s]
+        first = int(shard["episodes"]["first_row"][j])
+        rows = slice(first, first + int(shard["episodes"]["length"][j]))
+        episode = {column: np.array(c[rows]) for column, c in shard["steps"].items()}
+        episode["seed"] = int(shard["episodes"]["seed"][j])
+        episode["env_episode"] = int(shard["episodes"]["env_episode"][j])
+        return episode
+
+    def replay(self, i, **env_kwargs):
+        """
+        Rendered frames of episode i, see `video.replay`
+        """
+        from video import replay
+
+        episode = self.episode(i)
+        if episode["seed"] < 0:
+            raise ValueError("the env of this episode was not seeded with an int, it cannot be replayed")
+        actions = episode["action"][1:].tolist()
+        return replay(episode["seed"], actions, episode=episode["env_episode"], **env_kwargs)
+
+    def iter_chunks(self, columns=None, chunk_size=1 << 20):
+        """
+        Yield dicts of step column slices of at most `chunk_size` rows,
+        shard by shard, so the whole log never has to be in memory
+        """
+        columns = list(STEP_COLUMNS) if columns is None else columns
+        for shard in self.shards:
+            n = len(shard["steps"]["action"])
+            for start in range(0, n, chunk_size):
+                yield {column: shard["steps"][column][start:start + chunk_size] for column in columns}
+
+    def episode_returns(self):
+        """
+        Total reward of every episode, computed chunk by chunk
+        """
+        returns = []
+        for shard in self.shards:
+            totals = np.zeros(len(shard["episodes"]["length"]))
+            episode, reward = shard["steps"]["episode"], shard["steps"]["reward"]
+            for start in range(0, len(reward), 1 << 20):
+                ids = episode[start:start + (1 << 20)]
+                totals += np.bincount(ids, weights=reward[start:start + (1 << 20)], minlength=len(totals))
+            returns.append(totals)
+        return np.concatenate(returns) if returns else np.zeros(0)
+
+    def action_counts(self):
+        """
+        How often every action was taken
+        """
+        counts = np.zeros(256, dtype=np.int64)
+        for chunk in self.iter_chunks(["action"]):
+            counts += np.bincount(chunk["action"], minlength=256)
+        return counts[:NO_ACTION]
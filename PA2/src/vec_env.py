@@ -0,0 +1,213 @@
+import multiprocessing as mp
+import os
+
+import numpy as np
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper, VecEnv
+
+
+def _shared_array(ctx, shape, dtype):
+    """
+    Allocate a zero-initialised array in shared memory
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return ctx.RawArray("b", max(1, nbytes))
+
+
+def _as_array(raw, shape, dtype):
+    return np.frombuffer(raw, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+
+def _worker(remote, parent_remote, env_fns_wrapper, start, buffers, shapes):
+    """
+    Owns the environments start, start+1, ... and steps them on request.
+    Observations, rewards, dones and actions are exchanged through the
+    shared buffers; only (sparse) infos go through the pipe.
+    """
+    from stable_baselines3.common.env_util import is_wrapped
+
+    parent_remote.close()
+    envs = [env_fn() for env_fn in env_fns_wrapper.var]
+    obs, rewards, dones, actions = [_as_array(raw, *shape) for raw, shape in zip(buffers, shapes)]
+
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                infos = []
+                for i, env in enumerate(envs, start):
+                    observation, reward, terminated, truncated, info = env.step(actions[i])
+                    done = terminated or truncated
+                    if done:
+                        info["TimeLimit.truncated"] = truncated and not terminated
+                        info["terminal_observation"] = observation
+                        observation, reset_info = env.reset()
+                        if reset_info:
+                            info["reset_info"] = reset_info
+                    if info:
+                        infos.append((i, info))
+                    obs[i] = observation
+                    rewards[i] = reward
+                    dones[i] = done
+                remote.send(infos)
+            elif cmd == "reset":
+                reset_infos = []
+                for i, env in enumerate(envs, start):
+                    seed, options = data[i]
+                    maybe_options = {"options": options} if options else {}
+                    observation, reset_info = env.reset(seed=seed, **maybe_options)
+                    obs[i] = observation
+                    reset_infos.append(reset_info)
+                remote.send(reset_infos)
+            elif cmd == "env_method":
+                ids, method_name, args, kwargs = data
+                remote.send([envs[i - start].get_wrapper_attr(method_name)(*args, **kwargs) for i in ids])
+            elif cmd == "get_attr":
+                ids, attr_name = data
+                remote.send([envs[i - start].get_wrapper_attr(attr_name) for i in ids])
+            elif cmd == "set_attr":
+                ids, attr_name, value = data
+                for i in ids:
+                    setattr(envs[i - start], attr_name, value)
+                remote.send(None)
+            elif cmd == "is_wrapped":
+                ids, wrapper_class = data
+                remote.send([is_wrapped(envs[i - start], wrapper_class) for i in ids])
+            elif cmd == "close":
+                for env in envs:
+                    env.close()
+                remote.close()
+                break
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+    except KeyboardInterrupt:
+        print("SharedMemoryVecEnv worker: got KeyboardInterrupt")
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """
+    SB3 `VecEnv` that shards environments across worker processes.
+
+    Every worker steps a contiguous block of environments. Observations,
+    rewards, dones and actions live in shared-memory NumPy arrays, so a
+    step only sends a short command per worker instead of pickled tuples
+    per environment. Like `SubprocVecEnv`, terminated environments are
+    reset inside the worker and the last observation is returned in
+    `info["terminal_observation"]`.
+
+    env_fns ... list of functions creating the environments
+    n_workers ... number of worker processes (default: number of cores)
+    start_method ... multiprocessing start method
+    """
+    def __init__(self, env_fns, n_workers=None, start_method=None):
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = max(1, min(n_workers, n_envs))
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        # spaces are needed to size the shared buffers before the workers start
+        env = env_fns[0]()
+        observation_space, action_space = env.observation_space, env.action_space
+        env.close()
+
+        obs_dtype = observation_space.dtype
+        shapes = [
+            ((n_envs, *observation_space.shape), obs_dtype),
+            ((n_envs,), np.float32),
+            ((n_envs,), np.bool_),
+            ((n_envs, *action_space.shape), action_space.dtype),
+        ]
+        buffers = [_shared_array(ctx, shape, dtype) for shape, dtype in shapes]
+        self._obs, self._rewards, self._dones, self._actions = [
+            _as_array(raw, shape, dtype) for raw, (shape, dtype) in zip(buffers, shapes)
+        ]
+
+        self.slices = [(int(ids[0]), int(ids[-1]) + 1) for ids in np.array_split(np.arange(n_envs), n_workers)]
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_workers)])
+        self.processes = []
+        for work_remote, remote, (start, stop) in zip(self.work_remotes, self.remotes, self.slices):
+            args = (work_remote, remote, CloudpickleWrapper(env_fns[start:stop]), start, buffers, shapes)
+            # daemon=True: if the main process crashes, we should not cause things to hang
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        super().__init__(n_envs, observation_space, action_space)
+
+    def step_async(self, actions):
+        self._actions[:] = np.asarray(actions).reshape(self._actions.shape)
+        for remote in self.remotes:
+            remote.send(("step", None))
+        self.waiting = True
+
+    def step_wait(self):
+        infos = [{} for _ in range(self.num_envs)]
+        for remote in self.remotes:
+            for i, info in remote.recv():
+                infos[i] = info
+        self.waiting = False
+        self.reset_infos = [info.pop("reset_info", {}) for info in infos]
+        return self._obs.copy(), self._rewards.copy(), self._dones.copy(), infos
+
+    def reset(self):
+        data = list(zip(self._seeds, self._options))
+        for remote in self.remotes:
+            remote.send(("reset", data))
+        self.reset_infos = [info for remote in self.remotes for info in remote.recv()]
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs.copy()
+
+    def close(self):
+        if self.closed:
+            return
+        if self.waiting:
+            for remote in self.remotes:
+                remote.recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.closed = True
+
+    def get_images(self):
+        return [np.asarray(img) for img in self.env_method("render")]
+
+    def get_attr(self, attr_name, indices=None):
+        return self._call(lambda ids: ("get_attr", (ids, attr_name)), indices)
+
+    def set_attr(self, attr_name, value, indices=None):
+        self._call(lambda ids: ("set_attr", (ids, attr_name, value)), indices)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return self._call(lambda ids: ("env_method", (ids, method_name, method_args, method_kwargs)), indices)
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return self._call(lambda ids: ("is_wrapped", (ids, wrapper_class)), indices)
+
+    def _call(self, make_cmd, indices):
+        """
+        Send a command to every worker owning one of `indices` and
+        collect the per-environment results in order of `indices`
+        """
+        indices = self._get_indices(indices)
+        targets = []
+        for remote, (start, stop) in zip(self.remotes, self.slices):
+            ids = [i for i in indices if start <= i < stop]
+            if ids:
+                remote.send(make_cmd(ids))
+                targets.append((remote, ids))
+        results = {}
+        for remote, ids in targets:
+            result = remote.recv()
+            if result is not None:
+                results.update(zip(ids, result))
+        return [results.get(i) for i in indices]
@@ -0,0 +1,229 @@
+import numpy as np
+from wumpus import Actions, Orientation, Percepts, neighbor_mask
+
+NUM_PERCEPTS = 5
+
+# movement per orientation, indexed by Orientation
+DX = np.array([0, 1, 0, -1], dtype=np.int32)
+DY = np.array([1, 0, -1, 0], dtype=np.int32)
+
+
+class VectorWumpus:
+    """
+    Batch of independent Wumpus worlds stepped in lockstep.
+
+    The state is kept as struct-of-arrays, one entry per world, so a single
+    call to `step` advances all worlds with a handful of NumPy operations.
+    Rewards, percepts and termination follow `wumpus.Wumpus.step`.
+    """
+    def __init__(self, n_envs, size=(4,4), p_pit=0.2, Tmax=50, seed=2024, autoreset=False):
+        """
+        n_envs ... number of worlds
+        size ... size of the grid of every Wumpus world
+        p_pit ... probability of a pit
+        Tmax ... maximal number of steps per episode
+        autoreset ... reset terminated worlds right after the step that ended
+            them; the returned percepts are then the first percepts of the
+            new episode
+        """
+        self.n_envs = n_envs
+        self.size = tuple(size)
+        self.p_pit = p_pit
+        self.Tmax = Tmax
+        self.autoreset = autoreset
+        self.rng = np.random.default_rng(seed=seed)
+
+        n = n_envs
+        self._idx = np.arange(n)
+
+        # agent state
+        self.x = np.zeros(n, dtype=np.int32)
+        self.y = np.zeros(n, dtype=np.int32)
+        self.orientation = np.zeros(n, dtype=np.int32)
+        self.has_arrow = np.zeros(n, dtype=bool)
+        self.has_gold = np.zeros(n, dtype=bool)
+        self.alive = np.zeros(n, dtype=bool)
+        self.terminated = np.ones(n, dtype=bool)
+        self.t = np.zeros(n, dtype=np.int32)
+
+        # world state
+        self.wumpus_alive = np.zeros(n, dtype=bool)
+        self.wumpus_x = np.zeros(n, dtype=np.int32)
+        self.wumpus_y = np.zeros(n, dtype=np.int32)
+        self.gold_x = np.zeros(n, dtype=np.int32)
+        self.gold_y = np.zeros(n, dtype=np.int32)
+        self.pits = np.zeros((n, *self.size), dtype=bool)
+        self.wumpus = np.zeros((n, *self.size), dtype=bool)
+        self.gold = np.zeros((n, *self.size), dtype=bool)
+        self.breeze = np.zeros((n, *self.size), dtype=bool)
+
+        self.percepts = np.zeros((n, NUM_PERCEPTS), dtype=np.int8)
+
+    def reset(self, env_ids=None):
+        """
+        Generate new Wumpus worlds for `env_ids` (all worlds if None)
+        and return the stacked percepts of all worlds
+        """
+        if env_ids is None:
+            env_ids = self._idx
+        env_ids = np.asarray(env_ids)
+        if env_ids.dtype == bool:
+            env_ids = np.flatnonzero(env_ids)
+        k = len(env_ids)
+        if k == 0:
+            return self.percepts
+
+        width, height = self.size
+        n_cells = width * height
+
+        self.x[env_ids] = 0
+        self.y[env_ids] = 0
+        self.orientation[env_ids] = Orientation.NORTH
+        self.has_arrow[env_ids] = True
+        self.has_gold[env_ids] = False
+        self.alive[env_ids] = True
+        self.terminated[env_ids] = False
+        self.wumpus_alive[env_ids] = True
+        self.t[env_ids] = 0
+
+        # generate pits
+        pits = self.rng.random((k, width, height)) <= self.p_pit
+        pits[:, 0, 0] = False
+        self.pits[env_ids] = pits
+        self.breeze[env_ids] = neighbor_mask(pits)
+
+        # select position for wumpus and gold (index = y * width + x)
+        idx_wumpus = self.rng.integers(low=1, high=n_cells, size=k)
+        idx_gold = self.rng.integers(low=0, high=n_cells, size=k)
+        self.wumpus_y[env_ids], self.wumpus_x[env_ids] = np.divmod(idx_wumpus, width)
+        self.gold_y[env_ids], self.gold_x[env_ids] = np.divmod(idx_gold, width)
+
+        self.wumpus[env_ids] = False
+        self.wumpus[env_ids, self.wumpus_x[env_ids], self.wumpus_y[env_ids]] = True
+        self.gold[env_ids] = False
+        self.gold[env_ids, self.gold_x[env_ids], self.gold_y[env_ids]] = True
+
+        self.percepts[env_ids] = 0
+        self._sense(env_ids)
+        return self.percepts
+
+    def repeat_worlds(self, n_unique):
+        """
+        Make world i a copy of world i % n_unique, e.g. right after `reset`,
+        so that several policies can be compared on the same worlds
+        """
+        if self.n_envs % n_unique:
+            raise ValueError("n_envs must be a multiple of n_unique")
+        for arr in [self.x, self.y, self.orientation, self.has_arrow, self.has_gold, self.alive,
+                    self.terminated, self.t, self.wumpus_alive, self.wumpus_x, self.wumpus_y,
+                    self.gold_x, self.gold_y, self.pits, self.wumpus, self.gold, self.breeze, self.percepts]:
+            blocks = arr.reshape(-1, n_unique, *arr.shape[1:])
+            blocks[1:] = blocks[0]
+        return self.percepts
+
+    def _sense(self, env_ids):
+        """
+        Write stench, breeze and glitter for `env_ids` into `self.percepts`
+        """
+        x = self.x[env_ids]
+        y = self.y[env_ids]
+        dist = np.abs(x - self.wumpus_x[env_ids]) + np.abs(y - self.wumpus_y[env_ids])
+        self.percepts[env_ids, Percepts.STENCH] = dist <= 1
+        self.percepts[env_ids, Percepts.BREEZE] = self.breeze[env_ids, x, y]
+        self.percepts[env_ids, Percepts.GLITTER] = self.gold[env_ids, x, y]
+
+    def step(self, actions):
+        """
+        Apply one action per world.
+
+        Returns (percepts, rewards, terminated, timeouts) as arrays with one
+        row per world. `timeouts` marks episodes that ended because Tmax was
+        reached (`info == "Max steps reached."` in `Wumpus.step`).
+        """
+        if self.terminated.any():
+            raise AssertionError("Environment already terminted. Reset before taking any further actions.")
+
+        actions = np.asarray(actions)
+        idx = self._idx
+        width, height = self.size
+
+        rewards = np.full(self.n_envs, -1, dtype=np.float32) # any actions costs
+        terminated = np.zeros(self.n_envs, dtype=bool)
+
+        # turning
+        turn = (actions == Actions.RIGHT).astype(np.int32) - (actions == Actions.LEFT)
+        self.orientation = (self.orientation + turn) % 4
+
+        # moving
+        forward = actions == Actions.FORWARD
+        dx = DX[self.orientation]
+        dy = DY[self.orientation]
+        new_x = np.clip(self.x + dx * forward, 0, width - 1)
+        new_y = np.clip(self.y + dy * forward, 0, height - 1)
+        bump = forward & (new_x == self.x) & (new_y == self.y)
+        self.x = new_x
+        self.y = new_y
+
+        # shooting: the arrow flies from the agent's cell to the wall
+        shoot = (actions == Actions.SHOOT) & self.has_arrow
+        rewards -= 10 * shoot
+        self.has_arrow &= ~shoot
+        wx = self.wumpus_x - self.x
+        wy = self.wumpus_y - self.y
+        in_line = ((dx != 0) & (wy == 0) & (wx * dx >= 0)) | ((dy != 0) & (wx == 0) & (wy * dy >= 0))
+        scream = shoot & in_line
+        self.wumpus_alive &= ~scream
+
+        # grabbing
+        on_gold = self.gold[idx, self.x, self.y]
+        grab = (actions == Actions.GRAB) & on_gold
+        self.has_gold |= grab
+        self.gold[idx[grab], self.x[grab], self.y[grab]] = False
+
+        # climbing
+        at_exit = (self.x == 0) & (self.y == 0)
+        climb = (actions == Actions.CLIMB) & at_exit
+        terminated |= climb
+        rewards += 1000 * (climb & self.has_gold)
+
+        # check for death
+        eaten = self.wumpus_alive & (self.x == self.wumpus_x) & (self.y == self.wumpus_y)
+        rewards -= 1000 * eaten
+        fallen = self.pits[idx, self.x, self.y]
+        rewards[fallen] = -1000
+        died = eaten | fallen
+        terminated |= died
+        self.alive &= ~died
+
+        # compile observation vector
+        #   [stench,breeze,glitter,bump,scream]
+        self._sense(idx)
+        self.percepts[:, Percepts.BUMP] = bump
+        self.percepts[:, Percepts.SCREAM] = scream
+
+        self.t += 1
+        timeouts = ~terminated & (self.t >= self.Tmax - 1)
+        rewards -= 1000 * timeouts
+        terminated |= timeouts
+
+        self.terminated = terminated.copy() # reset() clears it, not the returned flags
+        if self.autoreset and terminated.any():
+            self.reset(np.flatnonzero(terminated))
+
+        return self.percepts.copy(), rewards, terminated, timeouts
+
+
+if __name__ == "__main__":
+    import time
+
+    n_envs = 4096
+    n_steps = 1000
+    env = VectorWumpus(n_envs, size=(4,4), p_pit=0.2, Tmax=50, seed=2024, autoreset=True)
+    env.reset()
+    actions = env.rng.integers(0, 6, size=(n_steps, n_envs))
+
+    start = time.perf_counter()
+    for a in actions:
+        env.step(a)
+    elapsed = time.perf_counter() - start
+    print(f"{n_envs * n_steps / elapsed:,.0f} env-steps/s")
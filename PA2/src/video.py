@@ -0,0 +1,177 @@
+import multiprocessing as mp
+import os
+
+import numpy as np
+from PIL import Image
+from wumpus import Orientation, Wumpus, board_background, load_icons, percept_panel, status_panel
+
+AGENT_ICONS = {
+    Orientation.NORTH: "north",
+    Orientation.EAST: "east",
+    Orientation.SOUTH: "south",
+    Orientation.WEST: "west",
+}
+
+
+class TrajectoryRenderer:
+    """
+    Headless renderer for a whole trajectory.
+
+    Frame i equals `np.array(env.render())` after the i-th action, but
+    frames are written into one preallocated uint8 stack: every frame
+    starts as a copy of the previous one and only the cells whose content
+    changed (agent, shot wumpus, grabbed gold) and the side panels are
+    re-blitted from small caches.
+    """
+    def __init__(self, size=(4,4), cell_size=100, wall_width=3):
+        self.size = tuple(size)
+        self.cell_size = cell_size
+        self.wall_width = wall_width
+
+        self.board = np.asarray(board_background(self.size, cell_size, wall_width))
+        self.height, self.board_width = self.board.shape[:2]
+        self.width = self.board_width + cell_size + 20 + cell_size
+
+        self._pits = set()
+        self._cells = {}
+        self._percepts = {}
+        self._status = {}
+
+    def _offset(self, pos):
+        """
+        Top left pixel of a cell
+        """
+        x_offset = self.wall_width + pos[0] * (self.cell_size + self.wall_width)
+        y_offset = self.wall_width + self.size[1] * (self.wall_width + self.cell_size) - ((1 + pos[1]) * (self.cell_size + self.wall_width))
+        return (x_offset, y_offset)
+
+    def _cell(self, pos, wumpus, gold, pit, orientation):
+        """
+        Pixels of one cell with its content, drawn like `Wumpus.render`
+        """
+        key = (pos, wumpus, gold, pit, orientation)
+        cell = self._cells.get(key)
+        if cell is not None:
+            return cell
+
+        icons = load_icons()
+        x0, y0 = self._offset(pos)
+        img = Image.fromarray(self.board[y0:y0 + self.cell_size, x0:x0 + self.cell_size])
+        half = self.cell_size // 2
+        if wumpus:
+            img.paste(icons["wumpus"], (10, 10), icons["wumpus"])
+        if gold:
+            img.paste(icons["gold"], (10 + half, 10), icons["gold"])
+        if pit:
+            img.paste(icons["pit"], (10, 5 + half), icons["pit"])
+        if orientation is not None:
+            icon = icons[AGENT_ICONS[orientation]]
+            img.paste(icon, (10 + half, 5 + half), icon)
+        cell = np.asarray(img)
+        self._cells[key] = cell
+        return cell
+
+    def _percept_panel(self, obs):
+        key = tuple(int(o) for o in obs)
+        if key not in self._percepts:
+            self._percepts[key] = np.asarray(percept_panel(obs, self.cell_size, self.height))
+        return self._percepts[key]
+
+    def _status_panel(self, env):
+        # keyed by the printed text: 0 and 0.0 are equal but look different
+        key = tuple(str(v) for v in (env.reward, env.terminated, env.has_arrow, env.has_gold))
+        if key not in self._status:
+            self._status[key] = np.asarray(status_panel(*key, self.cell_size, self.height))
+        return self._status[key]
+
+    def _cell_state(self, env, pos):
+        wumpus = env.wumpus_alive and pos == tuple(env.pos_wumpus)
+        gold = env.pos_gold is not None and pos == tuple(env.pos_gold)
+        orientation = env.orientation_agent if pos == tuple(env.pos_agent) else None
+        return (pos, wumpus, gold, pos in self._pits, orientation)
+
+    def _blit(self, frame, env, cells):
+        for pos in cells:
+            x0, y0 = self._offset(pos)
+            frame[y0:y0 + self.cell_size, x0:x0 + self.cell_size] = self._cell(*self._cell_state(env, pos))
+        frame[:, self.board_width:self.board_width + self.cell_size] = self._percept_panel(env.obs)
+        frame[:, self.board_width + self.cell_size:] = self._status_panel(env)
+
+    def render(self, env, actions, out=None):
+        """
+        Render the episode that `env` just started with `reset()` by
+        stepping it through `actions`. Returns a (len(actions)+1, H, W, 3)
+        uint8 stack; stops early if the episode terminates.
+        """
+        n_frames = len(actions) + 1
+        if out is None:
+            out = np.empty((n_frames, self.height, self.width, 3), dtype=np.uint8)
+
+        self._pits = set(tuple(int(c) for c in pit) for pit in env.pits)
+        out[0, :, :self.board_width] = self.board
+        self._blit(out[0], env, [(x, y) for x in range(self.size[0]) for y in range(self.size[1])])
+
+        for i, action in enumerate(actions, 1):
+            if env.terminated:
+                return out[:i]
+            dirty = {tuple(env.pos_agent)}
+            wumpus_alive, pos_gold = env.wumpus_alive, env.pos_gold
+            env.step(action)
+            dirty.add(tuple(env.pos_agent))
+            if env.wumpus_alive != wumpus_alive:
+                dirty.add(tuple(env.pos_wumpus))
+            if env.pos_gold != pos_gold:
+                dirty.add(tuple(pos_gold))
+
+            out[i] = out[i - 1]
+            self._blit(out[i], env, dirty)
+        return out
+
+
+def replay(seed, actions, episode=0, env_cls=Wumpus, **env_kwargs):
+    """
+    Recreate episode number `episode` of an environment created with `seed`
+    and render it with the logged `actions`
+    """
+    env = env_cls(seed=seed, **env_kwargs)
+    for _ in range(episode + 1):
+        env.reset()
+    renderer = TrajectoryRenderer(env.size, env.cell_size, env.wall_width)
+    return renderer.render(env, actions)
+
+
+def save_frames(frames, path, fps=4):
+    """
+    Write a frame stack as animated GIF (`.gif`) or raw NumPy video (`.npy`)
+    """
+    if path.endswith(".npy"):
+        np.save(path, frames)
+        return
+    images = [Image.fromarray(frame) for frame in frames]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=int(1000 / fps), loop=0)
+
+
+def _record(args):
+    path, trajectory, fps = args
+    save_frames(replay(**trajectory), path, fps=fps)
+    return path
+
+
+def record_trajectories(trajectories, out_dir, fmt="gif", fps=4, n_workers=None):
+    """
+    Render many logged trajectories in a process pool.
+
+    trajectories ... list of dicts with the arguments of `replay`
+        (seed, actions, optional episode, env_cls and env kwargs)
+    fmt ... "gif" or "npy"
+    Returns the written paths.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [
+        (os.path.join(out_dir, f"trajectory_{i:06d}.{fmt}"), trajectory, fps)
+        for i, trajectory in enumerate(trajectories)
+    ]
+    if n_workers == 1:
+        return [_record(task) for task in tasks]
+    with mp.get_context().Pool(n_workers) as pool:
+        return pool.map(_record, tasks)
@@ -1,9 +1,13 @@
 import numpy as np
 from PIL import Image
 from PIL import ImageDraw
+import struct
 import sys
 import os
 
+import kernel
+from seeding import RNG_STATE_SIZE, pack_rng_state, unpack_rng_state
+
 class Orientation:
     NORTH = 0
     EAST = 1
@@ -26,6 +30,162 @@ class Percepts:
     BUMP = 3
     SCREAM = 4
 
+# percept vector for every combination of percept bits (bit i <-> Percepts i)
+PERCEPT_TABLE = (np.arange(32).reshape((-1,1)) >> np.arange(5)) & 1
+PERCEPT_WEIGHTS = 1 << np.arange(5) # percept vector -> bits
+
+class Cell:
+    # bits of the uint8 cell grid; the percept bits come first, so that
+    # `grid[pos] & PERCEPT_BITS` indexes PERCEPT_TABLE directly
+    STENCH = 1 << Percepts.STENCH
+    BREEZE = 1 << Percepts.BREEZE
+    GLITTER = 1 << Percepts.GLITTER # the gold lies here
+    PIT = 1 << 5
+    WUMPUS = 1 << 6
+    VISITED = 1 << 7
+
+PERCEPT_BITS = Cell.STENCH | Cell.BREEZE | Cell.GLITTER
+
+def neighbor_mask(grid):
+    """
+    Mark every cell that shares an edge with a True cell of `grid`.
+    The last two axes of `grid` are the (x,y) axes of the world.
+    """
+    mask = np.zeros_like(grid, dtype=bool)
+    mask[..., 1:, :] |= grid[..., :-1, :]
+    mask[..., :-1, :] |= grid[..., 1:, :]
+    mask[..., :, 1:] |= grid[..., :, :-1]
+    mask[..., :, :-1] |= grid[..., :, 1:]
+    return mask
+
+def build_grid(pits, pos_wumpus, pos_gold):
+    """
+    Cell grid of a world from its (W,H) bool pit array.
+    The stench stays after the wumpus has been shot, like in `Wumpus.step`.
+    """
+    wumpus = np.zeros(pits.shape, dtype=bool)
+    wumpus[pos_wumpus] = True
+    grid = np.zeros(pits.shape, dtype=np.uint8)
+    grid[pits] |= Cell.PIT
+    grid[pos_wumpus] |= Cell.WUMPUS
+    grid[pos_gold] |= Cell.GLITTER
+    grid[wumpus | neighbor_mask(wumpus)] |= Cell.STENCH
+    grid[neighbor_mask(pits)] |= Cell.BREEZE
+    return grid
+
+def build_grids(pits, wumpus_x, wumpus_y, gold_x, gold_y):
+    """
+    `build_grid` for a batch of (N,W,H) pit arrays and N positions each
+    """
+    idx = np.arange(len(pits))
+    wumpus = np.zeros(pits.shape, dtype=bool)
+    wumpus[idx, wumpus_x, wumpus_y] = True
+    grids = np.zeros(pits.shape, dtype=np.uint8)
+    grids[pits] |= Cell.PIT
+    grids[wumpus] |= Cell.WUMPUS
+    grids[idx, gold_x, gold_y] |= Cell.GLITTER
+    grids[wumpus | neighbor_mask(wumpus)] |= Cell.STENCH
+    grids[neighbor_mask(pits)] |= Cell.BREEZE
+    return grids
+
+# snapshot() header: agent x, y, orientation, has_arrow, has_gold,
+# terminated, wumpus_alive, gold x, y (-1 once grabbed), percept bits, t;
+# followed by the packed VISITED bits and the random generator state
+SNAPSHOT = struct.Struct("<2H5B2hBi")
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+ICON_FILES = [("wumpus", "monster.png"), ("gold", "gold.png"), ("pit", "pit.png"), ("agent", "robot.png"), ("north", "robot-north.png"), ("east", "robot-east.png"), ("south", "robot-south.png"), ("west", "robot-west.png"), ("stench", "stench.png"), ("breeze", "breeze.png"), ("glitter", "glitter.png"), ("bump", "bump.png"), ("scream", "scream.png")]
+
+# process-wide caches for rendering, filled on first use
+_icons = None
+_boards = {}
+
+def load_icons():
+    """
+    Load the icons once per process
+    """
+    global _icons
+    if _icons is None:
+        icons = {}
+        for name, filename in ICON_FILES:
+            icon = Image.open(os.path.join(ICON_DIR, filename))
+            icon = icon.resize((30,30), Image.Resampling.LANCZOS)
+            icons[name] = icon
+        _icons = icons
+    return _icons
+
+def board_background(size, cell_size, wall_width, origin=(0,0)):
+    """
+    Empty board with grid lines and (x,y) labels, its lower left cell being
+    `origin`. Boards starting at (0,0) are drawn once per grid size and the
+    cached image is shared, copy it before drawing on it.
+    """
+    key = (tuple(size), cell_size, wall_width)
+    if key in _boards and tuple(origin) == (0,0):
+        return _boards[key]
+
+    height = size[1] * (cell_size + wall_width) + wall_width
+    width = size[0] * (cell_size + wall_width) + wall_width
+    img = Image.new(mode='RGB', size=(width, height), color = (255,255,255))
+    draw = ImageDraw.Draw(img)
+
+    # grid
+    sidx = 0
+    for i in range(size[0] + 1):
+        draw.rectangle((sidx, 0) + (sidx+wall_width,img.size[1]), fill=(0,0,0))
+        sidx += wall_width + cell_size
+    sidx = 0
+    for i in range(size[1] + 1):
+        draw.rectangle((0, sidx) + (img.size[0],sidx+wall_width), fill=(0,0,0))
+        sidx += wall_width + cell_size
+
+    # labels
+    for x in range(size[0]):
+        for y in range(size[1]):
+            x_pos = wall_width + 3 + x * (cell_size + wall_width)
+            y_pos = img.size[1] - wall_width - 3 - 10 - y * (cell_size + wall_width)
+            draw.text((x_pos, y_pos), f"({origin[0]+x+1},{origin[1]+y+1})", fill=(100, 100, 100))
+
+    # viewports of large worlds move with the agent, caching them would not pay off
+    if tuple(origin) == (0,0):
+        _boards[key] = img
+    return img
+
+def viewport_window(size, pos, viewport):
+    """
+    (origin, size) of a window of at most `viewport` cells centered on
+    `pos` and shifted to lie inside a board of `size` cells
+    """
+    width, height = min(viewport[0], size[0]), min(viewport[1], size[1])
+    x0 = min(max(pos[0] - width // 2, 0), size[0] - width)
+    y0 = min(max(pos[1] - height // 2, 0), size[1] - height)
+    return (x0, y0), (width, height)
+
+def percept_panel(obs, cell_size, height):
+    """
+    Panel showing the icons of the current percepts
+    """
+    icons = load_icons()
+    percepts = Image.new(mode='RGB', size=(cell_size, height), color = (255,255,255))
+    draw = ImageDraw.Draw(percepts)
+    draw.text((10,10), "percepts", fill=(0,0,0))
+    for i, k in [(Percepts.STENCH, "stench"), (Percepts.BREEZE, "breeze"), (Percepts.GLITTER, "glitter"), (Percepts.BUMP, "bump"), (Percepts.SCREAM, "scream")]:
+        if obs[i]:
+            percepts.paste(icons[k], (10, 30 + i*40), icons[k])
+    return percepts
+
+def status_panel(reward, terminated, has_arrow, has_gold, cell_size, height):
+    """
+    Panel showing reward, termination and inventory
+    """
+    status = Image.new(mode='RGB', size=(20+cell_size, height), color = (255,255,255))
+    draw = ImageDraw.Draw(status)
+    draw.text((10,10), f"reward={reward}", fill=(0,0,0))
+    draw.text((10,30), f"terminated={terminated}", fill=(0,0,0))
+    draw.text((10,50), f"arrow={has_arrow}", fill=(0,0,0))
+    draw.text((10,70), f"gold={has_gold}", fill=(0,0,0))
+    return status
+
 def get_concat_h(im1, im2):
     """
     Concatenate two images
@@ -35,13 +195,61 @@ def get_concat_h(im1, im2):
     dst.paste(im2, (im1.width, 0))
     return dst
 
+def state_field(index, convert=int):
+    """
+    Property for one field of the `kernel` state vector
+    """
+    def get(self):
+        return convert(self.state[index])
+    def set(self, value):
+        self.state[index] = int(value)
+    return property(get, set)
+
+def state_pos(index_x, index_y):
+    """
+    Property for an (x,y) pair of the `kernel` state vector, None <-> (-1,-1)
+    """
+    def get(self):
+        x = self.state[index_x]
+        return None if x < 0 else (int(x), int(self.state[index_y]))
+    def set(self, pos):
+        self.state[index_x], self.state[index_y] = (-1, -1) if pos is None else (int(pos[0]), int(pos[1]))
+    return property(get, set)
+
 class Wumpus:
+    __slots__ = (
+        "rng", "size", "p_pit", "wall_width", "cell_size",
+        "state", "grid", "reward", "obs", "seed", "n_episodes", "recorder",
+    )
+
+    # the game state lives in the vector that `kernel.transition` updates
+    pos_agent = state_pos(kernel.X, kernel.Y)
+    orientation_agent = state_field(kernel.ORIENTATION)
+    has_arrow = state_field(kernel.HAS_ARROW, bool)
+    has_gold = state_field(kernel.HAS_GOLD, bool)
+    terminated = state_field(kernel.TERMINATED, bool)
+    wumpus_alive = state_field(kernel.WUMPUS_ALIVE, bool)
+    pos_wumpus = state_pos(kernel.WUMPUS_X, kernel.WUMPUS_Y)
+    pos_gold = state_pos(kernel.GOLD_X, kernel.GOLD_Y)
+    t = state_field(kernel.T)
+    Tmax = state_field(kernel.TMAX)
+
+    # kernel.R_* parameters; falling into a pit sets the reward to -1000
+    REWARDS = kernel.reward_params((-1, -10, 0, 1000, -1000, -1000, 0, 0, 1))
+
+    # get_state() header: agent x, y, orientation, has_arrow, has_gold,
+    # terminated, wumpus_alive, wumpus x, y, gold x, y (-1 once grabbed),
+    # percept bits, t, reward; followed by the cell grid
+    STATE = struct.Struct("<2H5B2H2hBii")
+
     def __init__(self, seed=2024, size=(4,4), p_pit=0.2, Tmax=50):
         """
         seed ... seed for random number generator
         size ... size of the grid of the Wumpus world
         p_pit ... probability of a pit
         """
+        self.state = kernel.new_state()
+        self.seed = seed
         self.rng = np.random.default_rng(seed=seed)
         self.size = size
         self.p_pit = p_pit
@@ -53,20 +261,19 @@ class Wumpus:
         self.terminated = True
         self.Tmax = Tmax
 
-        self.__load_icons()
+        self.n_episodes = 0 # resets so far
+        self.recorder = None # trajectory_log.EnvRecorder, set by TrajectoryWriter.attach
 
-    def __load_icons(self):
+    @property
+    def icons(self):
+        return load_icons()
+
+    @property
+    def pits(self):
         """
-        load icons
+        (k,2) array with the (x,y) positions of the pits
         """
-        self.icons = {}
-
-        # [stench,breeze,glitter,bump,scream]
-
-        for name, filename in [("wumpus", "monster.png"), ("gold", "gold.png"), ("pit", "pit.png"), ("agent", "robot.png"), ("north", "robot-north.png"), ("east", "robot-east.png"), ("south", "robot-south.png"), ("west", "robot-west.png"), ("stench", "stench.png"), ("breeze", "breeze.png"), ("glitter", "glitter.png"), ("bump", "bump.png"), ("scream", "scream.png")]:
-            icon = Image.open(os.path.join("icons", filename))
-            icon = icon.resize((30,30), Image.Resampling.LANCZOS)
-            self.icons[name] = icon
+        return np.argwhere(self.grid & Cell.PIT)
 
     def __index_to_pos(self, index):
         """
@@ -92,7 +299,6 @@ class Wumpus:
         # generate pits
         pits = self.rng.random(self.size) <= self.p_pit
         pits[0,0] = False
-        self.pits = np.hstack([x.reshape((-1,1))for x in np.where(pits)])
 
         # select position for wumpus
         idx_wumpus = self.rng.integers(low=1, high=np.prod(self.size))
@@ -103,88 +309,152 @@ class Wumpus:
         self.pos_gold = self.__index_to_pos(idx_gold)
 
         # generate initial percept
-        obs = obs = np.zeros((5,), dtype=int)
-
-        stench = self.__is_stench()
-        breeze = self.__is_breeze()
-        glitter = self.__is_glitter()
-        bump = False
-        scream = False
-        
-        if stench:
-            obs[Percepts.STENCH] = True
-        if breeze:
-            obs[Percepts.BREEZE] = True
-        if glitter:
-            obs[Percepts.GLITTER] = True
-        if bump:
-            obs[Percepts.BUMP] = True
-        if scream:
-            obs[Percepts.SCREAM] = True
-
-        self.obs = obs
+        self.grid = build_grid(pits, self.pos_wumpus, self.pos_gold)
+        self.grid[self.pos_agent] |= Cell.VISITED
+        bits = self.grid[self.pos_agent] & PERCEPT_BITS
+        self.obs = PERCEPT_TABLE[bits].copy()
         self.t = 0
 
+        self.n_episodes += 1
+        if self.recorder is not None:
+            self.recorder.reset(self.seed, self.n_episodes - 1, int(bits))
         return self.obs
 
-    def __offset_for_pos(self, pos):
+    def get_state(self):
+        """
+        Snapshot of the game as a bytes buffer of `state_size` bytes
+        """
+        gold = (-1, -1) if self.pos_gold is None else self.pos_gold
+        obs_bits = int(self.obs @ PERCEPT_WEIGHTS)
+        header = self.STATE.pack(
+            *self.pos_agent, self.orientation_agent, self.has_arrow, self.has_gold,
+            self.terminated, self.wumpus_alive, *self.pos_wumpus, *gold, obs_bits,
+            self.t, self.reward,
+        )
+        return header + self.grid.tobytes()
+
+    def set_state(self, state):
+        """
+        Restore a snapshot from `get_state` (the random generator is not part of it)
+        """
+        (x, y, self.orientation_agent, has_arrow, has_gold, terminated, wumpus_alive,
+         wx, wy, gx, gy, obs_bits, self.t, self.reward) = self.STATE.unpack_from(state)
+        self.pos_agent = (x, y)
+        self.has_arrow, self.has_gold = bool(has_arrow), bool(has_gold)
+        self.terminated, self.wumpus_alive = bool(terminated), bool(wumpus_alive)
+        self.pos_wumpus = (wx, wy)
+        self.pos_gold = None if gx < 0 else (gx, gy)
+        self.obs = PERCEPT_TABLE[obs_bits].copy()
+        self.grid = np.frombuffer(state, dtype=np.uint8, count=np.prod(self.size), offset=self.STATE.size).reshape(self.size).copy()
+
+    @property
+    def state_size(self):
+        return self.STATE.size + int(np.prod(self.size))
+
+    def snapshot(self):
+        """
+        Dynamic state of the current episode (agent, flags, t, visited
+        cells, random generator) as a few dozen bytes. Unlike `get_state`
+        it leaves out the world, so it can only be restored into the same
+        episode, which is what tree search rollouts need.
+        """
+        s = self.state
+        header = SNAPSHOT.pack(
+            s[kernel.X], s[kernel.Y], s[kernel.ORIENTATION], s[kernel.HAS_ARROW], s[kernel.HAS_GOLD],
+            s[kernel.TERMINATED], s[kernel.WUMPUS_ALIVE], s[kernel.GOLD_X], s[kernel.GOLD_Y],
+            int(self.obs @ PERCEPT_WEIGHTS), s[kernel.T],
+        )
+        visited = np.packbits(self.grid & Cell.VISITED, axis=None)
+        return header + visited.tobytes() + pack_rng_state(self.rng)
+
+    def restore(self, snap):
+        """
+        Go back to a `snapshot` taken in the current episode
+        """
+        s = self.state
+        (s[kernel.X], s[kernel.Y], s[kernel.ORIENTATION], s[kernel.HAS_ARROW], s[kernel.HAS_GOLD],
+         s[kernel.TERMINATED], s[kernel.WUMPUS_ALIVE], s[kernel.GOLD_X], s[kernel.GOLD_Y],
+         obs_bits, s[kernel.T]) = SNAPSHOT.unpack_from(snap)
+        self.obs = PERCEPT_TABLE[obs_bits].copy()
+
+        n_cells = self.grid.size
+        n_bytes = (n_cells + 7) // 8
+        packed = np.frombuffer(snap, dtype=np.uint8, count=n_bytes, offset=SNAPSHOT.size)
+        visited = np.unpackbits(packed, count=n_cells).reshape(self.grid.shape)
+        self.grid &= ~np.uint8(Cell.VISITED | Cell.GLITTER)
+        self.grid |= visited * np.uint8(Cell.VISITED)
+        if self.pos_gold is not None:
+            self.grid[self.pos_gold] |= Cell.GLITTER
+        unpack_rng_state(self.rng, snap, SNAPSHOT.size + n_bytes)
+
+    def simulate(self, actions, snap=None):
+        """
+        Fast rollout: restore `snap` (if given) and play `actions` until the
+        episode terminates, without building percept vectors on the way.
+        Returns (total reward, terminated, number of steps taken).
+        """
+        if snap is not None:
+            self.restore(snap)
+        total_reward = 0
+        n_steps = 0
+        bits = None
+        for action in actions:
+            if self.terminated:
+                break
+            bits, reward, terminated, info = self._transition(action)
+            total_reward += reward
+            n_steps += 1
+        if bits is not None:
+            self.obs = PERCEPT_TABLE[bits].copy()
+        return total_reward, self.terminated, n_steps
+
+    def __offset_for_pos(self, pos, origin=(0,0), size=None):
         """
-        Get the offset for drawing for a position (top left of a cell)
+        Get the offset for drawing for a position (top left of a cell),
+        on a board showing `size` cells from `origin` on
         """
-        x_offset = self.wall_width + pos[0] * (self.cell_size + self.wall_width)
-        y_offset = self.wall_width + self.size[1] * (self.wall_width + self.cell_size) - ((1 + pos[1]) * (self.cell_size + self.wall_width))
+        size = self.size if size is None else size
+        x_offset = self.wall_width + (pos[0] - origin[0]) * (self.cell_size + self.wall_width)
+        y_offset = self.wall_width + size[1] * (self.wall_width + self.cell_size) - ((1 + pos[1] - origin[1]) * (self.cell_size + self.wall_width))
 
         return (x_offset, y_offset)
 
-    def render(self):
+    def render(self, viewport=None):
         """
-        Render the current state of the wumpus world
+        Render the current state of the wumpus world.
+        viewport ... (width, height) in cells of a window around the agent
+            to draw instead of the whole board, for large worlds
         """
-        height = self.size[1] * (self.cell_size + self.wall_width) + self.wall_width
-        width = self.size[0] * (self.cell_size + self.wall_width) + self.wall_width
-        # img = 255*np.ones((width, height, 3), dtype=int)
-        img = Image.new(mode='RGB', size=(width, height), color = (255,255,255))
-        draw = ImageDraw.Draw(img)
-
-        # grid
-        sidx = 0
-        for i in range(self.size[0] + 1):
-            draw.rectangle((sidx, 0) + (sidx+self.wall_width,img.size[1]), fill=(0,0,0))
-            #img[sidx:sidx+self.wall_width,:,:] = 0
-            sidx += self.wall_width + self.cell_size
-        sidx = 0
-        for i in range(self.size[1] + 1):
-            draw.rectangle((0, sidx) + (img.size[0],sidx+self.wall_width), fill=(0,0,0))
-            #img[:,sidx:sidx+self.wall_width,:] = 0
-            sidx += self.wall_width + self.cell_size
-
-        # labels
-        #fnt = ImageFont.truetype("Pillow/Tests/fonts/FreeMono.ttf", 40)
-        for x in range(self.size[0]):
-            for y in range(self.size[1]):
-                x_pos = self.wall_width + 3 + x * (self.cell_size + self.wall_width)
-                y_pos = img.size[1] - self.wall_width - 3 - 10 - y * (self.cell_size + self.wall_width)
-                draw.text((x_pos, y_pos), f"({x+1},{y+1})", fill=(100, 100, 100)) # font=fnt, 
+        if viewport is None:
+            origin, size = (0,0), self.size
+        else:
+            origin, size = viewport_window(self.size, self.pos_agent, viewport)
+        height = size[1] * (self.cell_size + self.wall_width) + self.wall_width
+
+        def visible(pos):
+            return origin[0] <= pos[0] < origin[0] + size[0] and origin[1] <= pos[1] < origin[1] + size[1]
+
+        # grid and labels
+        img = board_background(size, self.cell_size, self.wall_width, origin).copy()
 
         # show wumpus
-        if self.wumpus_alive:
-            offset = self.__offset_for_pos(self.pos_wumpus)
+        if self.wumpus_alive and visible(self.pos_wumpus):
+            offset = self.__offset_for_pos(self.pos_wumpus, origin, size)
             img.paste(self.icons["wumpus"], (offset[0] + 10, offset[1] + 10), self.icons["wumpus"])
 
         # show gold
-        if self.pos_gold is not None:
-            offset = self.__offset_for_pos(self.pos_gold)
+        if self.pos_gold is not None and visible(self.pos_gold):
+            offset = self.__offset_for_pos(self.pos_gold, origin, size)
             img.paste(self.icons["gold"], (offset[0] + 10 + self.cell_size // 2, offset[1] + 10), self.icons["gold"])
 
         # show pits
-        for pit in self.pits:
-            pos_pit = pit
-            # print("  pos pit: ", pos_pit)
-            offset = self.__offset_for_pos(pos_pit)
+        window = self.grid[origin[0]:origin[0] + size[0], origin[1]:origin[1] + size[1]]
+        for pit in np.argwhere(window & Cell.PIT) + origin:
+            offset = self.__offset_for_pos(pit, origin, size)
             img.paste(self.icons["pit"], (offset[0] + 10, offset[1] + 5 + self.cell_size // 2), self.icons["pit"])
 
         # show robot
-        offset = self.__offset_for_pos(self.pos_agent)
+        offset = self.__offset_for_pos(self.pos_agent, origin, size)
         if self.orientation_agent == Orientation.NORTH:
             agent_icon = self.icons["north"]
         elif self.orientation_agent == Orientation.EAST:
@@ -196,166 +466,35 @@ class Wumpus:
         img.paste(agent_icon, (offset[0] + 10 + self.cell_size // 2, offset[1] + 5 + self.cell_size // 2), agent_icon)
 
         ## render percepts
-        obs = self.obs
-        percepts = Image.new(mode='RGB', size=(self.cell_size, height), color = (255,255,255))
-        draw = ImageDraw.Draw(percepts)
-        draw.text((10,10), "percepts", fill=(0,0,0))
-        for i, k in [(Percepts.STENCH, "stench"), (Percepts.BREEZE, "breeze"), (Percepts.GLITTER, "glitter"), (Percepts.BUMP, "bump"), (Percepts.SCREAM, "scream")]:
-            if obs[i]:
-                percepts.paste(self.icons[k], (10, 30 + i*40), self.icons[k])
-        
+        percepts = percept_panel(self.obs, self.cell_size, height)
+
         ## render status
-        status = Image.new(mode='RGB', size=(20+self.cell_size, height), color = (255,255,255))
-        draw = ImageDraw.Draw(status)
-        draw.text((10,10), f"reward={self.reward}", fill=(0,0,0))
-        draw.text((10,30), f"terminated={self.terminated}", fill=(0,0,0))
-        draw.text((10,50), f"arrow={self.has_arrow}", fill=(0,0,0))
-        draw.text((10,70), f"gold={self.has_gold}", fill=(0,0,0))
+        status = status_panel(self.reward, self.terminated, self.has_arrow, self.has_gold, self.cell_size, height)
 
         return get_concat_h(get_concat_h(img, percepts), status)
     
-    def __is_glitter(self):
-        # are we on a field with gold
-        if self.pos_agent == self.pos_gold:
-            return True
-        else:
-            return False
-        
-    def __is_stench(self):
-        # are we next to a wumpus?
-        if self.pos_wumpus is None:
-            return False
-        dx = self.pos_agent[0] - self.pos_wumpus[0]
-        dy = self.pos_agent[1] - self.pos_wumpus[1]
-        if np.abs(dx) + np.abs(dy) <= 1:
-            return True
-        else:
-            return False
-        
-    def __is_breeze(self):
-        # are we next to a pit?
-        for pos_pit in self.pits:
-            dx = self.pos_agent[0] - pos_pit[0]
-            dy = self.pos_agent[1] - pos_pit[1]
-            if np.abs(dx) + np.abs(dy) == 1:
-                return True
-        return False
-    
     def step(self, action):
-        if self.terminated:
-            raise AssertionError("Environment already terminted. Reset before taking any further actions.")
-
-        # percept variables
-        # [stench,breeze,glitter,bump,scream]
-        stench = False
-        breeze = False
-        glitter = False
-        bump = False
-        scream = False
-
-        reward = -1 # any actions costs
-        terminated = False
-        info = {}
-        if action == Actions.LEFT:
-            self.orientation_agent = (self.orientation_agent - 1) % 4
-        elif action == Actions.RIGHT:
-            self.orientation_agent = (self.orientation_agent + 1) % 4
-        elif action == Actions.FORWARD:
-            old_pos = self.pos_agent
-            dx = 0
-            dy = 0
-            if self.orientation_agent == Orientation.EAST:
-                dx = 1
-            elif self.orientation_agent == Orientation.WEST:
-                dx = -1
-            elif self.orientation_agent == Orientation.NORTH:
-                dy = 1
-            elif self.orientation_agent == Orientation.SOUTH:
-                dy = -1
-
-            new_x = max(0, min(self.size[0] - 1, self.pos_agent[0] + dx))
-            new_y = max(0, min(self.size[1] - 1, self.pos_agent[1] + dy))
-    
-            new_pos = (new_x, new_y)
-            if old_pos == new_pos:
-                bump = True
-            self.pos_agent = new_pos
-        elif action == Actions.SHOOT:
-            if self.has_arrow:
-                reward -= 10
-                self.has_arrow = False
-
-                # do we hit the wumpus?
-                if self.orientation_agent == Orientation.NORTH:
-                    dx = 0
-                    dy = 1
-                elif self.orientation_agent == Orientation.EAST:
-                    dx = 1
-                    dy = 0
-                elif self.orientation_agent == Orientation.SOUTH:
-                    dx = 0
-                    dy = -1
-                elif self.orientation_agent == Orientation.WEST:
-                    dx = -1
-                    dy = 0
-                for i in range(max(self.size)):
-                    pos_arrow = (self.pos_agent[0] + i*dx, self.pos_agent[1] + i*dy)
-                    if self.pos_wumpus == pos_arrow:
-                        self.wumpus_alive = False
-                        scream = True
-        elif action == Actions.GRAB:
-            if self.pos_agent == self.pos_gold:
-                self.has_gold = True
-                self.pos_gold = None
-        elif action == Actions.CLIMB:
-            if self.pos_agent == (0,0): 
-                terminated = True
-                if self.has_gold:
-                    reward += 1000
-
-        # compile percepts, check for death
-        if self.wumpus_alive and (self.pos_agent == self.pos_wumpus):
-            reward -= 1000
-            terminated = True
-        for pos_pit in self.pits:
-            pos_pit = (pos_pit[0], pos_pit[1])
-            if self.pos_agent == pos_pit:
-                reward = -1000
-                terminated = True
-
-        if self.pos_gold == self.pos_agent:
-            glitter = True
-
-        # compile observation vector
-        #   [stench,breeze,glitter,bump,scream]
-        obs = np.zeros((5,), dtype=int)
-        stench = self.__is_stench()
-        breeze = self.__is_breeze()
-        glitter = self.__is_glitter()
-        if stench:
-            obs[Percepts.STENCH] = True
-        if breeze:
-            obs[Percepts.BREEZE] = True
-        if glitter:
-            obs[Percepts.GLITTER] = True
-        if bump:
-            obs[Percepts.BUMP] = True
-        if scream:
-            obs[Percepts.SCREAM] = True
-
+        bits, reward, terminated, info = self._transition(action)
+        obs = PERCEPT_TABLE[bits].copy()
         self.obs = obs
-
-        self.t += 1
-        if not terminated:
-            if self.t >= (self.Tmax - 1):
-                reward -= 1000
-                terminated = True
-                info = "Max steps reached."
-
-        self.terminated = terminated
         self.reward = reward
+        if self.recorder is not None:
+            self.recorder.step(action, bits, reward, self.state[kernel.TERMINATED])
         return obs, reward, terminated, info
 
+    def _transition(self, action):
+        """
+        Apply an action to the game state and return the percept bits
+        instead of the percept vector, leaving the render state alone
+        """
+        state = self.state
+        if state[kernel.TERMINATED]:
+            raise AssertionError("Environment already terminted. Reset before taking any further actions.")
+
+        _, bits, reward, terminated = kernel.transition(state, self.grid, action, self.REWARDS)
+        info = "Max steps reached." if state[kernel.TERMINATED] == kernel.TIMEOUT else {}
+        return bits, int(reward), terminated, info
+
 
 
 
@@ -1,8 +1,14 @@
-import os
+import struct
 import sys
 
+import kernel
 import numpy as np
-from PIL import Image, ImageDraw
+from seeding import BlockRNG
+from PIL import Image
+from wumpus import (
+    PERCEPT_BITS, PERCEPT_TABLE, PERCEPT_WEIGHTS, SNAPSHOT, Cell, board_background, build_grid, load_icons,
+    percept_panel, state_field, state_pos, status_panel, viewport_window,
+)
 
 
 class Orientation:
@@ -37,18 +43,61 @@ def get_concat_h(im1, im2):
     return dst
 
 class Wumpus:
+    __slots__ = (
+        "rng", "size", "with_wumpus", "start_pos", "start_orientation",
+        "wall_width", "cell_size", "__p_pit", "__Tmax", "p_pit", "state", "grid", "reward", "obs",
+        "seed", "n_episodes", "recorder", "worlds", "tier",
+    )
+
+    # the game state lives in the vector that `kernel.transition` updates
+    pos_agent = state_pos(kernel.X, kernel.Y)
+    pos_exit = state_pos(kernel.EXIT_X, kernel.EXIT_Y)
+    orientation_agent = state_field(kernel.ORIENTATION)
+    has_arrow = state_field(kernel.HAS_ARROW, bool)
+    has_gold = state_field(kernel.HAS_GOLD, bool)
+    terminated = state_field(kernel.TERMINATED, bool)
+    wumpus_alive = state_field(kernel.WUMPUS_ALIVE, bool)
+    pos_wumpus = state_pos(kernel.WUMPUS_X, kernel.WUMPUS_Y)
+    pos_gold = state_pos(kernel.GOLD_X, kernel.GOLD_Y)
+    t = state_field(kernel.T)
+    Tmax = state_field(kernel.TMAX)
+
+    r_step = -0.2
+    r_arrow_shoot = -4
+    r_gold_grab = 15
+    r_escape_with_gold = 100
+    r_death = -80
+    r_new_cell_explored = 2
+    r_gold_at_exit = 0.5
+    # kernel.R_* parameters; every death adds r_death, so does the timeout
+    REWARDS = kernel.reward_params((
+        r_step, r_arrow_shoot, r_gold_grab, r_escape_with_gold, r_death, r_death,
+        r_new_cell_explored, r_gold_at_exit, 0,
+    ))
+
+    # get_state() header: agent x, y, orientation, has_arrow, has_gold,
+    # terminated, wumpus_alive, wumpus x, y, gold x, y (-1 once grabbed),
+    # exit x, y, percept bits, t, Tmax, reward, p_pit; followed by the cell
+    # grid, whose VISITED bits replace the set of visited cells
+    STATE = struct.Struct("<2H5B2H2h2HBiidd")
+
     def __init__(
         self, seed=2024, size=(4,4), p_pit=0.2, Tmax=50,
         with_wumpus=True,
         start_pos=(0,0),
         start_orientation=Orientation.NORTH,
+        worlds=None,
     ):
         """
         seed ... seed for random number generator
         size ... size of the grid of the Wumpus world
         p_pit ... probability of a pit
+        worlds ... `curriculum.CurriculumScheduler` to take the worlds from
+            instead of generating them; the other world arguments are ignored
         """
-        self.rng = np.random.default_rng(seed=seed)
+        self.state = kernel.new_state()
+        self.seed = seed
+        self.rng = BlockRNG(seed) # all randomness of reset, see `seeding`
         self.size = size
 
         self.with_wumpus = with_wumpus
@@ -65,34 +114,39 @@ class Wumpus:
         self._reset_p_pit()
         self._reset_Tmax()
 
-        self.__load_icons()
+        self.n_episodes = 0 # resets so far
+        self.recorder = None # trajectory_log.EnvRecorder, set by TrajectoryWriter.attach
+        self.worlds = worlds
+        self.tier = None
     
     def _reset_p_pit(self):
         if isinstance(self.__p_pit, float):
             self.p_pit = self.__p_pit
         else:
             low, high = self.__p_pit
-            self.p_pit = np.random.uniform(low, high)
+            self.p_pit = self.rng.uniform(low, high)
 
     def _reset_Tmax(self):
         if isinstance(self.__Tmax, int):
             self.Tmax = self.__Tmax
         else:
             low, high = self.__Tmax
-            self.Tmax = np.random.randint(low, high)
+            self.Tmax = self.rng.integers(low, high)
+
+    @property
+    def icons(self):
+        return load_icons()
 
-    def __load_icons(self):
+    @property
+    def pits(self):
         """
-        load icons
+        (k,2) array with the (x,y) positions of the pits
         """
-        self.icons = {}
+        return np.argwhere(self.grid & Cell.PIT)
 
-        # [stench,breeze,glitter,bump,scream]
-
-        for name, filename in [("wumpus", "monster.png"), ("gold", "gold.png"), ("pit", "pit.png"), ("agent", "robot.png"), ("north", "robot-north.png"), ("east", "robot-east.png"), ("south", "robot-south.png"), ("west", "robot-west.png"), ("stench", "stench.png"), ("breeze", "breeze.png"), ("glitter", "glitter.png"), ("bump", "bump.png"), ("scream", "scream.png")]:
-            icon = Image.open(os.path.join("icons", filename))
-            icon = icon.resize((30,30), Image.Resampling.LANCZOS)
-            self.icons[name] = icon
+    @property
+    def visited(self):
+        return set((int(x), int(y)) for x, y in np.argwhere(self.grid & Cell.VISITED))
 
     def __index_to_pos(self, index):
         """
@@ -107,6 +161,26 @@ class Wumpus:
         """
         Generate a new Wumpus world
         """
+        self.has_gold = False
+        self.terminated = False
+        self.reward = 0
+        if self.worlds is not None:
+            self.tier = self.worlds.load(self)
+        else:
+            self._generate_world()
+
+        # generate initial percept
+        self.grid[self.pos_agent] |= Cell.VISITED
+        bits = self.grid[self.pos_agent] & PERCEPT_BITS
+        self.obs = PERCEPT_TABLE[bits].copy()
+        self.t = 0
+
+        self.n_episodes += 1
+        if self.recorder is not None:
+            self.recorder.reset(self.seed, self.n_episodes - 1, int(bits))
+        return self.obs
+
+    def _generate_world(self):
         self._reset_p_pit()
         self._reset_Tmax()
 
@@ -114,24 +188,21 @@ class Wumpus:
         if self.pos_agent is None:
             # self.pos_agent = (np.random.randint(0, self.size[0] - 1), np.random.randint(0, self.size[1] - 1))
             self.pos_agent = (
-                np.random.choice([0, self.size[0] - 1]),
-                np.random.choice([0, self.size[1] - 1])
+                self.rng.choice([0, self.size[0] - 1]),
+                self.rng.choice([0, self.size[1] - 1])
             )
         self.pos_exit = self.pos_agent
-        self.orientation_agent = self.start_orientation
         if self.start_orientation is None:
-            self.orientation_agent = np.random.randint(0, 4)
+            self.orientation_agent = self.rng.integers(0, 4)
+        else:
+            self.orientation_agent = self.start_orientation
         
         self.has_arrow = True
-        self.has_gold = False
-        self.terminated = False
         self.wumpus_alive = True
-        self.reward = 0
 
         # generate pits
         pits = self.rng.random(self.size) <= self.p_pit
         pits[self.pos_exit] = False
-        self.pits = np.hstack([x.reshape((-1,1))for x in np.where(pits)])
 
         # select position for wumpus
         while True:
@@ -142,99 +213,151 @@ class Wumpus:
         if not self.with_wumpus:
             # self.pos_wumpus = None
             self.wumpus_alive = False
-            if np.random.rand() < 0.5:
+            if self.rng.random() < 0.5:
                 self.has_arrow = False
 
         # select position for gold
         idx_gold = self.rng.integers(low=0, high=np.prod(self.size))
         self.pos_gold = self.__index_to_pos(idx_gold)
 
-        # generate initial percept
-        obs = obs = np.zeros((5,), dtype=int)
-
-        stench = self.__is_stench()
-        breeze = self.__is_breeze()
-        glitter = self.__is_glitter()
-        bump = False
-        scream = False
-        
-        if stench:
-            obs[Percepts.STENCH] = True
-        if breeze:
-            obs[Percepts.BREEZE] = True
-        if glitter:
-            obs[Percepts.GLITTER] = True
-        if bump:
-            obs[Percepts.BUMP] = True
-        if scream:
-            obs[Percepts.SCREAM] = True
+        self.grid = build_grid(pits, self.pos_wumpus, self.pos_gold)
 
-        self.obs = obs
-        self.t = 0
-        
-        self.visited = set()
-        self.visited.add(self.pos_agent)
-
-        return self.obs
+    def get_state(self):
+        """
+        Snapshot of the game as a bytes buffer of `state_size` bytes
+        """
+        gold = (-1, -1) if self.pos_gold is None else self.pos_gold
+        obs_bits = int(self.obs @ PERCEPT_WEIGHTS)
+        header = self.STATE.pack(
+            *self.pos_agent, self.orientation_agent, self.has_arrow, self.has_gold,
+            self.terminated, self.wumpus_alive, *self.pos_wumpus, *gold, *self.pos_exit,
+            obs_bits, self.t, self.Tmax, self.reward, self.p_pit,
+        )
+        return header + self.grid.tobytes()
+
+    def set_state(self, state):
+        """
+        Restore a snapshot from `get_state` (the random generator is not part of it)
+        """
+        (x, y, self.orientation_agent, has_arrow, has_gold, terminated, wumpus_alive,
+         wx, wy, gx, gy, ex, ey, obs_bits, self.t, self.Tmax, self.reward, self.p_pit) = self.STATE.unpack_from(state)
+        self.pos_agent = (x, y)
+        self.has_arrow, self.has_gold = bool(has_arrow), bool(has_gold)
+        self.terminated, self.wumpus_alive = bool(terminated), bool(wumpus_alive)
+        self.pos_wumpus = (wx, wy)
+        self.pos_gold = None if gx < 0 else (gx, gy)
+        self.pos_exit = (ex, ey)
+        self.obs = PERCEPT_TABLE[obs_bits].copy()
+        self.grid = np.frombuffer(state, dtype=np.uint8, count=np.prod(self.size), offset=self.STATE.size).reshape(self.size).copy()
+
+    @property
+    def state_size(self):
+        return self.STATE.size + int(np.prod(self.size))
+
+    def snapshot(self):
+        """
+        Dynamic state of the current episode (agent, flags, t, visited
+        cells, random generator) as a few dozen bytes. Unlike `get_state`
+        it leaves out the world, so it can only be restored into the same
+        episode, which is what tree search rollouts need.
+        """
+        s = self.state
+        header = SNAPSHOT.pack(
+            s[kernel.X], s[kernel.Y], s[kernel.ORIENTATION], s[kernel.HAS_ARROW], s[kernel.HAS_GOLD],
+            s[kernel.TERMINATED], s[kernel.WUMPUS_ALIVE], s[kernel.GOLD_X], s[kernel.GOLD_Y],
+            int(self.obs @ PERCEPT_WEIGHTS), s[kernel.T],
+        )
+        visited = np.packbits(self.grid & Cell.VISITED, axis=None)
+        return header + visited.tobytes() + self.rng.pack_state()
+
+    def restore(self, snap):
+        """
+        Go back to a `snapshot` taken in the current episode
+        """
+        s = self.state
+        (s[kernel.X], s[kernel.Y], s[kernel.ORIENTATION], s[kernel.HAS_ARROW], s[kernel.HAS_GOLD],
+         s[kernel.TERMINATED], s[kernel.WUMPUS_ALIVE], s[kernel.GOLD_X], s[kernel.GOLD_Y],
+         obs_bits, s[kernel.T]) = SNAPSHOT.unpack_from(snap)
+        self.obs = PERCEPT_TABLE[obs_bits].copy()
+
+        n_cells = self.grid.size
+        n_bytes = (n_cells + 7) // 8
+        packed = np.frombuffer(snap, dtype=np.uint8, count=n_bytes, offset=SNAPSHOT.size)
+        visited = np.unpackbits(packed, count=n_cells).reshape(self.grid.shape)
+        self.grid &= ~np.uint8(Cell.VISITED | Cell.GLITTER)
+        self.grid |= visited * np.uint8(Cell.VISITED)
+        if self.pos_gold is not None:
+            self.grid[self.pos_gold] |= Cell.GLITTER
+        self.rng.unpack_state(snap, SNAPSHOT.size + n_bytes)
 
-    def __offset_for_pos(self, pos):
+    def simulate(self, actions, snap=None):
         """
-        Get the offset for drawing for a position (top left of a cell)
+        Fast rollout: restore `snap` (if given) and play `actions` until the
+        episode terminates, without building percept vectors on the way.
+        Returns (total reward, terminated, number of steps taken).
         """
-        x_offset = self.wall_width + pos[0] * (self.cell_size + self.wall_width)
-        y_offset = self.wall_width + self.size[1] * (self.wall_width + self.cell_size) - ((1 + pos[1]) * (self.cell_size + self.wall_width))
+        if snap is not None:
+            self.restore(snap)
+        total_reward = 0
+        n_steps = 0
+        bits = None
+        for action in actions:
+            if self.terminated:
+                break
+            bits, reward, terminated, info = self._transition(action)
+            total_reward += reward
+            n_steps += 1
+        if bits is not None:
+            self.obs = PERCEPT_TABLE[bits].copy()
+        return total_reward, self.terminated, n_steps
+
+    def __offset_for_pos(self, pos, origin=(0,0), size=None):
+        """
+        Get the offset for drawing for a position (top left of a cell),
+        on a board showing `size` cells from `origin` on
+        """
+        size = self.size if size is None else size
+        x_offset = self.wall_width + (pos[0] - origin[0]) * (self.cell_size + self.wall_width)
+        y_offset = self.wall_width + size[1] * (self.wall_width + self.cell_size) - ((1 + pos[1] - origin[1]) * (self.cell_size + self.wall_width))
 
         return (x_offset, y_offset)
 
-    def render(self):
+    def render(self, viewport=None):
         """
-        Render the current state of the wumpus world
+        Render the current state of the wumpus world.
+        viewport ... (width, height) in cells of a window around the agent
+            to draw instead of the whole board, for large worlds
         """
-        height = self.size[1] * (self.cell_size + self.wall_width) + self.wall_width
-        width = self.size[0] * (self.cell_size + self.wall_width) + self.wall_width
-        # img = 255*np.ones((width, height, 3), dtype=int)
-        img = Image.new(mode='RGB', size=(width, height), color = (255,255,255))
-        draw = ImageDraw.Draw(img)
-
-        # grid
-        sidx = 0
-        for i in range(self.size[0] + 1):
-            draw.rectangle((sidx, 0) + (sidx+self.wall_width,img.size[1]), fill=(0,0,0))
-            #img[sidx:sidx+self.wall_width,:,:] = 0
-            sidx += self.wall_width + self.cell_size
-        sidx = 0
-        for i in range(self.size[1] + 1):
-            draw.rectangle((0, sidx) + (img.size[0],sidx+self.wall_width), fill=(0,0,0))
-            #img[:,sidx:sidx+self.wall_width,:] = 0
-            sidx += self.wall_width + self.cell_size
-
-        # labels
-        #fnt = ImageFont.truetype("Pillow/Tests/fonts/FreeMono.ttf", 40)
-        for x in range(self.size[0]):
-            for y in range(self.size[1]):
-                x_pos = self.wall_width + 3 + x * (self.cell_size + self.wall_width)
-                y_pos = img.size[1] - self.wall_width - 3 - 10 - y * (self.cell_size + self.wall_width)
-                draw.text((x_pos, y_pos), f"({x+1},{y+1})", fill=(100, 100, 100)) # font=fnt, 
+        if viewport is None:
+            origin, size = (0,0), self.size
+        else:
+            origin, size = viewport_window(self.size, self.pos_agent, viewport)
+        height = size[1] * (self.cell_size + self.wall_width) + self.wall_width
+
+        def visible(pos):
+            return origin[0] <= pos[0] < origin[0] + size[0] and origin[1] <= pos[1] < origin[1] + size[1]
+
+        # grid and labels
+        img = board_background(size, self.cell_size, self.wall_width, origin).copy()
 
         # show wumpus
-        if self.wumpus_alive:
-            offset = self.__offset_for_pos(self.pos_wumpus)
+        if self.wumpus_alive and visible(self.pos_wumpus):
+            offset = self.__offset_for_pos(self.pos_wumpus, origin, size)
             img.paste(self.icons["wumpus"], (offset[0] + 10, offset[1] + 10), self.icons["wumpus"])
 
         # show gold
-        if self.pos_gold is not None:
-            offset = self.__offset_for_pos(self.pos_gold)
+        if self.pos_gold is not None and visible(self.pos_gold):
+            offset = self.__offset_for_pos(self.pos_gold, origin, size)
             img.paste(self.icons["gold"], (offset[0] + 10 + self.cell_size // 2, offset[1] + 10), self.icons["gold"])
 
         # show pits
-        for pit in self.pits:
-            pos_pit = pit
-            # print("  pos pit: ", pos_pit)
-            offset = self.__offset_for_pos(pos_pit)
+        window = self.grid[origin[0]:origin[0] + size[0], origin[1]:origin[1] + size[1]]
+        for pit in np.argwhere(window & Cell.PIT) + origin:
+            offset = self.__offset_for_pos(pit, origin, size)
             img.paste(self.icons["pit"], (offset[0] + 10, offset[1] + 5 + self.cell_size // 2), self.icons["pit"])
 
         # show robot
-        offset = self.__offset_for_pos(self.pos_agent)
+        offset = self.__offset_for_pos(self.pos_agent, origin, size)
         if self.orientation_agent == Orientation.NORTH:
             agent_icon = self.icons["north"]
         elif self.orientation_agent == Orientation.EAST:
@@ -246,182 +369,39 @@ class Wumpus:
         img.paste(agent_icon, (offset[0] + 10 + self.cell_size // 2, offset[1] + 5 + self.cell_size // 2), agent_icon)
 
         ## render percepts
-        obs = self.obs
-        percepts = Image.new(mode='RGB', size=(self.cell_size, height), color = (255,255,255))
-        draw = ImageDraw.Draw(percepts)
-        draw.text((10,10), "percepts", fill=(0,0,0))
-        for i, k in [(Percepts.STENCH, "stench"), (Percepts.BREEZE, "breeze"), (Percepts.GLITTER, "glitter"), (Percepts.BUMP, "bump"), (Percepts.SCREAM, "scream")]:
-            if obs[i]:
-                percepts.paste(self.icons[k], (10, 30 + i*40), self.icons[k])
-        
+        percepts = percept_panel(self.obs, self.cell_size, height)
+
         ## render status
-        status = Image.new(mode='RGB', size=(20+self.cell_size, height), color = (255,255,255))
-        draw = ImageDraw.Draw(status)
-        draw.text((10,10), f"reward={self.reward}", fill=(0,0,0))
-        draw.text((10,30), f"terminated={self.terminated}", fill=(0,0,0))
-        draw.text((10,50), f"arrow={self.has_arrow}", fill=(0,0,0))
-        draw.text((10,70), f"gold={self.has_gold}", fill=(0,0,0))
+        status = status_panel(self.reward, self.terminated, self.has_arrow, self.has_gold, self.cell_size, height)
 
         return get_concat_h(get_concat_h(img, percepts), status)
     
-    def __is_glitter(self):
-        # are we on a field with gold
-        if self.pos_agent == self.pos_gold:
-            return True
-        else:
-            return False
-        
-    def __is_stench(self):
-        # are we next to a wumpus?
-        if self.pos_wumpus is None:
-            return False
-        dx = self.pos_agent[0] - self.pos_wumpus[0]
-        dy = self.pos_agent[1] - self.pos_wumpus[1]
-        if np.abs(dx) + np.abs(dy) <= 1:
-            return True
-        else:
-            return False
-        
-    def __is_breeze(self):
-        # are we next to a pit?
-        for pos_pit in self.pits:
-            dx = self.pos_agent[0] - pos_pit[0]
-            dy = self.pos_agent[1] - pos_pit[1]
-            if np.abs(dx) + np.abs(dy) == 1:
-                return True
-        return False
-    
     def step(self, action):
-        if self.terminated:
-            raise AssertionError("Environment already terminted. Reset before taking any further actions.")
-
-        # percept variables
-        # [stench,breeze,glitter,bump,scream]
-        stench = False
-        breeze = False
-        glitter = False
-        bump = False
-        scream = False
-
-        r_gold_grab = 15
-        r_arrow_shoot = -4
-        r_escape_with_gold = 100
-        r_death = -80
-        r_new_cell_explored = 2
-
-        reward = -0.2 # any actions costs
-        if self.has_gold and self.pos_agent == self.pos_exit:
-            reward += 0.5
-        terminated = False
-        info = {}
-        if action == Actions.LEFT:
-            self.orientation_agent = (self.orientation_agent - 1) % 4
-        elif action == Actions.RIGHT:
-            self.orientation_agent = (self.orientation_agent + 1) % 4
-        elif action == Actions.FORWARD:
-            old_pos = self.pos_agent
-            dx = 0
-            dy = 0
-            if self.orientation_agent == Orientation.EAST:
-                dx = 1
-            elif self.orientation_agent == Orientation.WEST:
-                dx = -1
-            elif self.orientation_agent == Orientation.NORTH:
-                dy = 1
-            elif self.orientation_agent == Orientation.SOUTH:
-                dy = -1
-
-            new_x = max(0, min(self.size[0] - 1, self.pos_agent[0] + dx))
-            new_y = max(0, min(self.size[1] - 1, self.pos_agent[1] + dy))
-    
-            new_pos = (new_x, new_y)
-            if old_pos == new_pos:
-                bump = True
-            self.pos_agent = new_pos
-        elif action == Actions.SHOOT:
-            if self.has_arrow:
-                reward += r_arrow_shoot
-                self.has_arrow = False
-
-                # do we hit the wumpus?
-                if self.orientation_agent == Orientation.NORTH:
-                    dx = 0
-                    dy = 1
-                elif self.orientation_agent == Orientation.EAST:
-                    dx = 1
-                    dy = 0
-                elif self.orientation_agent == Orientation.SOUTH:
-                    dx = 0
-                    dy = -1
-                elif self.orientation_agent == Orientation.WEST:
-                    dx = -1
-                    dy = 0
-                for i in range(max(self.size)):
-                    pos_arrow = (self.pos_agent[0] + i*dx, self.pos_agent[1] + i*dy)
-                    if self.pos_wumpus == pos_arrow:
-                        self.wumpus_alive = False
-                        scream = True
-        elif action == Actions.GRAB:
-            if self.pos_agent == self.pos_gold:
-                self.has_gold = True
-                self.pos_gold = None
-                reward += r_gold_grab
-        elif action == Actions.CLIMB:
-            if self.pos_agent == self.pos_exit: 
-                terminated = True
-                if self.has_gold:
-                    reward += r_escape_with_gold
-
-        # compile percepts, check for death
-        if self.wumpus_alive and (self.pos_agent == self.pos_wumpus):
-            reward += r_death
-            terminated = True
-        for pos_pit in self.pits:
-            pos_pit = (pos_pit[0], pos_pit[1])
-            if self.pos_agent == pos_pit:
-                reward += r_death
-                terminated = True
-
-        if self.pos_gold == self.pos_agent:
-            glitter = True
-
-        # compile observation vector
-        #   [stench,breeze,glitter,bump,scream]
-        obs = np.zeros((5,), dtype=int)
-        stench = self.__is_stench()
-        breeze = self.__is_breeze()
-        glitter = self.__is_glitter()
-        if stench:
-            obs[Percepts.STENCH] = True
-        if breeze:
-            obs[Percepts.BREEZE] = True
-        if glitter:
-            obs[Percepts.GLITTER] = True
-        if bump:
-            obs[Percepts.BUMP] = True
-        if scream:
-            obs[Percepts.SCREAM] = True
-
+        bits, reward, terminated, info = self._transition(action)
+        obs = PERCEPT_TABLE[bits].copy()
         self.obs = obs
-
-        num_visited = len(self.visited)
-        self.visited.add(self.pos_agent)
-        if len(self.visited) > num_visited and not self.has_gold: 
-            reward += r_new_cell_explored
-
-        self.t += 1
-        if not terminated:
-            if self.t >= (self.Tmax - 1):
-                reward += r_death
-                # if self.has_gold:
-                #     reward -= r_gold_grab
-                terminated = True
-                info = "Max steps reached."
-
-        self.terminated = terminated
         self.reward = reward
+        if self.recorder is not None:
+            self.recorder.step(action, bits, reward, self.state[kernel.TERMINATED])
+        if terminated and self.worlds is not None:
+            # climbing with the gold is the only way to end an episode alive
+            escaped = action == Actions.CLIMB and self.state[kernel.TERMINATED] == kernel.DONE
+            self.worlds.report(self.tier, escaped and bool(self.state[kernel.HAS_GOLD]))
         return obs, reward, terminated, info
 
+    def _transition(self, action):
+        """
+        Apply an action to the game state and return the percept bits
+        instead of the percept vector, leaving the render state alone
+        """
+        state = self.state
+        if state[kernel.TERMINATED]:
+            raise AssertionError("Environment already terminted. Reset before taking any further actions.")
+
+        _, bits, reward, terminated = kernel.transition(state, self.grid, action, self.REWARDS)
+        info = "Max steps reached." if state[kernel.TERMINATED] == kernel.TIMEOUT else {}
+        return bits, reward, terminated, info
+
 
 
 